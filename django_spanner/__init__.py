@@ -8,6 +8,8 @@ import datetime
 import os
 import django
 
+from .transaction import batch_dml, mutation_session  # noqa: F401
+
 # Monkey-patch AutoField to generate a random value since Cloud Spanner can't
 # do that.
 from uuid import uuid4
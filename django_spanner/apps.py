@@ -0,0 +1,36 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import logging
+
+from django.apps import AppConfig
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class DjangoSpannerConfig(AppConfig):
+    name = "django_spanner"
+    verbose_name = "Cloud Spanner"
+
+    def ready(self):
+        """Warm up the session pools of the databases that ask for it."""
+        for alias in connections:
+            connection = connections[alias]
+            if connection.vendor != "spanner":
+                continue
+            if not connection.settings_dict["OPTIONS"].get("warm_up"):
+                continue
+            try:
+                connection.warm_up()
+            except Exception:
+                # The pool fills itself on demand, so a failed warm-up must
+                # not prevent the application from starting.
+                logger.warning(
+                    "Warming up the session pool of database %r failed.",
+                    alias,
+                    exc_info=True,
+                )
@@ -5,20 +5,105 @@
 # https://developers.google.com/open-source/licenses/bsd
 
 import os
+import time
+from contextlib import contextmanager
 
-from google.cloud import spanner
-
+from django.core.exceptions import ImproperlyConfigured
 from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.utils import DatabaseError, NotSupportedError
 from google.cloud import spanner_dbapi
+from google.cloud.spanner_dbapi.parse_utils import classify_statement
+from google.cloud.spanner_dbapi.parsed_statement import StatementType
 
+from ._opentelemetry_tracing import trace_call
 from .client import DatabaseClient
+from .connection import Connection
 from .creation import DatabaseCreation
 from .features import DatabaseFeatures
 from .introspection import DatabaseIntrospection
+from .mutations import BatchSizer, is_size_error
 from .operations import DatabaseOperations
+from .pool import POOL_OPTIONS
+from .registry import CLIENT_OPTIONS, DATABASE_OPTIONS, registry
 from .schema import DatabaseSchemaEditor
+from .transaction import DmlBatch
+from .utils import parse_staleness
 from django_spanner import USING_DJANGO_3
 
+# OPTIONS keys which are handled by the backend itself and aren't passed to
+# the DB API connection.
+BACKEND_OPTIONS = (
+    "warm_up",
+    "health_check_ttl",
+    "staleness",
+    "bulk_mutations",
+    "bulk_target_latency",
+    "backfill_parallelism",
+    "async_ddl",
+)
+
+
+class CursorWrapper(object):
+    """Wrap a DB API cursor to record when the connection last worked.
+
+    Statements which ran without an error prove that the connection is
+    usable, so :meth:`DatabaseWrapper.is_usable` doesn't have to send a
+    probe of its own for a while after them.
+
+    :type cursor: :class:`~google.cloud.spanner_dbapi.cursor.Cursor`
+    :param cursor: The wrapped cursor.
+
+    :type db: :class:`DatabaseWrapper`
+    :param db: The database wrapper owning the cursor.
+    """
+
+    def __init__(self, cursor, db):
+        self.cursor = cursor
+        self.db = db
+        # Whether the last statement was buffered in a DML batch.
+        self._batched = False
+
+    @property
+    def rowcount(self):
+        """The row count of the last statement, -1 if it was buffered."""
+        if self._batched:
+            return -1
+        return self.cursor.rowcount
+
+    def execute(self, sql, args=None):
+        self.db._end_snapshot_before_write(sql)
+        self._batched = False
+        batch = self.db.dml_batch
+        if batch is not None:
+            if batch.accepts(sql):
+                batch.add(sql, args)
+                self._batched = True
+                return
+            self.db.flush_dml_batch()
+        if self.db.in_ddl_batch:
+            if classify_statement(sql).statement_type == StatementType.DDL:
+                self.cursor.queue_ddl(sql)
+                return
+            # The DB API doesn't run the queued DDL before queries in
+            # autocommit mode.
+            self.db.flush_ddl_batch()
+        with self.db._record_rpc():
+            return self.cursor.execute(sql, args)
+
+    def executemany(self, operation, seq_of_params):
+        self.db._end_snapshot_before_write(operation)
+        self._batched = False
+        self.db.flush_dml_batch()
+        self.db.flush_ddl_batch()
+        with self.db._record_rpc():
+            return self.cursor.executemany(operation, seq_of_params)
+
+    def __getattr__(self, attr):
+        return getattr(self.cursor, attr)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
 
 class DatabaseWrapper(BaseDatabaseWrapper):
     vendor = "spanner"
@@ -113,18 +198,74 @@ class DatabaseWrapper(BaseDatabaseWrapper):
     ops_class = DatabaseOperations
     client_class = DatabaseClient
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Monotonic time of the last statement which ran without an error.
+        self._last_rpc_success = None
+        # Whether the reads run in a read-only snapshot, see
+        # start_read_only_snapshot().
+        self.in_read_only_snapshot = False
+        # The DML statements waiting to be sent together, see
+        # start_dml_batch().
+        self.dml_batch = None
+        # Whether saves and deletes are buffered as mutations, see
+        # django_spanner.transaction.mutation_session.
+        self.in_mutation_session = False
+        # Whether DDL statements are queued to run together, see
+        # start_ddl_batch().
+        self.in_ddl_batch = False
+        self.health_check_stats = {
+            "probes": 0,
+            "failures": 0,
+            "skipped": 0,
+            "last_probe_ok": None,
+            "last_probe_latency": None,
+        }
+        # The sizes of bulk writes sent as mutations, and of the ones
+        # inserting rows with DML statements.
+        self.bulk_batch_sizer = BatchSizer(
+            self.settings_dict["OPTIONS"].get("bulk_target_latency")
+        )
+        self.bulk_dml_sizer = BatchSizer(
+            self.settings_dict["OPTIONS"].get("bulk_target_latency")
+        )
+
+    @property
+    def bulk_batch_sizes(self):
+        """The sizes of the batches of bulk writes chosen for each table.
+
+        See :meth:`~django_spanner.mutations.BatchSizer.stats`.
+
+        :rtype: dict
+        :returns: The batch size and the latest writes by table.
+        """
+        return self.bulk_batch_sizer.stats()
+
+    @property
+    def bulk_dml_batch_sizes(self):
+        """The numbers of rows inserted by DML statements for each table.
+
+        See :meth:`~django_spanner.mutations.BatchSizer.stats`.
+
+        :rtype: dict
+        :returns: The batch size and the latest inserts by table.
+        """
+        return self.bulk_dml_sizer.stats()
+
     @property
     def instance(self):
         """Reference to a Cloud Spanner Instance containing the Database.
 
         :rtype: :class:`~google.cloud.spanner_v1.instance.Instance`
-        :returns: A new instance owned by the existing Spanner Client.
+        :returns: The instance shared by all connections of the process.
         """
-        if "client" in self.settings_dict["OPTIONS"]:
-            client = self.settings_dict["OPTIONS"]["client"]
-        else:
-            client = spanner.Client(project=os.environ["GOOGLE_CLOUD_PROJECT"])
-        return client.instance(self.settings_dict["INSTANCE"])
+        params = self.get_connection_params()
+        client_kwargs = {
+            key: params[key] for key in CLIENT_OPTIONS if key in params
+        }
+        return registry.get_instance(
+            params["project"], params["instance_id"], **client_kwargs
+        )
 
     @property
     def allow_transactions_in_auto_commit(self):
@@ -156,6 +297,92 @@ class DatabaseWrapper(BaseDatabaseWrapper):
             **self.settings_dict["OPTIONS"],
         }
 
+    @property
+    def commit_timestamp(self):
+        """Commit timestamp of the latest read-write transaction.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: The timestamp, or None if nothing has been committed by
+                  the current connection.
+        """
+        if self.connection is None:
+            return None
+        return self.connection.commit_timestamp
+
+    @property
+    def pool_stats(self):
+        """Health of the session pool used by this database.
+
+        :rtype: dict
+        :returns: The number of sessions in use and idle, and the number of
+                  sessions created and expired, or None if the pool given
+                  in OPTIONS doesn't keep stats.
+        """
+        database, _ = self._get_database(self.get_connection_params())
+        stats = getattr(database._pool, "stats", None)
+        return stats() if stats is not None else None
+
+    def warm_up(self):
+        """Create the sessions of the pool before they are needed.
+
+        Called on startup for the databases with ``"warm_up": True`` in
+        their OPTIONS, so that the first requests don't pay for session and
+        channel creation.
+        """
+        database, _ = self._get_database(self.get_connection_params())
+        warm_up = getattr(database._pool, "warm_up", None)
+        if warm_up is not None:
+            warm_up()
+
+    def _get_database(self, conn_params):
+        """Take the Database of this alias for the given connection parameters.
+
+        The aliases pointing at the same Spanner database share its channel
+        and session pool, see :class:`~django_spanner.registry.Registry`.
+
+        :type conn_params: dict
+        :param conn_params: The parameters returned by
+                            :meth:`get_connection_params`.
+
+        :rtype: tuple
+        :returns: The Database and the remaining parameters, which are the
+                  connection variables of the DB API connection.
+
+        :raises: :class:`~django.core.exceptions.ImproperlyConfigured` if a
+                 pool is given together with pool options.
+        """
+        conn_params = dict(conn_params)
+        project = conn_params.pop("project")
+        instance_id = conn_params.pop("instance_id")
+        database_id = conn_params.pop("database_id")
+        database_kwargs = {
+            key: conn_params.pop(key)
+            for key in CLIENT_OPTIONS + DATABASE_OPTIONS
+            if key in conn_params
+        }
+        pool_options = {
+            key: conn_params.pop(key)
+            for key in POOL_OPTIONS
+            if key in conn_params
+        }
+        if pool_options:
+            if "pool" in database_kwargs:
+                raise ImproperlyConfigured(
+                    "The 'pool' option can't be combined with: %s."
+                    % ", ".join(sorted(pool_options))
+                )
+            database_kwargs["pool_options"] = pool_options
+        for key in BACKEND_OPTIONS:
+            conn_params.pop(key, None)
+        database = registry.get_database(
+            project,
+            instance_id,
+            database_id,
+            alias=self.alias,
+            **database_kwargs
+        )
+        return database, conn_params
+
     def get_new_connection(self, conn_params):
         """Create a new connection with corresponding connection parameters.
 
@@ -163,22 +390,315 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         :param conn_params: A List of the connection parameters for
                             :class:`~google.cloud.spanner_dbapi.connection.Connection`
 
-        :rtype: :class:`google.cloud.spanner_dbapi.connection.Connection`
+        :rtype: :class:`~django_spanner.connection.Connection`
         :returns: A new Spanner DB API Connection object associated with the
                   given Google Cloud Spanner resource.
 
-        :raises: :class:`ValueError` in case the given instance/database
-                 doesn't exist.
+        :raises: :class:`ValueError` in case the given client belongs to a
+                 different project.
+
+        :raises: :class:`~django.core.exceptions.ImproperlyConfigured` if the
+                 ``staleness`` option isn't valid.
+        """
+        staleness = conn_params.get("staleness")
+        if staleness is not None:
+            try:
+                staleness = parse_staleness(staleness)
+            except ValueError as exc:
+                raise ImproperlyConfigured(
+                    "Invalid 'staleness' option of database %r: %s"
+                    % (self.alias, exc)
+                )
+        async_ddl = bool(conn_params.get("async_ddl"))
+        database, conn_params = self._get_database(conn_params)
+        connection = Connection(database._instance, database, **conn_params)
+        # Autocommit reads use single-use read-only snapshots with this
+        # timestamp bound (strong by default).
+        connection.staleness = staleness
+        connection.async_ddl = async_ddl
+        # The Database and its session pool are shared with the other
+        # connections of the process, so closing this connection must not
+        # clear the pool.
+        connection._own_pool = False
+        return connection
+
+    @contextmanager
+    def read_staleness(self, staleness):
+        """Use another timestamp bound for the reads in autocommit mode.
+
+        Transactions always read the latest data, and read-only snapshots
+        read at the timestamp of their first read, so the staleness is
+        ignored inside them.
+
+        :type staleness: dict
+        :param staleness: The staleness in the format of the ``staleness``
+                          option, see :func:`~django_spanner.utils.parse_staleness`.
+        """
+        self.ensure_connection()
+        if not self.get_autocommit() or self.in_read_only_snapshot:
+            yield
+            return
+
+        previous = self.connection.staleness or None
+        self.connection.staleness = parse_staleness(staleness)
+        try:
+            yield
+        finally:
+            self.connection.staleness = previous
+
+    def execute_partitioned_dml(self, sql, params=None):
+        """Run a DML statement as Partitioned DML.
+
+        Spanner runs the statement in parallel on the splits of the table,
+        in transactions of its own, so it isn't limited by the mutations of
+        a commit. It isn't atomic, and may be applied more than once to a
+        row.
+
+        :type sql: str
+        :param sql: The statement, with ``%s`` placeholders.
+
+        :type params: list
+        :param params: (Optional) The parameters of the statement.
+
+        :rtype: int
+        :returns: A lower bound of the number of rows written.
+
+        :raises: :class:`~django.db.utils.NotSupportedError` in a
+                 transaction or a DML batch.
+        """
+        self.ensure_connection()
+        if not self.get_autocommit() or self.dml_batch is not None:
+            raise NotSupportedError(
+                "Partitioned DML can't run in a transaction or a DML batch."
+            )
+        self.check_writable()
+        self.end_read_only_snapshot()
+        statement = classify_statement(sql, params).statement
+        with self.wrap_database_errors, self._record_rpc():
+            self.connection.run_prior_DDL_statements()
+            return self.connection.database.execute_partitioned_dml(
+                statement.sql,
+                params=statement.params,
+                param_types=statement.param_types,
+            )
+
+    @contextmanager
+    def _record_rpc(self):
+        """Remember when a statement last ran without an error."""
+        try:
+            yield
+        except Exception:
+            self._last_rpc_success = None
+            raise
+        self._last_rpc_success = time.monotonic()
+
+    def start_read_only_snapshot(self):
+        """Run the following reads in one read-only transaction.
+
+        All reads see the data at the timestamp of the first one, and don't
+        need a transaction each. The snapshot ends before the first write
+        or transaction, after which the connection works as usual.
+
+        :rtype: bool
+        :returns: True if a snapshot was started, False if the connection
+                  is already in a transaction or a snapshot.
+        """
+        self.ensure_connection()
+        if (
+            self.in_read_only_snapshot
+            or not self.get_autocommit()
+            or self.connection._client_transaction_started
+        ):
+            return False
+        with self.wrap_database_errors:
+            self.connection.read_only = True
+            self.connection.begin()
+        self.in_read_only_snapshot = True
+        return True
+
+    def end_read_only_snapshot(self):
+        """End the read-only snapshot started by start_read_only_snapshot()."""
+        if not self.in_read_only_snapshot:
+            return
+        self.in_read_only_snapshot = False
+        if self.connection is None or self.connection.is_closed:
+            return
+        with self.wrap_database_errors:
+            # Ending a read-only transaction doesn't send any request.
+            self.connection.commit()
+            self.connection.read_only = self.settings_dict["OPTIONS"].get(
+                "read_only", False
+            )
+
+    def _end_snapshot_before_write(self, sql):
+        if (
+            self.in_read_only_snapshot
+            and classify_statement(sql).statement_type != StatementType.QUERY
+        ):
+            self.end_read_only_snapshot()
+
+    def start_dml_batch(self):
+        """Buffer the following DML statements to send them together.
+
+        See :class:`~django_spanner.transaction.batch_dml`.
+
+        :rtype: bool
+        :returns: True if a batch was started, False if one is active.
+        """
+        if self.dml_batch is not None:
+            return False
+        self.ensure_connection()
+        self.dml_batch = DmlBatch(self)
+        return True
+
+    def flush_dml_batch(self):
+        """Send the DML statements buffered by the active batch.
+
+        :rtype: list
+        :returns: The row count of each statement sent.
+        """
+        if self.dml_batch is None or not self.dml_batch.statements:
+            return []
+        with self.wrap_database_errors, self._record_rpc():
+            return self.dml_batch.flush()
+
+    def end_dml_batch(self, flush=True):
+        """End the batch started by start_dml_batch().
+
+        :type flush: bool
+        :param flush: (Optional) Whether to send the pending statements,
+                      which are discarded otherwise.
+        """
+        try:
+            if flush:
+                self.flush_dml_batch()
+        finally:
+            if self.dml_batch is not None:
+                self.dml_batch.discard()
+            self.dml_batch = None
+
+    def start_ddl_batch(self):
+        """Queue the following DDL statements to run them together.
+
+        Every DDL operation waits for the schema change to be applied, so
+        the queued statements are sent in one operation: before the next
+        statement of another kind, e.g. a query or a backfill, or when the
+        batch is flushed or ended. An error of a queued statement is raised
+        by the statement or the call running the batch.
+
+        :rtype: bool
+        :returns: True if a batch was started, False if one is active.
+        """
+        if self.in_ddl_batch:
+            return False
+        self.in_ddl_batch = True
+        return True
+
+    def flush_ddl_batch(self):
+        """Run the DDL statements queued by the active batch.
+
+        :rtype: int
+        :returns: The number of statements run.
+        """
+        if self.connection is None:
+            return 0
+        statements = self.connection.pending_ddl_statements
+        if statements:
+            with self.wrap_database_errors, self._record_rpc():
+                self.connection.run_prior_DDL_statements()
+        return statements
+
+    def end_ddl_batch(self, flush=True):
+        """End the batch started by start_ddl_batch().
+
+        :type flush: bool
+        :param flush: (Optional) Whether to run the queued statements,
+                      which are discarded otherwise.
+        """
+        try:
+            if flush:
+                self.flush_ddl_batch()
+        finally:
+            self.in_ddl_batch = False
+            if not flush and self.connection is not None:
+                self.connection.discard_ddl_statements()
+
+    def check_writable(self):
+        """Reject writes to a database with the ``read_only`` option.
+
+        Read-only databases run all statements in read-only transactions,
+        so a write would only fail on the server.
+
+        :raises: :class:`~django.db.utils.DatabaseError` if the database is
+                 read-only.
+        """
+        if self.settings_dict["OPTIONS"].get("read_only"):
+            raise DatabaseError(
+                "Database %r is read-only, writes must use another database."
+                % self.alias
+            )
+
+    def can_buffer_mutations(self):
+        """Whether writes may be sent as mutations with the commit.
+
+        That is the case in an outermost ``atomic()`` block, as the ones of
+        ``bulk_create()`` in autocommit mode, which does nothing after the
+        writes. Mutations aren't visible to later statements of the
+        transaction, so writes nested in other blocks use DML. The
+        ``bulk_mutations`` option set to False always uses DML. In a
+        mutation session all writes which can be mutations are.
+
+        :rtype: bool
+        :returns: True if the writes can be buffered as mutations.
         """
-        return self.Database.connect(**conn_params)
+        if (
+            self.connection is None
+            or not self.connection._client_transaction_started
+        ):
+            return False
+        if self.in_mutation_session:
+            return True
+        return (
+            self.settings_dict["OPTIONS"].get("bulk_mutations", True)
+            and self.in_atomic_block
+            and not self.savepoint_ids
+        )
+
+    def _commit(self):
+        """Commit, adapting the batch sizes to how the mutations went."""
+        self.flush_dml_batch()
+        rows = {}
+        if self.connection is not None:
+            for _, table, _, values in self.connection._pending_mutations:
+                rows[table] = rows.get(table, 0) + len(values)
+        if not rows:
+            return super()._commit()
+        start = time.monotonic()
+        try:
+            result = super()._commit()
+        except Exception as exc:
+            if is_size_error(exc):
+                for table, count in rows.items():
+                    self.bulk_batch_sizer.record_error(table, count)
+            raise
+        seconds = time.monotonic() - start
+        for table, count in rows.items():
+            self.bulk_batch_sizer.record(table, count, seconds)
+        return result
+
+    def _rollback(self):
+        """Roll back, dropping the DML statements not sent yet."""
+        if self.dml_batch is not None:
+            self.dml_batch.discard()
+        return super()._rollback()
 
     def init_connection_state(self):
-        """Initialize the state of the existing connection."""
-        autocommit = self.connection.autocommit
-        self.connection.close()
-        database = self.connection.database
-        self.connection.__init__(self.instance, database)
-        self.connection.autocommit = autocommit
+        """Initialize the state of the existing connection.
+
+        The connection is created with the shared Instance and Database, so
+        there is nothing to rebuild here.
+        """
+        self.in_read_only_snapshot = False
 
     def create_cursor(self, name=None):
         """Create a new Database cursor.
@@ -186,10 +706,10 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         :type name: str
         :param name: Currently not used.
 
-        :rtype: :class:`~google.cloud.spanner_dbapi.cursor.Cursor`
+        :rtype: :class:`CursorWrapper`
         :returns: The Cursor for this connection.
         """
-        return self.connection.cursor()
+        return CursorWrapper(self.connection.cursor(), self)
 
     def _set_autocommit(self, autocommit):
         """Set the Spanner transaction autocommit flag.
@@ -197,34 +717,69 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         :type autocommit: bool
         :param autocommit: The new value of the autocommit flag.
         """
+        self.end_read_only_snapshot()
+        self.flush_dml_batch()
         with self.wrap_database_errors:
             self.connection.autocommit = autocommit
 
     def is_usable(self):
         """Check whether the connection is valid.
 
+        A statement which ran without an error within the last
+        ``health_check_ttl`` seconds (an ``OPTIONS`` key, 0 by default)
+        proves that the connection is usable. Otherwise ``SELECT 1`` is sent
+        as a probe, and its result and latency are recorded in
+        :attr:`health_check_stats`.
+
         :rtype: bool
         :returns: True if the connection is open, otherwise False.
         """
         if self.connection is None or self.connection.is_closed:
             return False
 
-        try:
-            # Use a cursor directly, bypassing Django's utilities.
-            self.connection.cursor().execute("SELECT 1")
-        except self.Database.Error:
-            return False
+        ttl = self.settings_dict["OPTIONS"].get("health_check_ttl", 0)
+        if (
+            ttl
+            and self._last_rpc_success is not None
+            and time.monotonic() - self._last_rpc_success < ttl
+        ):
+            self.health_check_stats["skipped"] += 1
+            return True
 
-        return True
+        stats = self.health_check_stats
+        stats["probes"] += 1
+        start = time.monotonic()
+        with trace_call("CloudSpannerDjango.health_check", self) as span:
+            try:
+                # Use a cursor directly, bypassing Django's utilities.
+                self.connection.cursor().execute("SELECT 1")
+            except self.Database.Error:
+                usable = False
+            else:
+                usable = True
+            stats["last_probe_latency"] = time.monotonic() - start
+            stats["last_probe_ok"] = usable
+            if span is not None:
+                span.set_attribute("db.health_check.usable", usable)
+
+        if usable:
+            self._last_rpc_success = time.monotonic()
+        else:
+            stats["failures"] += 1
+            self._last_rpc_success = None
+        return usable
 
     def _start_transaction_under_autocommit(self):
         """
         Start a transaction explicitly in autocommit mode.
+
+        The transaction is only marked as started; it begins on the server
+        together with its first statement.
         """
+        self.end_read_only_snapshot()
         if self.allow_transactions_in_auto_commit:
-            self.connection.cursor().execute("BEGIN")
-        else:
-            # This won't start a transaction and was a bug in Spanner Django 3.2 version.
-            # Set ALLOW_TRANSACTIONS_IN_AUTO_COMMIT = True in your settings.py file to enable
-            # transactions in autocommit mode for Django 3.2.
-            self.connection.cursor().execute("SELECT 1")
+            self.connection.begin()
+        # Otherwise no transaction is started, which was a bug in Spanner
+        # Django 3.2 version. Set ALLOW_TRANSACTIONS_IN_AUTO_COMMIT = True in
+        # your settings.py file to enable transactions in autocommit mode for
+        # Django 3.2.
@@ -4,7 +4,17 @@
 # license that can be found in the LICENSE file or at
 # https://developers.google.com/open-source/licenses/bsd
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import F, Q, Subquery
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import Col
+from django.db.models.lookups import Exact, In
+from django.db.models.sql.constants import CURSOR, MULTI
+from django.db.models.sql.query import Query
 from django.db.models.sql.compiler import (
     SQLAggregateCompiler as BaseSQLAggregateCompiler,
     SQLCompiler as BaseSQLCompiler,
@@ -12,8 +22,17 @@ from django.db.models.sql.compiler import (
     SQLInsertCompiler as BaseSQLInsertCompiler,
     SQLUpdateCompiler as BaseSQLUpdateCompiler,
 )
-from django.db.utils import DatabaseError
+from django.db.utils import DatabaseError, NotSupportedError
 from django_spanner import USING_DJANGO_3
+from django_spanner.mutations import is_size_error
+
+if USING_DJANGO_3:
+    MUTATION_METHODS = {None: "insert"}
+else:
+    from django.db.models.constants import OnConflict
+
+    # The mutations inserting rows, by what to do with existing rows.
+    MUTATION_METHODS = {None: "insert", OnConflict.UPDATE: "insert_or_update"}
 
 
 class SQLCompiler(BaseSQLCompiler):
@@ -22,6 +41,35 @@ class SQLCompiler(BaseSQLCompiler):
     functionality.
     """
 
+    # Whether the statements of this compiler modify data. Writes are
+    # rejected by read-only databases, reads may use the staleness set by
+    # SpannerQuerySet.stale().
+    writes = False
+
+    def execute_sql(self, *args, **kwargs):
+        """Run the query, as a stale read if the QuerySet asked for it.
+
+        See :meth:`django_spanner.managers.SpannerQuerySet.stale`.
+
+        :raises: :class:`~django.db.utils.DatabaseError` for a write to a
+                 read-only database.
+        """
+        if self.writes:
+            self.check_writable()
+            return super().execute_sql(*args, **kwargs)
+        staleness = getattr(self.query, "spanner_staleness", None)
+        if staleness is None:
+            return super().execute_sql(*args, **kwargs)
+        with self.connection.read_staleness(staleness):
+            return super().execute_sql(*args, **kwargs)
+
+    def check_writable(self):
+        """Reject writes to a database with the ``read_only`` option.
+
+        See :meth:`django_spanner.base.DatabaseWrapper.check_writable`.
+        """
+        self.connection.check_writable()
+
     def get_combinator_sql(self, combinator, all):
         """Override the native Django method.
 
@@ -220,19 +268,596 @@ class SQLCompiler(BaseSQLCompiler):
 class SQLInsertCompiler(BaseSQLInsertCompiler, SQLCompiler):
     """A wrapper class for compatibility with Django specifications."""
 
-    pass
+    writes = True
+
+    def execute_sql(self, returning_fields=None):
+        """Insert the rows, as mutations if possible.
+
+        Rows are inserted with mutations sent with the commit when no
+        values have to be returned and the connection can buffer them, see
+        :meth:`~django_spanner.base.DatabaseWrapper.can_buffer_mutations`.
+
+        :raises: :class:`~django.db.utils.DatabaseError` for a write to a
+                 read-only database.
+        """
+        self.check_writable()
+        on_conflict = getattr(self.query, "on_conflict", None)
+        if (
+            not returning_fields
+            # Insert mutations fail for existing rows, and Django 3.2 has no
+            # on_conflict for ignore_conflicts.
+            and not self._ignores_conflicts()
+            and on_conflict in MUTATION_METHODS
+            # A single row may be a save() in the outermost atomic() block,
+            # which is only buffered in a mutation session.
+            and (
+                len(self.query.objs) > 1
+                or on_conflict is not None
+                or self.connection.in_mutation_session
+            )
+            and self.connection.can_buffer_mutations()
+        ):
+            mutation = self.as_mutation()
+            if mutation is not None:
+                self.connection.connection.buffer_mutation(
+                    MUTATION_METHODS[on_conflict], *mutation
+                )
+                return []
+        objs = self.query.objs
+        if len(objs) < 2:
+            return super().execute_sql(returning_fields)
+        # The batches of bulk_create() are sized for mutations when the
+        # connection can buffer them, so the rows inserted by DML are split
+        # again to fit the query parameters of a statement.
+        size = self.connection.ops.rows_per_statement(
+            self.query.model, [field.column for field in self.query.fields]
+        )
+        rows = []
+        try:
+            for start in range(0, len(objs), size):
+                self.query.objs = objs[start : start + size]
+                rows.extend(self._insert_rows(returning_fields))
+        finally:
+            self.query.objs = objs
+        return rows
+
+    def _insert_rows(self, returning_fields):
+        """Insert the rows of the query with DML, recording how it went."""
+        table = self.query.get_meta().db_table
+        sizer = self.connection.bulk_dml_sizer
+        start = time.monotonic()
+        try:
+            result = super().execute_sql(returning_fields)
+        except Exception as exc:
+            if is_size_error(exc):
+                sizer.record_error(table, len(self.query.objs))
+            raise
+        sizer.record(table, len(self.query.objs), time.monotonic() - start)
+        return result
+
+    def as_sql(self):
+        """Create the INSERT statements.
+
+        ``INSERT OR IGNORE`` only skips rows whose primary key exists. Rows
+        conflicting with another unique constraint, like the rows of a
+        many-to-many relation added twice, are filtered out by the
+        statement itself instead, so no query has to find them first.
+
+        :rtype: list
+        :returns: The SQL statements and their parameters.
+        """
+        if not self._ignores_conflicts():
+            return super().as_sql()
+        unique_columns = self._unique_columns()
+        if not unique_columns:
+            return super().as_sql()
+
+        qn = self.connection.ops.quote_name
+        opts = self.query.get_meta()
+        table = qn(opts.db_table)
+        fields = self.query.fields
+        columns = [qn(field.column) for field in fields]
+        value_rows = [
+            [
+                self.prepare_value(field, self.pre_save_val(field, obj))
+                for field in fields
+            ]
+            for obj in self.query.objs
+        ]
+        placeholder_rows, param_rows = self.assemble_as_sql(fields, value_rows)
+        rows = [
+            "SELECT "
+            + ", ".join(
+                "%s AS %s" % (placeholder, column)
+                for placeholder, column in zip(placeholder_rows[0], columns)
+            )
+        ]
+        rows.extend(
+            "SELECT " + ", ".join(placeholders)
+            for placeholders in placeholder_rows[1:]
+        )
+        conditions = [
+            "NOT EXISTS (SELECT 1 FROM %s WHERE %s)"
+            % (
+                table,
+                " AND ".join(
+                    "%s.%s = v.%s" % (table, qn(column), qn(column))
+                    for column in unique
+                ),
+            )
+            for unique in unique_columns
+        ]
+        sql = "%s %s (%s) SELECT %s FROM (%s) AS v WHERE %s" % (
+            self.connection.ops.insert_statement(
+                **self._insert_statement_kwargs()
+            ),
+            table,
+            ", ".join(columns),
+            ", ".join("v.%s" % column for column in columns),
+            " UNION ALL ".join(rows),
+            " AND ".join(conditions),
+        )
+        return [(sql, [param for params in param_rows for param in params])]
+
+    def _ignores_conflicts(self):
+        if USING_DJANGO_3:
+            return self.query.ignore_conflicts
+        return self.query.on_conflict == OnConflict.IGNORE
+
+    def _insert_statement_kwargs(self):
+        if USING_DJANGO_3:
+            return {"ignore_conflicts": self.query.ignore_conflicts}
+        return {"on_conflict": self.query.on_conflict}
+
+    def _unique_columns(self):
+        """The inserted columns of unique constraints besides the primary key.
+
+        :rtype: list
+        :returns: The column names of each constraint.
+        """
+        opts = self.query.get_meta()
+        inserted = {field.name: field.column for field in self.query.fields}
+        uniques = [
+            (field.name,)
+            for field in opts.local_concrete_fields
+            if field.unique and not field.primary_key
+        ]
+        uniques.extend(opts.unique_together)
+        uniques.extend(
+            constraint.fields for constraint in opts.total_unique_constraints
+        )
+        return [
+            [inserted[name] for name in unique]
+            for unique in uniques
+            if unique and all(name in inserted for name in unique)
+        ]
+
+    def as_mutation(self):
+        """The rows to insert, as the arguments of an insert mutation.
+
+        :rtype: tuple
+        :returns: The table, the columns and the values of the rows, or None
+                  if a value is an expression, which only DML can evaluate.
+        """
+        fields = self.query.fields
+        if not fields:
+            return None
+        if getattr(self.query, "on_conflict", None) is not None:
+            self.connection.ops.on_conflict_suffix_sql(
+                fields,
+                self.query.on_conflict,
+                (field.column for field in self.query.update_fields),
+                (field.column for field in self.query.unique_fields),
+            )
+        rows = []
+        for obj in self.query.objs:
+            row = [
+                self.prepare_value(field, self.pre_save_val(field, obj))
+                for field in fields
+            ]
+            if any(hasattr(value, "as_sql") for value in row):
+                return None
+            rows.append(row)
+        columns = [field.column for field in fields]
+        return self.query.get_meta().db_table, columns, rows
+
+
+class RowCountCursor(object):
+    """The cursor of writes which don't run as one statement.
+
+    :type rowcount: int
+    :param rowcount: The number of rows written.
+    """
+
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _pk_lookup(query):
+    """The lookup of a query filtering only on the primary key, or None."""
+    where = query.where
+    if where.negated or len(where.children) != 1:
+        return None
+    lookup = where.children[0]
+    if not getattr(getattr(lookup.lhs, "target", None), "primary_key", False):
+        return None
+    return lookup
+
+
+def _has_subquery(node):
+    """Whether a filter or an expression contains a subquery."""
+    if isinstance(node, (Query, Subquery)):
+        return True
+    parts = list(getattr(node, "children", ()))
+    parts.append(getattr(node, "lhs", None))
+    parts.append(getattr(node, "rhs", None))
+    if hasattr(node, "get_source_expressions"):
+        parts.extend(node.get_source_expressions())
+    return any(_has_subquery(part) for part in parts if part is not None)
+
+
+def _field_references(expression):
+    """The names of the fields an expression refers to."""
+    if isinstance(expression, F):
+        return {expression.name.split(LOOKUP_SEP)[0]}
+    if isinstance(expression, Col):
+        return {expression.target.name, expression.target.attname}
+    names = set()
+    if hasattr(expression, "get_source_expressions"):
+        for part in expression.get_source_expressions():
+            if part is not None:
+                names |= _field_references(part)
+    return names
+
+
+class PartitionedWriteMixin(object):
+    """Run an update or a delete as Partitioned DML.
+
+    See :meth:`~django_spanner.managers.SpannerQuerySet.partitioned_update`.
+    """
+
+    def partitioned(self):
+        """Whether the query is to be run as Partitioned DML.
+
+        :rtype: bool
+        """
+        return getattr(self.query, "spanner_partitioned", False)
 
+    def execute_partitioned(self):
+        """Run the query as a Partitioned DML statement.
 
-class SQLDeleteCompiler(BaseSQLDeleteCompiler, SQLCompiler):
+        :rtype: int
+        :returns: A lower bound of the number of rows written.
+        """
+        self.check_partitionable()
+        try:
+            sql, params = self.as_sql()
+        except EmptyResultSet:
+            return 0
+        return self.connection.execute_partitioned_dml(sql, params)
+
+    def check_partitionable(self):
+        """Reject statements which Partitioned DML can't run.
+
+        A Partitioned DML statement may only read the row it writes, so it
+        can't join other tables or contain subqueries.
+
+        :raises: :class:`~django.db.utils.NotSupportedError` for a query
+                 using other rows or tables.
+        """
+        self.query.get_initial_alias()
+        if self.query.count_active_tables() > 1 or _has_subquery(
+            self.query.where
+        ):
+            raise NotSupportedError(
+                "Partitioned DML can only filter on the columns of the "
+                "table it writes."
+            )
+
+
+class ChunkedWriteMixin(object):
+    """Run an update or a delete in primary key ranges.
+
+    The ranges hold the number of rows set by
+    :meth:`~django_spanner.managers.SpannerQuerySet.chunked`, and each one
+    is written by a statement of its own, in its own transaction, so the
+    writes stay under the limit of mutations of a commit.
+    """
+
+    def chunking(self):
+        """The chunking options of the query, if it can be run in chunks.
+
+        Chunks need transactions of their own, so the statements of a
+        transaction or a batch are run as a whole.
+
+        :rtype: dict
+        :returns: The options, or None to run the query as one statement.
+        """
+        chunking = getattr(self.query, "spanner_chunking", None)
+        if (
+            chunking is None
+            or self.connection.in_atomic_block
+            or not self.connection.get_autocommit()
+            or self.connection.dml_batch is not None
+        ):
+            return None
+        return chunking
+
+    def execute_chunked(self, chunking):
+        """Run the query in chunks of rows.
+
+        :type chunking: dict
+        :param chunking: The size of the chunks, the number of chunks run
+                         in parallel and the progress callback.
+
+        :rtype: int
+        :returns: The number of rows written.
+        """
+        self.check_writable()
+        size = chunking["size"]
+        bounds = []
+        for index, pk in enumerate(self._primary_keys()):
+            if index % size == 0:
+                bounds.append(pk)
+        ranges = list(zip(bounds, bounds[1:] + [None]))
+        progress = chunking["progress"]
+        total = 0
+        if chunking["parallel"] < 2:
+            for done, (lower, upper) in enumerate(ranges, 1):
+                total += self._run_chunk(lower, upper)
+                if progress is not None:
+                    progress(done, len(ranges), total)
+            return total
+        with ThreadPoolExecutor(max_workers=chunking["parallel"]) as executor:
+            futures = [
+                executor.submit(self._run_chunk_in_thread, lower, upper)
+                for lower, upper in ranges
+            ]
+            for done, future in enumerate(as_completed(futures), 1):
+                total += future.result()
+                if progress is not None:
+                    progress(done, len(ranges), total)
+        return total
+
+    def _primary_keys(self):
+        query = self.query.chain(Query)
+        query.spanner_chunking = None
+        queryset = self.query.get_meta().model._base_manager.using(self.using)
+        queryset.query = query
+        return queryset.order_by("pk").values_list("pk", flat=True).iterator()
+
+    def _run_chunk(self, lower, upper):
+        query = self.query.clone()
+        query.spanner_chunking = None
+        condition = Q(pk__gte=lower)
+        if upper is not None:
+            condition &= Q(pk__lt=upper)
+        query.add_q(condition)
+        return self.chunk_rows(query.get_compiler(using=self.using))
+
+    def _run_chunk_in_thread(self, lower, upper):
+        try:
+            return self._run_chunk(lower, upper)
+        finally:
+            connections[self.using].close()
+
+    def chunk_rows(self, compiler):
+        """Run the statement of a chunk.
+
+        :rtype: int
+        :returns: The number of rows written.
+        """
+        raise NotImplementedError
+
+
+class SQLDeleteCompiler(
+    PartitionedWriteMixin,
+    ChunkedWriteMixin,
+    BaseSQLDeleteCompiler,
+    SQLCompiler,
+):
     """A wrapper class for compatibility with Django specifications."""
 
-    pass
+    writes = True
 
+    def execute_sql(self, result_type=MULTI, *args, **kwargs):
+        """Delete the rows, as a mutation in a mutation session.
 
-class SQLUpdateCompiler(BaseSQLUpdateCompiler, SQLCompiler):
+        The rows deleted by primary key, as by ``Model.delete()``, are
+        deleted with a mutation sent with the commit. The row count is the
+        number of keys, whether the rows exist or not. See
+        :class:`~django_spanner.transaction.mutation_session`.
+
+        A chunked delete is run in ranges of rows, see
+        :class:`ChunkedWriteMixin`, and a partitioned one as Partitioned
+        DML, see :class:`PartitionedWriteMixin`.
+        """
+        if result_type == CURSOR and self.partitioned():
+            return RowCountCursor(self.execute_partitioned())
+        if result_type == CURSOR:
+            chunking = self.chunking()
+            if chunking is not None:
+                return RowCountCursor(self.execute_chunked(chunking))
+        if (
+            result_type == CURSOR
+            and self.connection.in_mutation_session
+            and self.connection.can_buffer_mutations()
+        ):
+            keys = self.as_mutation_keys()
+            if keys is not None:
+                self.check_writable()
+                self.connection.connection.buffer_mutation(
+                    "delete",
+                    self.query.get_meta().db_table,
+                    [self.query.get_meta().pk.column],
+                    keys,
+                )
+                return RowCountCursor(len(keys))
+        return super().execute_sql(result_type, *args, **kwargs)
+
+    def chunk_rows(self, compiler):
+        cursor = compiler.execute_sql(CURSOR)
+        if cursor is None:
+            return 0
+        with cursor:
+            return cursor.rowcount
+
+    def as_mutation_keys(self):
+        """The keys of the rows to delete, as a delete mutation.
+
+        :rtype: list
+        :returns: The primary key of each row, or None if the rows aren't
+                  deleted by primary key.
+        """
+        lookup = _pk_lookup(self.query)
+        if isinstance(lookup, Exact):
+            values = [lookup.rhs]
+        elif isinstance(lookup, In):
+            values = list(lookup.rhs)
+        else:
+            return None
+        if any(hasattr(value, "resolve_expression") for value in values):
+            return None
+        pk = self.query.get_meta().pk
+        return [
+            [pk.get_db_prep_save(value, connection=self.connection)]
+            for value in values
+        ]
+
+
+class SQLUpdateCompiler(
+    PartitionedWriteMixin,
+    ChunkedWriteMixin,
+    BaseSQLUpdateCompiler,
+    SQLCompiler,
+):
     """A wrapper class for compatibility with Django specifications."""
 
-    pass
+    writes = True
+
+    def execute_sql(self, result_type):
+        """Run the update, or buffer it as a mutation or in a DML batch.
+
+        In a mutation session, the update of one row by primary key, as by
+        ``save()``, is a mutation sent with the commit, see
+        :class:`~django_spanner.transaction.mutation_session`.
+
+        ``save()`` inserts the row when the update of its primary key
+        matches none, so a buffered update of one row by primary key
+        reports one row, which the batch checks when it is sent. See
+        :class:`~django_spanner.transaction.batch_dml`.
+
+        A chunked update is run in ranges of rows, see
+        :class:`ChunkedWriteMixin`, and a partitioned one as Partitioned
+        DML, see :class:`PartitionedWriteMixin`.
+
+        :rtype: int
+        :returns: The number of rows updated, -1 if it isn't known yet.
+        """
+        if self.partitioned():
+            return self.execute_partitioned()
+        chunking = self.chunking()
+        if chunking is not None:
+            return self.execute_chunked(chunking)
+        if (
+            self.connection.in_mutation_session
+            and self.connection.can_buffer_mutations()
+        ):
+            mutation = self.as_mutation()
+            if mutation is not None:
+                self.check_writable()
+                self.connection.connection.buffer_mutation(*mutation)
+                return 1
+        rows = super().execute_sql(result_type)
+        batch = self.connection.dml_batch
+        if rows == -1 and batch is not None and self._updates_one_row():
+            batch.expect_rows()
+            return 1
+        return rows
+
+    def as_mutation(self):
+        """The update of one row by primary key, as a mutation.
+
+        An update of all the fields is an insert_or_update mutation, as
+        ``save()`` inserts the row if it doesn't exist. An update of some
+        of the fields is an update mutation, which fails the commit if the
+        row doesn't exist.
+
+        :rtype: tuple
+        :returns: The method, the table, the columns and the values of the
+                  mutation, or None if the update needs DML.
+        """
+        if not self._updates_one_row():
+            return None
+        opts = self.query.get_meta()
+        pk_value = self.query.where.children[0].rhs
+        if hasattr(pk_value, "resolve_expression"):
+            return None
+        columns = [opts.pk.column]
+        row = [opts.pk.get_db_prep_save(pk_value, connection=self.connection)]
+        for field, _, value in self.query.values:
+            if hasattr(value, "resolve_expression") or hasattr(
+                value, "prepare_database_save"
+            ):
+                return None
+            columns.append(field.column)
+            row.append(
+                field.get_db_prep_save(value, connection=self.connection)
+            )
+        all_columns = {field.column for field in opts.local_concrete_fields}
+        method = (
+            "insert_or_update" if set(columns) == all_columns else "update"
+        )
+        return method, opts.db_table, columns, [row]
+
+    def chunk_rows(self, compiler):
+        return compiler.execute_sql(CURSOR)
+
+    def check_partitionable(self):
+        """Reject updates which Partitioned DML can't run.
+
+        Besides the rules of :class:`PartitionedWriteMixin`, the update
+        must be idempotent, as it may be applied more than once to a row,
+        so its values can't refer to the fields it updates, nor read other
+        rows with subqueries. It must also be a single statement, so it
+        can't update fields of parent models.
+
+        :raises: :class:`~django.db.utils.NotSupportedError` for an update
+                 Partitioned DML can't run.
+        """
+        if self.query.related_updates:
+            raise NotSupportedError(
+                "Partitioned DML can't update the fields of parent models."
+            )
+        updated = set()
+        for field, _, _ in self.query.values:
+            updated |= {field.name, field.attname}
+        for _, _, value in self.query.values:
+            if _field_references(value) & updated:
+                raise NotSupportedError(
+                    "Partitioned DML statements must be idempotent, so "
+                    "the values can't refer to the updated fields."
+                )
+            if _has_subquery(value):
+                raise NotSupportedError(
+                    "Partitioned DML can only read the columns of the "
+                    "table it writes, so the values can't contain subqueries."
+                )
+        super().check_partitionable()
+
+    def _updates_one_row(self):
+        if self.query.related_updates:
+            return False
+        return isinstance(_pk_lookup(self.query), Exact)
 
 
 class SQLAggregateCompiler(BaseSQLAggregateCompiler, SQLCompiler):
@@ -0,0 +1,405 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""DB API connection used by the Django backend."""
+
+import logging
+import re
+import time
+from contextlib import contextmanager
+
+from google.api_core.exceptions import (
+    AlreadyExists,
+    FailedPrecondition,
+    GoogleAPICallError,
+    InvalidArgument,
+    OutOfRange,
+)
+from google.cloud import spanner_dbapi
+from google.cloud.spanner_dbapi.connection import check_not_closed
+from google.cloud.spanner_dbapi.exceptions import (
+    IntegrityError,
+    OperationalError,
+    ProgrammingError,
+)
+from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.keyset import KeySet
+from google.cloud.spanner_v1.snapshot import Snapshot
+
+logger = logging.getLogger(__name__)
+
+# DDL statements which backfill or validate the existing rows, which can
+# take hours on large tables.
+LONG_RUNNING_DDL = re.compile(
+    r"\s*(CREATE\s+(UNIQUE\s+)?(NULL_FILTERED\s+)?INDEX"
+    r"|ALTER\s+TABLE\s+\S+\s+ADD\s+CONSTRAINT)\b",
+    re.IGNORECASE,
+)
+
+UPDATE_DDL_METADATA = (
+    "type.googleapis.com/google.spanner.admin.database.v1."
+    "UpdateDatabaseDdlMetadata"
+)
+
+# Timestamp bounds used instead of the bounded ones, which are only allowed
+# in single-use read-only transactions.
+MULTI_USE_STALENESS = {
+    "max_staleness": "exact_staleness",
+    "min_read_timestamp": "read_timestamp",
+}
+
+
+def running_ddl_operations(database):
+    """Get the schema changes of a database which are still running.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: The database.
+
+    :rtype: list
+    :returns: The :class:`~google.api_core.operation.Operation` of each
+              schema change, oldest first.
+    """
+    operations = database._instance.list_database_operations(
+        filter_="(metadata.@type=%s) AND (done:false)" % UPDATE_DDL_METADATA
+    )
+    return [
+        operation
+        for operation in operations
+        if operation.metadata.database == database.name
+    ][::-1]
+
+
+@contextmanager
+def _db_api_errors():
+    """Raise the errors of a commit as DB API errors, like the cursor does."""
+    try:
+        yield
+    except (AlreadyExists, FailedPrecondition, OutOfRange) as exc:
+        raise IntegrityError(exc.message) from exc
+    except InvalidArgument as exc:
+        raise ProgrammingError(exc.message) from exc
+    except GoogleAPICallError as exc:
+        raise OperationalError(exc.message) from exc
+
+
+def _apply_mutation(target, method, table, columns, values):
+    """Add a buffered mutation to a transaction or a batch."""
+    if method == "delete":
+        target.delete(table, KeySet(keys=values))
+    else:
+        getattr(target, method)(table, columns, values)
+
+
+class Cursor(spanner_dbapi.Cursor):
+    """A DB API cursor recording the commit timestamps of autocommit DML."""
+
+    def execute(self, sql, args=None):
+        super().execute(sql, args)
+        connection = self.connection
+        # DML in autocommit mode runs in a transaction which is committed
+        # before execute() returns.
+        if (
+            not connection._client_transaction_started
+            and connection._transaction is not None
+        ):
+            connection._record_commit(connection._transaction)
+
+    @check_not_closed
+    def queue_ddl(self, sql):
+        """Queue DDL statements instead of running them.
+
+        The connection runs the queued statements in one operation before
+        the next statement of another kind, see
+        :meth:`Connection.run_prior_DDL_statements`.
+
+        :type sql: str
+        :param sql: The DDL statements.
+
+        :raises: :class:`ValueError` if a statement isn't DDL.
+        """
+        self._reset()
+        self._batch_DDLs(sql)
+
+
+class Connection(spanner_dbapi.Connection):
+    """A DB API connection which begins read-write transactions inline.
+
+    The DB API connection sends a ``BeginTransaction`` request before the
+    first statement of a transaction. This connection leaves the transaction
+    ID unset instead, so that the first statement begins the transaction
+    itself and ``atomic()`` doesn't add a round trip of its own.
+
+    Read-only transactions of a connection with a bounded staleness read at
+    the bound itself, which is within the bound.
+
+    The commit timestamp of the latest read-write transaction, including
+    the ones of DML executed in autocommit mode, is kept in
+    :attr:`commit_timestamp`.
+
+    Mutations added with :meth:`buffer_mutation` are sent with the commit.
+    A transaction with nothing but mutations is committed with a single
+    request, without beginning it first.
+
+    The number of DDL statements run by each operation is logged. With
+    :attr:`async_ddl`, the statements building indexes and validating
+    constraints at the end of a batch of DDL statements are submitted
+    without waiting for them, see :meth:`run_prior_DDL_statements`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commit_timestamp = None
+        self.async_ddl = False
+        self._pending_mutations = []
+        # The schema changes submitted without waiting, None until the ones
+        # running are looked up.
+        self._ddl_operations = None
+
+    def _record_commit(self, transaction):
+        self.record_commit_timestamp(getattr(transaction, "committed", None))
+
+    def record_commit_timestamp(self, timestamp):
+        """Keep the timestamp of a commit if it's the latest one.
+
+        :type timestamp: :class:`datetime.datetime`
+        :param timestamp: The commit timestamp, ignored if None.
+        """
+        if timestamp is not None and (
+            self.commit_timestamp is None or timestamp > self.commit_timestamp
+        ):
+            self.commit_timestamp = timestamp
+
+    @check_not_closed
+    def buffer_mutation(self, method, table, columns, values):
+        """Add a mutation to the transaction, to be sent with its commit.
+
+        The mutation isn't visible to the statements of the transaction.
+        Mutations are kept by the connection rather than the transaction, so
+        that a transaction retried after being aborted still writes them.
+
+        :type method: str
+        :param method: The name of the :class:`~google.cloud.spanner_v1.batch.Batch`
+                       method creating the mutation, e.g. "insert".
+
+        :type table: str
+        :param table: The name of the table.
+
+        :type columns: list
+        :param columns: The names of the columns written, or of the primary
+                        key columns for "delete".
+
+        :type values: list
+        :param values: The values of the rows, one list per row, or the
+                       keys of the rows for "delete".
+
+        :raises: :class:`ValueError` if there is no transaction.
+        """
+        if not self._client_transaction_started:
+            raise ValueError("Mutations can only be added to a transaction.")
+        self._pending_mutations.append((method, table, columns, values))
+
+    @property
+    def pending_ddl_statements(self):
+        """The number of DDL statements waiting to run.
+
+        :rtype: int
+        """
+        return len(self._ddl_statements)
+
+    def discard_ddl_statements(self):
+        """Forget the DDL statements waiting to run."""
+        self._ddl_statements = []
+
+    def run_prior_DDL_statements(self):
+        """Run the queued DDL statements in one operation.
+
+        With :attr:`async_ddl`, the schema changes submitted earlier are
+        waited for first, as Spanner runs one schema change of a database
+        at a time. The statements at the end of the queue which build
+        indexes or validate constraints are then submitted in an operation
+        of their own, which isn't waited for, so that the indexes are
+        built together while the application goes on.
+        """
+        statements = self._ddl_statements
+        if not (self.async_ddl and statements and self.database is not None):
+            return self._update_ddl()
+        self.wait_for_ddl_operations()
+        split = len(statements)
+        while split and LONG_RUNNING_DDL.match(statements[split - 1]):
+            split -= 1
+        self._ddl_statements = statements[:split]
+        self._update_ddl()
+        if split < len(statements):
+            operation = self.database.update_ddl(statements[split:])
+            self._ddl_operations.append(operation)
+            logger.info(
+                "Submitted %d DDL statements in operation %s without "
+                "waiting for it.",
+                len(statements) - split,
+                operation.operation.name,
+            )
+
+    def wait_for_ddl_operations(self):
+        """Wait for the schema changes submitted without waiting.
+
+        The first time, the schema changes still running are looked up, so
+        that the ones submitted by other processes, e.g. an earlier
+        ``migrate``, are waited for instead of failing the next one.
+
+        :raises: :class:`~google.api_core.exceptions.GoogleAPICallError` if
+                 a schema change failed.
+        """
+        if self._ddl_operations is None:
+            self._ddl_operations = running_ddl_operations(self.database)
+        while self._ddl_operations:
+            operation = self._ddl_operations.pop(0)
+            logger.info(
+                "Waiting for DDL operation %s.", operation.operation.name
+            )
+            operation.result()
+
+    def _update_ddl(self):
+        statements = len(self._ddl_statements)
+        start = time.monotonic()
+        result = super().run_prior_DDL_statements()
+        if statements:
+            logger.info(
+                "Ran %d DDL statement%s in one operation in %.1f seconds.",
+                statements,
+                "" if statements == 1 else "s",
+                time.monotonic() - start,
+            )
+        return result
+
+    def _reset_post_commit_or_rollback(self):
+        super()._reset_post_commit_or_rollback()
+        self._pending_mutations = []
+
+    def close(self):
+        """Close the connection, rolling back the transaction if any.
+
+        The session of the transaction is returned to the pool, which is
+        shared with the other connections of the process.
+        """
+        try:
+            super().close()
+        finally:
+            self._pending_mutations = []
+            self._release_session()
+
+    @check_not_closed
+    def cursor(self):
+        """Factory to create a DB API Cursor."""
+        return Cursor(self)
+
+    def transaction_checkout(self):
+        """Get a Cloud Spanner transaction.
+
+        Create a new transaction, if there is no transaction in this
+        connection yet, without beginning it. Return the started one
+        otherwise.
+
+        :rtype: :class:`google.cloud.spanner_v1.transaction.Transaction`
+        :returns: A Cloud Spanner transaction object, ready to use.
+        """
+        if (
+            not self.read_only
+            and self._client_transaction_started
+            and not self._spanner_transaction_started
+        ):
+            transaction = self._session_checkout().transaction()
+            transaction.transaction_tag = self.transaction_tag
+            transaction.isolation_level = (
+                self._transaction_isolation_level or self.isolation_level
+            )
+            self._transaction = transaction
+            self.transaction_tag = None
+            self._snapshot = None
+            self._spanner_transaction_started = True
+        return super().transaction_checkout()
+
+    def snapshot_checkout(self):
+        """Get a Cloud Spanner snapshot.
+
+        Initiate a new multi-use snapshot, if there is no snapshot in this
+        connection yet. Return the existing one otherwise.
+
+        :rtype: :class:`google.cloud.spanner_v1.snapshot.Snapshot`
+        :returns: A Cloud Spanner snapshot object, ready to use.
+        """
+        if (
+            self.read_only
+            and self._client_transaction_started
+            and not self._spanner_transaction_started
+        ):
+            staleness = {
+                MULTI_USE_STALENESS.get(key, key): value
+                for key, value in self.staleness.items()
+            }
+            self._snapshot = Snapshot(
+                self._session_checkout(), multi_use=True, **staleness
+            )
+            self._transaction = None
+            self._snapshot.begin()
+            self._spanner_transaction_started = True
+        return super().snapshot_checkout()
+
+    def commit(self):
+        """Commit the pending transaction.
+
+        A transaction which never began on the server (its first statement
+        failed before returning a transaction ID) has nothing to commit.
+
+        :raises: :class:`~google.cloud.spanner_dbapi.exceptions.IntegrityError`
+                 if the buffered mutations conflict with existing rows, and
+                 the other DB API errors for the other failures of their
+                 commit.
+        """
+        mutations = self._pending_mutations
+        if mutations and not self._spanner_transaction_started:
+            self._commit_mutations(mutations)
+            return
+
+        transaction = self._transaction
+        for mutation in mutations:
+            _apply_mutation(transaction, *mutation)
+        if (
+            self._spanner_transaction_started
+            and not self._read_only
+            and transaction is not None
+            and transaction._transaction_id is None
+            and not transaction._mutations
+        ):
+            self.run_prior_DDL_statements()
+            self._reset_post_commit_or_rollback()
+            return
+        if mutations:
+            with _db_api_errors():
+                super().commit()
+        else:
+            super().commit()
+        if transaction is not None:
+            self._record_commit(transaction)
+
+    def _commit_mutations(self, mutations):
+        """Commit mutations in a single-use transaction."""
+        batch = Batch(self._session_checkout())
+        batch.transaction_tag = self.transaction_tag
+        for mutation in mutations:
+            _apply_mutation(batch, *mutation)
+        try:
+            self.run_prior_DDL_statements()
+            with _db_api_errors():
+                batch.commit(
+                    isolation_level=(
+                        self._transaction_isolation_level
+                        or self.isolation_level
+                    )
+                )
+        finally:
+            self.transaction_tag = None
+            self._reset_post_commit_or_rollback()
+        self._record_commit(batch)
@@ -23,12 +23,19 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     has_case_insensitive_like = False
     # https://cloud.google.com/spanner/quotas#query_limits
     max_query_params = 900
+    # Column defaults are literals in DDL statements, which have no
+    # parameters.
+    requires_literal_defaults = True
     if os.environ.get("RUNNING_SPANNER_BACKEND_TESTS") == "1":
         supports_foreign_keys = False
     else:
         supports_foreign_keys = True
     can_create_inline_fk = False
-    supports_ignore_conflicts = False
+    # INSERT OR IGNORE, see SQLInsertCompiler.as_sql().
+    supports_ignore_conflicts = True
+    # INSERT OR UPDATE, which only detects conflicts on the primary key.
+    supports_update_conflicts = True
+    supports_update_conflicts_with_target = True
     supports_partial_indexes = False
     supports_regex_backreferencing = False
     supports_select_for_update_with_limit = False
@@ -0,0 +1,69 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Show the progress of the schema changes running on a database."""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from django_spanner.connection import running_ddl_operations
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the progress of the schema changes running on a Cloud Spanner "
+        "database, like the index builds submitted by migrate with the "
+        "async_ddl option."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database. Defaults to the "default" database.',
+        )
+        parser.add_argument(
+            "--wait",
+            action="store_true",
+            help="Wait for the schema changes to finish.",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor != "spanner":
+            raise CommandError(
+                "Database %r isn't a Cloud Spanner database."
+                % options["database"]
+            )
+        database, _ = connection._get_database(
+            connection.get_connection_params()
+        )
+        operations = running_ddl_operations(database)
+        if not operations:
+            self.stdout.write("No schema changes are running.")
+            return
+        for operation in operations:
+            name = operation.operation.name
+            self.stdout.write("Operation %s:" % name)
+            metadata = operation.metadata
+            for index, statement in enumerate(metadata.statements):
+                if index < len(metadata.commit_timestamps):
+                    state = "done"
+                elif index < len(metadata.progress):
+                    state = "%d%%" % metadata.progress[index].progress_percent
+                else:
+                    state = "waiting"
+                self.stdout.write("  [%s] %s" % (state, statement))
+            if options["wait"]:
+                try:
+                    operation.result()
+                except Exception as exc:
+                    raise CommandError(
+                        "Operation %s failed: %s" % (name, exc)
+                    ) from exc
+                self.stdout.write(
+                    self.style.SUCCESS("Operation %s is done." % name)
+                )
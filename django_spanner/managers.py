@@ -0,0 +1,451 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""QuerySet and Manager with Cloud Spanner specific features."""
+
+from itertools import islice
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import NotSupportedError, connections, models, transaction
+from django.db.models import sql
+from django.db.models.deletion import Collector
+
+from .mutations import BatchWriteResult, GroupResult
+from .utils import parse_staleness
+from django_spanner import USING_DJANGO_3
+
+
+class SpannerQuerySet(models.QuerySet):
+    """A QuerySet with Cloud Spanner specific features.
+
+    Use it as the manager of a model::
+
+        class Book(models.Model):
+            objects = SpannerManager()
+    """
+
+    def stale(self, seconds=None, **staleness):
+        """Read the data as it was some time ago.
+
+        Stale reads don't have to wait for the leader replica, so they can
+        be served faster by the nearest replica. The staleness applies to
+        the queries executed in autocommit mode, including the ones of
+        ``select_related()`` and ``prefetch_related()``; transactions always
+        read the latest data.
+
+        :type seconds: float
+        :param seconds: (Optional) The maximum staleness in seconds.
+
+        :param staleness: Instead of `seconds`, one of ``max_staleness`` or
+                          ``exact_staleness`` (a timedelta or seconds), or
+                          ``read_timestamp`` or ``min_read_timestamp`` (a
+                          datetime).
+
+        :rtype: :class:`SpannerQuerySet`
+        :returns: A copy of the QuerySet reading stale data.
+
+        :raises: :class:`ValueError` if the staleness isn't valid.
+        """
+        if seconds is not None:
+            staleness["max_staleness"] = seconds
+        clone = self._chain()
+        clone.query.spanner_staleness = parse_staleness(staleness)
+        return clone
+
+    def read_timestamp(self, timestamp):
+        """Read the data as it was at the given time.
+
+        :type timestamp: :class:`datetime.datetime`
+        :param timestamp: The time to read the data at.
+
+        :rtype: :class:`SpannerQuerySet`
+        :returns: A copy of the QuerySet reading the data at `timestamp`.
+        """
+        return self.stale(read_timestamp=timestamp)
+
+    def chunked(self, size=10000, parallel=1, progress=None):
+        """Run ``update()`` and ``delete()`` in chunks of rows.
+
+        The primary keys of the rows are read first, and split in ranges of
+        `size` rows. Each range is updated or deleted by a statement of its
+        own, in its own transaction, so writes to more rows than a commit
+        allows succeed. If one fails, the chunks before it stay written.
+        The returned row count is the total of the chunks.
+
+        Chunks need transactions of their own, so in a transaction the
+        statement runs as a whole. Deletes which cascade to other rows or
+        send signals are run by Django as usual, in one transaction.
+
+        :type size: int
+        :param size: (Optional) The number of rows of a chunk.
+
+        :type parallel: int
+        :param parallel: (Optional) The number of chunks written at the
+                         same time, each by a thread of its own.
+
+        :type progress: callable
+        :param progress: (Optional) Called after each chunk with the number
+                         of chunks written, the number of chunks and the
+                         number of rows written so far.
+
+        :rtype: :class:`SpannerQuerySet`
+        :returns: A copy of the QuerySet writing in chunks.
+
+        :raises: :class:`ValueError` if `size` or `parallel` isn't positive.
+        """
+        if size < 1 or parallel < 1:
+            raise ValueError(
+                "The chunk size and parallelism must be positive."
+            )
+        clone = self._chain()
+        clone.query.spanner_chunking = {
+            "size": size,
+            "parallel": parallel,
+            "progress": progress,
+        }
+        return clone
+
+    def delete(self):
+        """Delete the rows, in chunks if :meth:`chunked` asked for it.
+
+        :rtype: tuple
+        :returns: The number of rows deleted and the number by model.
+        """
+        if (
+            getattr(self.query, "spanner_chunking", None) is None
+            or self.query.is_sliced
+            or self.query.combinator
+            or self.query.distinct
+            or self._fields is not None
+        ):
+            return super().delete()
+        del_query = self._fast_delete_query()
+        if del_query is None:
+            return super().delete()
+        count = del_query._raw_delete(del_query.db)
+        return count, ({self.model._meta.label: count} if count else {})
+
+    def _fast_delete_query(self):
+        """The QuerySet deleting the rows with one statement, if it can."""
+        del_query = self._chain()
+        del_query._for_write = True
+        del_query.query.select_for_update = False
+        del_query.query.select_related = False
+        del_query.query.clear_ordering(True)
+        if not Collector(using=del_query.db).can_fast_delete(del_query):
+            return None
+        return del_query
+
+    def partitioned_update(self, **kwargs):
+        """Update the rows with a Partitioned DML statement.
+
+        Spanner runs the statement in parallel on the splits of the table,
+        each in a transaction of its own, so any number of rows can be
+        updated. The update isn't atomic: if it fails, some rows may be
+        updated already. It can't run in a transaction.
+
+        :param kwargs: The values of the fields to update, as in
+                       ``update()``.
+
+        :rtype: int
+        :returns: A lower bound of the number of rows updated.
+
+        :raises: :class:`~django.db.NotSupportedError` for an update which
+                 isn't a single idempotent statement on one table, see
+                 :meth:`~django_spanner.compiler.SQLUpdateCompiler.check_partitionable`.
+        """
+        clone = self._chain()
+        clone.query.spanner_partitioned = True
+        return clone.update(**kwargs)
+
+    def partitioned_delete(self):
+        """Delete the rows with a Partitioned DML statement.
+
+        See :meth:`partitioned_update`. Deleting the rows may not need to
+        cascade to other rows or send signals.
+
+        :rtype: int
+        :returns: A lower bound of the number of rows deleted.
+
+        :raises: :class:`~django.db.NotSupportedError` for a delete which
+                 isn't a single statement on one table.
+        """
+        if self.query.is_sliced or self.query.combinator:
+            raise TypeError("Cannot use partitioned_delete() on this query.")
+        del_query = self._fast_delete_query()
+        if del_query is None:
+            raise NotSupportedError(
+                "Partitioned DML can't delete rows which cascade to other "
+                "rows or send signals."
+            )
+        del_query.query.spanner_partitioned = True
+        return del_query._raw_delete(del_query.db)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        """Update the given fields of the objects, with mutations if possible.
+
+        Where ``bulk_create()`` would use mutations, see
+        :meth:`~django_spanner.base.DatabaseWrapper.can_buffer_mutations`,
+        the rows are written by update mutations keyed by the primary key
+        instead of ``UPDATE`` statements. Unlike a statement, an update
+        mutation of a row which doesn't exist fails the commit.
+
+        :type objs: list
+        :param objs: The model instances to update.
+
+        :type fields: list
+        :param fields: The names of the fields to update.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of rows of one
+                           mutation.
+
+        :rtype: int
+        :returns: The number of rows updated.
+        """
+        connection = connections[self.db]
+        if connection.vendor != "spanner":
+            return super().bulk_update(objs, fields, batch_size=batch_size)
+        objs = tuple(objs)
+        with transaction.atomic(using=self.db, savepoint=False):
+            mutation = None
+            if connection.can_buffer_mutations():
+                mutation = self._update_mutation(objs, fields, batch_size)
+            if mutation is None:
+                return super().bulk_update(objs, fields, batch_size=batch_size)
+            connection.check_writable()
+            table, columns, batches = mutation
+            for rows in batches:
+                connection.connection.buffer_mutation(
+                    "update", table, columns, rows
+                )
+        return len({obj.pk for obj in objs})
+
+    def _update_mutation(self, objs, field_names, batch_size):
+        """The arguments of update mutations writing the fields of `objs`.
+
+        :rtype: tuple
+        :returns: The table, the columns and the batches of rows, or None if
+                  the update needs DML or is invalid, which the base class
+                  reports.
+        """
+        opts = self.model._meta
+        if not objs or not field_names or (batch_size or 0) < 0:
+            return None
+        fields = []
+        for name in field_names:
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if (
+                not field.concrete
+                or field.many_to_many
+                or field.primary_key
+                or field.model is not opts.concrete_model
+            ):
+                return None
+            fields.append(field)
+        if any(obj.pk is None for obj in objs):
+            return None
+
+        connection = connections[self.db]
+        rows = []
+        for obj in objs:
+            if USING_DJANGO_3:
+                obj._prepare_related_fields_for_save(
+                    operation_name="bulk_update"
+                )
+            else:
+                obj._prepare_related_fields_for_save(
+                    operation_name="bulk_update", fields=fields
+                )
+            values = [getattr(obj, field.attname) for field in fields]
+            if any(hasattr(value, "resolve_expression") for value in values):
+                return None
+            rows.append(
+                [opts.pk.get_db_prep_save(obj.pk, connection=connection)]
+                + [
+                    field.get_db_prep_save(value, connection=connection)
+                    for field, value in zip(fields, values)
+                ]
+            )
+
+        columns = [opts.pk.column] + [field.column for field in fields]
+        size = connection.ops.rows_per_write(self.model, columns)
+        if batch_size:
+            size = min(size, batch_size)
+        batches = [rows[i : i + size] for i in range(0, len(rows), size)]
+        return opts.db_table, columns, batches
+
+    def upsert_many(self, objs, update_fields=None, batch_size=None):
+        """Insert the objects, or update the rows which already exist.
+
+        The objects are taken from `objs` one batch at a time, so it can be
+        a generator of any length, and each batch is written by
+        ``bulk_create(update_conflicts=True)``. In autocommit mode, that is
+        one commit of ``insert_or_update`` mutations per batch, and the
+        batches are as large as the mutation limit of a commit allows.
+        Inside ``atomic()``, all of them use DML in the same transaction.
+
+        :type objs: iterable
+        :param objs: The model instances to write.
+
+        :type update_fields: list
+        :param update_fields: (Optional) The names of the fields to update
+                              in existing rows, all the inserted ones if not
+                              given. Spanner updates all of them anyway.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of objects written
+                           at once.
+
+        :rtype: int
+        :returns: The number of objects written.
+
+        :raises: :class:`~django.db.NotSupportedError` with Django 3.2,
+                 which can't update conflicts.
+        """
+        if USING_DJANGO_3:
+            raise NotSupportedError("upsert_many() requires Django 4.1+.")
+        opts = self.model._meta
+        if update_fields is None:
+            update_fields = [
+                field.name
+                for field in opts.concrete_fields
+                if not field.primary_key
+            ]
+        size = connections[self.db].ops.rows_per_write(
+            self.model, [field.column for field in opts.concrete_fields]
+        )
+        if batch_size:
+            size = min(size, batch_size)
+
+        objs = iter(objs)
+        count = 0
+        while True:
+            batch = list(islice(objs, size))
+            if not batch:
+                return count
+            self.bulk_create(
+                batch,
+                update_conflicts=True,
+                update_fields=update_fields,
+                unique_fields=["pk"],
+            )
+            count += len(batch)
+
+    def batch_write(self, objs, group_by=None, method="insert"):
+        """Write the objects with the BatchWrite API, without a transaction.
+
+        The objects are split into mutation groups, which Spanner commits
+        independently of each other and in parallel. Each group is applied
+        atomically, but some groups can fail while others succeed. The
+        writes are independent of ``atomic()`` blocks.
+
+        :type objs: list
+        :param objs: The model instances to write.
+
+        :type group_by: Union[str, callable]
+        :param group_by: (Optional) The name of a field, or a function of an
+                         object, whose value groups the objects. Every object
+                         is a group of its own if not given.
+
+        :type method: str
+        :param method: (Optional) The mutation writing the rows: "insert"
+                       (the default), "insert_or_update", "replace" or
+                       "update".
+
+        :rtype: :class:`~django_spanner.mutations.BatchWriteResult`
+        :returns: The status of every group.
+        """
+        return BatchWriteResult(
+            list(self.iter_batch_write(objs, group_by, method))
+        )
+
+    def iter_batch_write(self, objs, group_by=None, method="insert"):
+        """Like :meth:`batch_write`, yielding the result of each group.
+
+        The results are yielded as the server reports them, which isn't
+        necessarily the order of the groups.
+
+        :rtype: iterable
+        :returns: A :class:`~django_spanner.mutations.GroupResult` for each
+                  group.
+
+        :raises: :class:`ValueError` for an unknown `method` or values which
+                 mutations can't write, like expressions.
+        """
+        if method not in ("insert", "insert_or_update", "replace", "update"):
+            raise ValueError("Unknown mutation %r." % method)
+        connection = connections[self.db]
+        if connection.vendor != "spanner":
+            raise NotSupportedError("batch_write() requires Cloud Spanner.")
+        connection.check_writable()
+        objs = list(objs)
+        if not objs:
+            return
+
+        if group_by is None:
+            keys = range(len(objs))
+        elif callable(group_by):
+            keys = [group_by(obj) for obj in objs]
+        else:
+            attname = self.model._meta.get_field(group_by).attname
+            keys = [getattr(obj, attname) for obj in objs]
+        groups = {}
+        for key, obj in zip(keys, objs):
+            groups.setdefault(key, []).append(obj)
+        results = [GroupResult(key, group) for key, group in groups.items()]
+
+        fields = self.model._meta.concrete_fields
+        mutations = []
+        for result in results:
+            for obj in result.objs:
+                obj._prepare_related_fields_for_save(
+                    operation_name="batch_write"
+                )
+            query = sql.InsertQuery(self.model)
+            query.insert_values(fields, result.objs)
+            mutation = query.get_compiler(using=self.db).as_mutation()
+            if mutation is None:
+                raise ValueError("Mutations can't write expressions.")
+            mutations.append(mutation)
+
+        connection.ensure_connection()
+        database = connection.connection.database
+        with database.mutation_groups() as mutation_groups:
+            for table, columns, rows in mutations:
+                getattr(mutation_groups.group(), method)(table, columns, rows)
+            for response in mutation_groups.batch_write():
+                for index in response.indexes:
+                    result = results[index]
+                    result.code = response.status.code
+                    result.message = response.status.message
+                    if result.ok:
+                        result.commit_timestamp = response.commit_timestamp
+                        for obj in result.objs:
+                            obj._state.adding = False
+                            obj._state.db = self.db
+                    yield result
+                if response.status.code == 0:
+                    connection.connection.record_commit_timestamp(
+                        response.commit_timestamp
+                    )
+
+    def _fetch_all(self):
+        staleness = getattr(self.query, "spanner_staleness", None)
+        connection = connections[self.db]
+        if staleness is None or connection.vendor != "spanner":
+            return super()._fetch_all()
+        # The queries of prefetch_related() are built from the managers of
+        # the related models, so the staleness is set on the connection.
+        with connection.read_staleness(staleness):
+            return super()._fetch_all()
+
+
+class SpannerManager(models.Manager.from_queryset(SpannerQuerySet)):
+    """A Manager using :class:`SpannerQuerySet`."""
@@ -0,0 +1,226 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Middleware for Cloud Spanner."""
+
+import datetime
+import json
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, router
+
+from .routers import ReadReplicaRouter
+from .transaction import read_only_snapshot
+from .utils import parse_staleness
+
+
+def _ceil_to_microseconds(timestamp):
+    """Round a commit timestamp with nanoseconds up to microseconds.
+
+    Reads at a timestamp truncated to microseconds could miss the commit.
+    """
+    nanosecond = getattr(timestamp, "nanosecond", 0)
+    result = datetime.datetime(
+        *timestamp.timetuple()[:6],
+        microsecond=timestamp.microsecond,
+        tzinfo=timestamp.tzinfo
+    )
+    if nanosecond % 1000:
+        result += datetime.timedelta(microseconds=1)
+    return result
+
+
+class ReadYourWritesMiddleware(object):
+    """Let the clients see their own writes in stale reads.
+
+    The commit timestamps of the latest writes of a request are sent to the
+    client in a signed cookie, for each database with a ``max_staleness``
+    or ``exact_staleness`` which reads the written one: the database itself
+    or its read-only replicas (see the ``primary`` option of
+    :class:`~django_spanner.routers.ReadReplicaRouter`). While the write is
+    more recent than the staleness of such a database, the reads of the
+    next requests of the client from it use the commit timestamp as their
+    ``min_read_timestamp`` instead. They see the write and can still be
+    served by the nearest replica which has it. The other databases aren't
+    connected to by the middleware.
+
+    Enable it with::
+
+        MIDDLEWARE = [
+            ...
+            "django_spanner.middleware.ReadYourWritesMiddleware",
+        ]
+    """
+
+    cookie_name = "spanner_commit_timestamp"
+    cookie_salt = "django_spanner.middleware.ReadYourWritesMiddleware"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        staleness = self._stale_databases()
+        if not staleness:
+            return self.get_response(request)
+
+        aliases = [
+            alias
+            for alias, settings_dict in connections.settings.items()
+            if settings_dict["ENGINE"] == "django_spanner"
+        ]
+        # Reading the commit timestamps doesn't connect to the databases.
+        before = {
+            alias: connections[alias].commit_timestamp for alias in aliases
+        }
+        now = datetime.datetime.now(datetime.timezone.utc)
+        timestamps = {
+            alias: timestamp
+            for alias, timestamp in self._get_commit_timestamps(
+                request
+            ).items()
+            if alias in staleness and timestamp > now - staleness[alias]
+        }
+        with ExitStack() as stack:
+            for alias, timestamp in timestamps.items():
+                stack.enter_context(
+                    connections[alias].read_staleness(
+                        {"min_read_timestamp": timestamp}
+                    )
+                )
+            response = self.get_response(request)
+
+        committed = False
+        for alias in aliases:
+            timestamp = connections[alias].commit_timestamp
+            if timestamp is None or timestamp == before[alias]:
+                continue
+            committed = True
+            timestamp = _ceil_to_microseconds(timestamp)
+            for reader in staleness:
+                if self._primary(reader) == alias and (
+                    reader not in timestamps or timestamps[reader] < timestamp
+                ):
+                    timestamps[reader] = timestamp
+        if committed and timestamps:
+            response.set_signed_cookie(
+                self.cookie_name,
+                json.dumps(
+                    {
+                        alias: timestamp.isoformat()
+                        for alias, timestamp in timestamps.items()
+                    },
+                    sort_keys=True,
+                ),
+                salt=self.cookie_salt,
+                max_age=max(staleness.values()).total_seconds(),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def _stale_databases(self):
+        """The Spanner databases reading with a staleness duration.
+
+        :rtype: dict
+        :returns: The ``max_staleness`` or ``exact_staleness`` by alias.
+        """
+        staleness = {}
+        for alias, settings_dict in connections.settings.items():
+            if settings_dict["ENGINE"] != "django_spanner":
+                continue
+            options = settings_dict.get("OPTIONS", {})
+            if "staleness" not in options:
+                continue
+            ((key, value),) = parse_staleness(options["staleness"]).items()
+            if key in ("max_staleness", "exact_staleness"):
+                staleness[alias] = value
+        return staleness
+
+    def _primary(self, alias):
+        """The database written instead of a read-only one."""
+        options = connections.settings[alias].get("OPTIONS", {})
+        if options.get("read_only"):
+            return options.get("primary", DEFAULT_DB_ALIAS)
+        return alias
+
+    def _get_commit_timestamps(self, request):
+        """The commit timestamps of the cookie, by the alias reading them.
+
+        :rtype: dict
+        :returns: The valid timestamps of the cookie.
+        """
+        value = request.get_signed_cookie(
+            self.cookie_name, default=None, salt=self.cookie_salt
+        )
+        if value is None:
+            return {}
+        try:
+            values = json.loads(value)
+        except ValueError:
+            return {}
+        if not isinstance(values, dict):
+            return {}
+        timestamps = {}
+        for alias, value in values.items():
+            try:
+                timestamp = datetime.datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                continue
+            if timestamp.tzinfo is not None:
+                timestamps[alias] = timestamp
+        return timestamps
+
+
+class ReadOnlySnapshotMiddleware(object):
+    """Run the reads of a request in one read-only transaction.
+
+    All the reads of a request from a Spanner database see the data at the
+    same timestamp, see :class:`~django_spanner.transaction.read_only_snapshot`.
+    A request which writes or starts a transaction continues with the usual
+    transactions from then on.
+
+    The snapshots are used for the databases listed in the
+    ``SPANNER_SNAPSHOT_DATABASES`` setting. By default, these are the
+    read-only databases of
+    :class:`~django_spanner.routers.ReadReplicaRouter` if it is enabled,
+    and the default database otherwise.
+
+    Enable it with::
+
+        MIDDLEWARE = [
+            ...
+            "django_spanner.middleware.ReadOnlySnapshotMiddleware",
+        ]
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with ExitStack() as stack:
+            for alias in self._snapshot_databases():
+                stack.enter_context(read_only_snapshot(using=alias))
+            return self.get_response(request)
+
+    def _snapshot_databases(self):
+        """The aliases of the databases whose reads use a snapshot.
+
+        :rtype: list
+        :returns: The aliases of the ``SPANNER_SNAPSHOT_DATABASES`` setting
+                  or their default.
+        """
+        aliases = getattr(settings, "SPANNER_SNAPSHOT_DATABASES", None)
+        if aliases is not None:
+            return list(aliases)
+        for db_router in router.routers:
+            if isinstance(db_router, ReadReplicaRouter):
+                return [
+                    alias
+                    for replicas in db_router.replicas.values()
+                    for alias in replicas
+                ]
+        return [DEFAULT_DB_ALIAS]
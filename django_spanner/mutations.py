@@ -0,0 +1,284 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Writes through Cloud Spanner mutations instead of DML statements.
+
+A mutation is sent with the commit of its transaction, so writing rows as
+mutations needs no statement to be parsed and planned by the server, and no
+round trip of its own. Mutations aren't visible to the statements of their
+own transaction though, so the backend only uses them for writes which are
+the last thing their transaction does, e.g. the rows of ``bulk_create()``.
+
+See https://cloud.google.com/spanner/docs/modify-mutation-api
+"""
+
+from google.api_core.exceptions import DeadlineExceeded, InvalidArgument
+
+# The maximum number of mutations in one commit. Every column written to a
+# row counts as one mutation.
+# See https://cloud.google.com/spanner/quotas#limits-for
+MAX_MUTATIONS = 80000
+
+# Lowercase parts of the messages of the errors Spanner returns for commits
+# exceeding the mutation limit.
+MUTATION_LIMIT_MESSAGES = ("too many mutations", "mutation limit exceeded")
+
+
+# Seconds a batch of rows may take to be written before the batch size is
+# reduced, see BatchSizer.
+DEFAULT_TARGET_LATENCY = 1.0
+
+
+def secondary_indexes(model):
+    """The columns of the secondary indexes of a model.
+
+    These are the indexes of fields with ``db_index`` or ``unique`` (which
+    includes foreign keys), of ``Meta.indexes``, ``unique_together``,
+    ``index_together`` and unique constraints.
+
+    :type model: :class:`~django.db.models.Model`
+    :param model: The model of the table.
+
+    :rtype: list
+    :returns: A tuple of column names for each index.
+    """
+    opts = model._meta
+
+    def columns(names):
+        return tuple(
+            opts.get_field(name.lstrip("-")).column for name in names if name
+        )
+
+    indexes = [
+        (field.column,)
+        for field in opts.local_concrete_fields
+        if (field.db_index or field.unique) and not field.primary_key
+    ]
+    indexes.extend(columns(index.fields) for index in opts.indexes)
+    indexes.extend(columns(names) for names in opts.unique_together)
+    indexes.extend(
+        columns(names) for names in getattr(opts, "index_together", ())
+    )
+    indexes.extend(
+        columns(constraint.fields)
+        for constraint in opts.total_unique_constraints
+    )
+    unique = []
+    for index in indexes:
+        if index and index not in unique:
+            unique.append(index)
+    return unique
+
+
+def mutations_per_row(model, columns):
+    """The number of mutations of writing `columns` of a row of `model`.
+
+    Every written column counts, and so does every column of a secondary
+    index including one of them, as the index is written too.
+
+    :type model: :class:`~django.db.models.Model`
+    :param model: The model of the table.
+
+    :type columns: list
+    :param columns: The names of the written columns.
+
+    :rtype: int
+    :returns: The number of mutations.
+    """
+    written = set(columns)
+    return len(columns) + sum(
+        len(index)
+        for index in secondary_indexes(model)
+        if written.intersection(index)
+    )
+
+
+def is_size_error(exc):
+    """Whether an error suggests writing fewer rows at once.
+
+    The errors raised by Django and the DB API are looked through for the
+    Spanner error causing them.
+
+    :type exc: :class:`Exception`
+    :param exc: The error of a write.
+
+    :rtype: bool
+    :returns: True for deadlines exceeded and for the errors of commits
+              exceeding the mutation limit.
+    """
+    while exc is not None:
+        if isinstance(exc, DeadlineExceeded):
+            return True
+        if isinstance(exc, InvalidArgument):
+            message = str(exc.message).lower()
+            return any(text in message for text in MUTATION_LIMIT_MESSAGES)
+        exc = exc.__cause__
+    return False
+
+
+def mutation_batch_size(columns):
+    """The number of rows of which a commit can write `columns` columns each.
+
+    :type columns: int
+    :param columns: The number of columns written to each row.
+
+    :rtype: int
+    :returns: The maximum number of rows, at least 1.
+    """
+    return max(MAX_MUTATIONS // max(columns, 1), 1)
+
+
+class BatchSizer(object):
+    """Adapt the number of rows written at once to how the writes go.
+
+    The size of the batches of a table starts at the largest one the
+    limits allow. It's halved when a batch takes longer than the target
+    latency or fails for its size, and grows again by half after each full
+    batch which was fast enough.
+
+    :type target_latency: float
+    :param target_latency: (Optional) The seconds a batch may take.
+    """
+
+    GROWTH = 1.5
+
+    def __init__(self, target_latency=None):
+        self.target_latency = target_latency or DEFAULT_TARGET_LATENCY
+        self._tables = {}
+
+    def _state(self, table):
+        return self._tables.setdefault(
+            table,
+            {
+                "size": None,
+                "max_size": None,
+                "writes": 0,
+                "errors": 0,
+                "last_rows": None,
+                "last_latency": None,
+            },
+        )
+
+    def batch_size(self, table, max_size):
+        """The number of rows to write at once.
+
+        :type table: str
+        :param table: The name of the table.
+
+        :type max_size: int
+        :param max_size: The largest batch the limits allow.
+
+        :rtype: int
+        :returns: The batch size, at most `max_size`.
+        """
+        state = self._state(table)
+        state["max_size"] = max_size
+        if state["size"] is None:
+            return max_size
+        return min(state["size"], max_size)
+
+    def record(self, table, rows, seconds):
+        """Adapt the batch size of a table to a successful write.
+
+        :type table: str
+        :param table: The name of the table.
+
+        :type rows: int
+        :param rows: The number of rows written.
+
+        :type seconds: float
+        :param seconds: How long the write took.
+        """
+        state = self._state(table)
+        state["writes"] += 1
+        state["last_rows"] = rows
+        state["last_latency"] = seconds
+        if seconds > self.target_latency:
+            state["size"] = max(rows // 2, 1)
+        elif state["size"] is not None and rows >= state["size"]:
+            size = int(state["size"] * self.GROWTH) + 1
+            if state["max_size"] is not None and size >= state["max_size"]:
+                size = None
+            state["size"] = size
+
+    def record_error(self, table, rows):
+        """Halve the batch size of a table after a write failed for its size.
+
+        :type table: str
+        :param table: The name of the table.
+
+        :type rows: int
+        :param rows: The number of rows of the failed write.
+        """
+        state = self._state(table)
+        state["errors"] += 1
+        state["last_rows"] = rows
+        state["size"] = max(rows // 2, 1)
+
+    def stats(self):
+        """The state of the batch size of every table.
+
+        :rtype: dict
+        :returns: By table, the current ``size`` (None while the largest
+                  one is used), the ``max_size`` the limits allow, the
+                  numbers of ``writes`` and ``errors``, and the rows and
+                  latency of the last write.
+        """
+        return {table: dict(state) for table, state in self._tables.items()}
+
+
+class GroupResult(object):
+    """The outcome of one mutation group written by ``batch_write()``.
+
+    :type key: object
+    :param key: The key the objects of the group were grouped by.
+
+    :type objs: list
+    :param objs: The model instances of the group.
+    """
+
+    def __init__(self, key, objs):
+        self.key = key
+        self.objs = objs
+        self.code = None
+        self.message = ""
+        self.commit_timestamp = None
+
+    @property
+    def ok(self):
+        """Whether the group was committed."""
+        return self.code == 0
+
+    def __repr__(self):
+        return "<GroupResult key=%r objs=%d code=%r>" % (
+            self.key,
+            len(self.objs),
+            self.code,
+        )
+
+
+class BatchWriteResult(object):
+    """The outcome of all the mutation groups written by ``batch_write()``.
+
+    :type groups: list
+    :param groups: The :class:`GroupResult` of each group.
+    """
+
+    def __init__(self, groups):
+        self.groups = groups
+
+    @property
+    def succeeded(self):
+        """The groups which were committed."""
+        return [group for group in self.groups if group.ok]
+
+    @property
+    def failed(self):
+        """The groups which weren't committed, with their status."""
+        return [group for group in self.groups if not group.ok]
+
+    def __iter__(self):
+        return iter(self.groups)
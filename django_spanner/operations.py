@@ -11,10 +11,13 @@ from datetime import datetime, time
 from uuid import UUID
 
 from django.conf import settings
+from django.db import NotSupportedError
 from django.db.backends.base.operations import BaseDatabaseOperations
+from django.db.models import Field
 from django.db.utils import DatabaseError
 from django.utils import timezone
 from django_spanner import USING_DJANGO_3
+from django_spanner.mutations import mutation_batch_size, mutations_per_row
 from django.utils.duration import duration_microseconds
 from google.cloud.spanner_dbapi.parse_utils import (
     DateStr,
@@ -22,6 +25,9 @@ from google.cloud.spanner_dbapi.parse_utils import (
     escape_name,
 )
 
+if not USING_DJANGO_3:
+    from django.db.models.constants import OnConflict
+
 
 class DatabaseOperations(BaseDatabaseOperations):
     """A Spanner-specific version of Django database operations."""
@@ -77,19 +83,79 @@ class DatabaseOperations(BaseDatabaseOperations):
 
     def bulk_batch_size(self, fields, objs):
         """
-        Override the base class method. Returns the maximum number of the
-        query parameters.
+        Override the base class method. Returns the number of objects whose
+        fields fit in the query parameters of one statement. Inserted rows
+        must also fit in the mutation limit of a commit, see
+        :meth:`rows_per_write`.
 
         :type fields: list
-        :param fields: Currently not used.
+        :param fields: The fields of the rows. Inserts pass Field objects,
+                       other operations field names.
 
         :type objs: list
         :param objs: Currently not used.
 
         :rtype: int
-        :returns: The maximum number of query parameters (constant).
+        :returns: The maximum number of objects in a batch.
         """
-        return self.connection.features.max_query_params
+        max_query_params = self.connection.features.max_query_params
+        if not fields:
+            return max_query_params
+        if not all(isinstance(field, Field) for field in fields):
+            return max(max_query_params // len(fields), 1)
+        columns = [field.column for field in fields]
+        if self.connection.can_buffer_mutations():
+            return self.rows_per_write(fields[0].model, columns)
+        return self.rows_per_statement(fields[0].model, columns)
+
+    def rows_per_write(self, model, columns):
+        """The number of rows of `model` to write at once with mutations.
+
+        That is as many rows as the mutation limit of a commit allows,
+        counting the writes of secondary indexes, and as the connection's
+        :class:`~django_spanner.mutations.BatchSizer` chose for the table.
+
+        :type model: :class:`~django.db.models.Model`
+        :param model: The model of the rows.
+
+        :type columns: list
+        :param columns: The names of the written columns.
+
+        :rtype: int
+        :returns: The number of rows.
+        """
+        size = mutation_batch_size(mutations_per_row(model, columns))
+        return self.connection.bulk_batch_sizer.batch_size(
+            model._meta.db_table, size
+        )
+
+    def rows_per_statement(self, model, columns):
+        """The number of rows of `model` to insert with one DML statement.
+
+        That is as many rows as the query parameters of a statement and the
+        mutation limit of a commit allow, and as the connection's DML
+        :class:`~django_spanner.mutations.BatchSizer` chose for the table.
+
+        :type model: :class:`~django.db.models.Model`
+        :param model: The model of the rows.
+
+        :type columns: list
+        :param columns: The names of the inserted columns.
+
+        :rtype: int
+        :returns: The number of rows.
+        """
+        size = min(
+            mutation_batch_size(mutations_per_row(model, columns)),
+            max(
+                self.connection.features.max_query_params
+                // max(len(columns), 1),
+                1,
+            ),
+        )
+        return self.connection.bulk_dml_sizer.batch_size(
+            model._meta.db_table, size
+        )
 
     def bulk_insert_sql(self, fields, placeholder_rows):
         """
@@ -109,6 +175,91 @@ class DatabaseOperations(BaseDatabaseOperations):
         values_sql = ", ".join("(%s)" % sql for sql in placeholder_rows_sql)
         return "VALUES " + values_sql
 
+    if USING_DJANGO_3:
+
+        def insert_statement(self, ignore_conflicts=False):
+            """The beginning of an INSERT statement.
+
+            :type ignore_conflicts: bool
+            :param ignore_conflicts: (Optional) Whether to skip rows which
+                                     exist.
+
+            :rtype: str
+            :returns: ``INSERT OR IGNORE INTO`` to skip existing rows,
+                      ``INSERT INTO`` otherwise.
+            """
+            if ignore_conflicts:
+                return "INSERT OR IGNORE INTO"
+            return super().insert_statement(ignore_conflicts=False)
+
+    else:
+
+        def insert_statement(self, on_conflict=None):
+            """The beginning of an INSERT statement.
+
+            :type on_conflict: :class:`~django.db.models.constants.OnConflict`
+            :param on_conflict: (Optional) What to do with rows which exist.
+
+            :rtype: str
+            :returns: ``INSERT OR UPDATE INTO`` to update existing rows,
+                      ``INSERT OR IGNORE INTO`` to skip them, ``INSERT INTO``
+                      otherwise.
+            """
+            if on_conflict == OnConflict.UPDATE:
+                return "INSERT OR UPDATE INTO"
+            if on_conflict == OnConflict.IGNORE:
+                return "INSERT OR IGNORE INTO"
+            return super().insert_statement(on_conflict=on_conflict)
+
+        def on_conflict_suffix_sql(
+            self, fields, on_conflict, update_fields, unique_fields
+        ):
+            """Check an upsert can be done by INSERT OR UPDATE.
+
+            Spanner has no suffix for conflicts, see :meth:`insert_statement`.
+
+            :rtype: str
+            :returns: An empty string.
+            """
+            if on_conflict == OnConflict.UPDATE:
+                self.check_update_conflicts(
+                    fields, update_fields, unique_fields
+                )
+            return ""
+
+    def check_update_conflicts(self, fields, update_fields, unique_fields):
+        """Reject upserts which INSERT OR UPDATE can't do.
+
+        Conflicts are only detected on the primary key, and the existing
+        rows get all the inserted values.
+
+        :type fields: list
+        :param fields: The inserted fields.
+
+        :type update_fields: list
+        :param update_fields: The columns to update on conflicts.
+
+        :type unique_fields: list
+        :param unique_fields: The columns which can conflict.
+
+        :raises: :class:`~django.db.NotSupportedError` if the upsert can't be
+                 done.
+        """
+        pk = fields[0].model._meta.pk
+        if list(unique_fields) != [pk.column]:
+            raise NotSupportedError(
+                "Cloud Spanner only detects conflicts on the primary key, "
+                "unique_fields must be ['pk']."
+            )
+        missing = {field.column for field in fields if field is not pk}
+        missing.difference_update(update_fields)
+        if missing:
+            raise NotSupportedError(
+                "Cloud Spanner updates all the inserted columns of existing "
+                "rows, update_fields must also include: %s."
+                % ", ".join(sorted(missing))
+            )
+
     def sql_flush(
         self, style, tables, reset_sequences=False, allow_cascade=False
     ):
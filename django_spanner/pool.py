@@ -0,0 +1,376 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Session pools configured through the ``OPTIONS`` of a database."""
+
+import logging
+import queue
+import threading
+import weakref
+
+from django.core.exceptions import ImproperlyConfigured
+from google.cloud.spanner_v1 import BatchCreateSessionsRequest, Session
+from google.cloud.spanner_v1 import pool
+from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+
+logger = logging.getLogger(__name__)
+
+# OPTIONS keys which configure the session pool.
+POOL_OPTIONS = (
+    "pool_type",
+    "pool_size",
+    "pool_default_timeout",
+    "pool_ping_interval",
+    "pool_keep_alive",
+)
+
+
+class _PoolStatsMixin(object):
+    """Count the sessions handed out, created and expired by a pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._known_sessions = weakref.WeakSet()
+        self._in_use = 0
+        self._created = 0
+        self._expired = 0
+
+    @property
+    def _size(self):
+        return getattr(self, "size", None) or self.target_size
+
+    def _new_session(self):
+        session = super()._new_session()
+        with self._stats_lock:
+            self._known_sessions.add(session)
+            self._created += 1
+        return session
+
+    def get(self, *args, **kwargs):
+        idle = self._sessions.qsize()
+        created = self._created
+        session = super().get(*args, **kwargs)
+        with self._stats_lock:
+            if session not in self._known_sessions:
+                # FixedSizePool recreates expired sessions without calling
+                # _new_session().
+                self._known_sessions.add(session)
+                self._created += 1
+            # A session created although idle ones were available replaced
+            # a session which doesn't exist on the server anymore.
+            if idle and self._created > created:
+                self._expired += 1
+            self._in_use += 1
+        return session
+
+    def put(self, session):
+        try:
+            super().put(session)
+        finally:
+            with self._stats_lock:
+                self._in_use = max(self._in_use - 1, 0)
+
+    def warm_up(self):
+        """Fill the pool up to its size using BatchCreateSessions.
+
+        :rtype: int
+        :returns: The number of sessions created.
+        """
+        database = self._database
+        count = self._size - self._sessions.qsize() - self._in_use
+        if count <= 0:
+            return 0
+
+        request = BatchCreateSessionsRequest(
+            database=database.name,
+            session_count=count,
+            session_template=Session(creator_role=self.database_role),
+        )
+        metadata = _metadata_with_prefix(database.name)
+        created = 0
+        while created < count:
+            request.session_count = count - created
+            response = database.spanner_api.batch_create_sessions(
+                request=request, metadata=metadata
+            )
+            if not response.session:
+                break
+            for session_pb in response.session:
+                session = self._new_session()
+                session._session_id = session_pb.name.split("/")[-1]
+                super().put(session)
+                created += 1
+        return created
+
+    def stats(self):
+        """Health of the pool.
+
+        :rtype: dict
+        :returns: The number of sessions in use and idle, and the number of
+                  sessions created and found expired since the pool was
+                  created.
+        """
+        with self._stats_lock:
+            return {
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": self._sessions.qsize(),
+                "created": self._created,
+                "expired": self._expired,
+            }
+
+    def close(self):
+        """Stop the background work of the pool, if any."""
+
+
+class FixedSizePool(_PoolStatsMixin, pool.FixedSizePool):
+    """A :class:`~google.cloud.spanner_v1.pool.FixedSizePool` with stats."""
+
+
+class BurstyPool(_PoolStatsMixin, pool.BurstyPool):
+    """A :class:`~google.cloud.spanner_v1.pool.BurstyPool` with stats."""
+
+
+class PingingPool(_PoolStatsMixin, pool.PingingPool):
+    """A :class:`~google.cloud.spanner_v1.pool.PingingPool` with stats.
+
+    :type keep_alive: float
+    :param keep_alive: (Optional) Seconds between the runs of a background
+                       thread pinging the idle sessions of the pool.
+    """
+
+    def __init__(self, *args, keep_alive=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keep_alive = keep_alive
+        self._keep_alive_thread = None
+        self._stopped = threading.Event()
+
+    def bind(self, database):
+        super().bind(database)
+        if self.keep_alive and self._keep_alive_thread is None:
+            self._keep_alive_thread = threading.Thread(
+                target=self._run_keep_alive,
+                name="django_spanner-keep-alive-%s" % database.name,
+                daemon=True,
+            )
+            self._keep_alive_thread.start()
+
+    def _run_keep_alive(self):
+        while not self._stopped.wait(self.keep_alive):
+            try:
+                self.ping()
+            except Exception:
+                logger.warning(
+                    "Pinging the sessions of %s failed.",
+                    self._database.name,
+                    exc_info=True,
+                )
+
+    def ping(self):
+        created = self._created
+        super().ping()
+        with self._stats_lock:
+            self._expired += self._created - created
+
+    def close(self):
+        self._stopped.set()
+
+
+class AliasPool(pool.AbstractSessionPool):
+    """The share of one ``DATABASES`` alias in a pool used by several aliases.
+
+    Sessions are taken from and returned to the shared pool, which also
+    creates them; this pool only limits how many of them the alias may hold
+    at the same time.
+
+    :type pool: :class:`~google.cloud.spanner_v1.pool.AbstractSessionPool`
+    :param pool: The pool shared by the aliases.
+
+    :type alias: str
+    :param alias: The alias using this pool.
+
+    :type max_sessions: int
+    :param max_sessions: (Optional) The maximum number of sessions the alias
+                         may hold at once. Unlimited if not given.
+    """
+
+    # Seconds to wait for a session when the alias holds max_sessions of
+    # them and the shared pool has no timeout of its own.
+    DEFAULT_TIMEOUT = 10
+
+    def __init__(self, pool, alias, max_sessions=None):
+        super().__init__(labels=pool.labels, database_role=pool.database_role)
+        self._pool = pool
+        self.alias = alias
+        self.max_sessions = max_sessions
+        self.default_timeout = (
+            getattr(pool, "default_timeout", None) or self.DEFAULT_TIMEOUT
+        )
+        self._semaphore = (
+            threading.BoundedSemaphore(max_sessions) if max_sessions else None
+        )
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+
+    def bind(self, database):
+        """Associate the pool with the alias' database.
+
+        The sessions are created by the shared pool, bound to the shared
+        database, so nothing is created here.
+        """
+        self._database = database
+
+    def get(self, timeout=None):
+        """Check out a session from the shared pool.
+
+        :type timeout: int
+        :param timeout: Seconds to block waiting for the alias to release a
+                        session when it holds ``max_sessions`` of them.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: An existing session from the shared pool.
+
+        :raises: :exc:`queue.Empty` if the alias holds ``max_sessions``
+                 sessions for longer than the timeout.
+        """
+        if self._semaphore is not None:
+            if timeout is None:
+                timeout = self.default_timeout
+            if not self._semaphore.acquire(timeout=timeout):
+                raise queue.Empty(
+                    "Alias %r holds its maximum of %d sessions."
+                    % (self.alias, self.max_sessions)
+                )
+        try:
+            session = self._pool.get()
+        except Exception:
+            if self._semaphore is not None:
+                self._semaphore.release()
+            raise
+        with self._stats_lock:
+            self._in_use += 1
+        return session
+
+    def put(self, session):
+        """Return a session to the shared pool.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: The session being returned.
+        """
+        try:
+            self._pool.put(session)
+        finally:
+            with self._stats_lock:
+                self._in_use = max(self._in_use - 1, 0)
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def clear(self):
+        """Keep the sessions, as they belong to the shared pool."""
+
+    def _new_session(self):
+        return self._pool._new_session()
+
+    def warm_up(self):
+        """Warm up the shared pool.
+
+        :rtype: int
+        :returns: The number of sessions created.
+        """
+        warm_up = getattr(self._pool, "warm_up", None)
+        return warm_up() if warm_up is not None else 0
+
+    def stats(self):
+        """Health of the shared pool and the share of the alias.
+
+        :rtype: dict
+        :returns: The stats of the shared pool, or None if it doesn't keep
+                  stats, with the number of sessions held by the alias and
+                  its limit.
+        """
+        stats = getattr(self._pool, "stats", None)
+        if stats is None:
+            return None
+        stats = stats()
+        with self._stats_lock:
+            stats["alias"] = self.alias
+            stats["alias_in_use"] = self._in_use
+        stats["max_sessions"] = self.max_sessions
+        return stats
+
+    def close(self):
+        """Nothing to stop, the shared pool is closed by the registry."""
+
+
+POOL_TYPES = {
+    "bursty": BurstyPool,
+    "fixed": FixedSizePool,
+    "pinging": PingingPool,
+}
+
+
+def make_pool(
+    pool_type="bursty",
+    pool_size=10,
+    pool_default_timeout=None,
+    pool_ping_interval=None,
+    pool_keep_alive=None,
+    database_role=None,
+):
+    """Create a session pool from the ``OPTIONS`` of a database.
+
+    :type pool_type: str
+    :param pool_type: (Optional) One of "bursty" (the default), "fixed" or
+                      "pinging".
+
+    :type pool_size: int
+    :param pool_size: (Optional) The number of sessions kept by the pool,
+                      which are also created when the pool is warmed up.
+
+    :type pool_default_timeout: float
+    :param pool_default_timeout: (Optional) Seconds to wait for a session
+                                 of a fixed or pinging pool.
+
+    :type pool_ping_interval: float
+    :param pool_ping_interval: (Optional) Seconds after which an idle
+                               session of a pinging pool is pinged.
+
+    :type pool_keep_alive: float
+    :param pool_keep_alive: (Optional) Seconds between the runs of the
+                            background thread pinging a pinging pool.
+
+    :type database_role: str
+    :param database_role: (Optional) The database role of the sessions.
+
+    :rtype: :class:`~google.cloud.spanner_v1.pool.AbstractSessionPool`
+    :returns: A new session pool.
+
+    :raises: :class:`~django.core.exceptions.ImproperlyConfigured` for an
+             unknown pool type or options not supported by it.
+    """
+    if pool_type not in POOL_TYPES:
+        raise ImproperlyConfigured(
+            "Unknown pool_type %r, expected one of: %s."
+            % (pool_type, ", ".join(sorted(POOL_TYPES)))
+        )
+    if pool_type != "pinging" and (pool_ping_interval or pool_keep_alive):
+        raise ImproperlyConfigured(
+            "pool_ping_interval and pool_keep_alive require "
+            "pool_type 'pinging'."
+        )
+
+    if pool_type == "bursty":
+        return BurstyPool(target_size=pool_size, database_role=database_role)
+
+    kwargs = {"size": pool_size, "database_role": database_role}
+    if pool_default_timeout is not None:
+        kwargs["default_timeout"] = pool_default_timeout
+    if pool_type == "fixed":
+        return FixedSizePool(**kwargs)
+    if pool_ping_interval is not None:
+        kwargs["ping_interval"] = pool_ping_interval
+    return PingingPool(keep_alive=pool_keep_alive, **kwargs)
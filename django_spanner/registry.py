@@ -0,0 +1,372 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Process-wide cache of Cloud Spanner Client, Instance and Database objects.
+
+Creating a :class:`~google.cloud.spanner_v1.client.Client` means credential
+discovery, and every :class:`~google.cloud.spanner_v1.database.Database`
+opens its own gRPC channel and session pool. Django creates a new DB API
+connection per thread and whenever ``CONN_MAX_AGE`` expires, so these objects
+are cached here and shared by all connections of the process.
+
+``DATABASES`` aliases pointing at the same Spanner database share one
+Database, and with it the channel and the session pool. Each alias gets a
+light-weight view of it, limiting the sessions the alias may hold.
+"""
+
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from google.api_core.gapic_v1.client_info import ClientInfo
+from google.cloud import spanner
+from google.cloud.spanner_dbapi.version import DEFAULT_USER_AGENT, PY_VERSION
+from google.cloud.spanner_v1.database import Database
+
+from .pool import AliasPool, make_pool
+
+# OPTIONS keys which are used to build the Client.
+CLIENT_OPTIONS = (
+    "client",
+    "credentials",
+    "client_options",
+    "route_to_leader_enabled",
+    "user_agent",
+)
+# OPTIONS keys which are used to build the Database.
+DATABASE_OPTIONS = ("pool", "database_role", "max_sessions")
+
+
+def _freeze(value):
+    """Turn an option value into something usable as a part of a cache key.
+
+    Unhashable values (and objects like clients or pools, which are compared
+    by identity anyway) are represented by their id. The registry keeps a
+    reference to every cached object built from them, so the id can't be
+    reused while the entry exists.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return value
+    return ("id", id(value))
+
+
+class _AliasDatabase(Database):
+    """The Database of one alias, sharing the channel of the target one.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: The Database shared by the aliases.
+
+    :type pool: :class:`~django_spanner.pool.AliasPool`
+    :param pool: The share of the alias in the pool of `database`.
+    """
+
+    def __init__(self, database, pool):
+        super().__init__(
+            database.database_id,
+            database._instance,
+            pool=pool,
+            database_role=database.database_role,
+        )
+        self.shared_database = database
+
+    @property
+    def spanner_api(self):
+        """The API client (and channel) of the shared Database."""
+        spanner_api = self.shared_database.spanner_api
+        self._channel_id = self.shared_database._channel_id
+        return spanner_api
+
+
+class Registry(object):
+    """Thread-safe cache of Spanner objects, keyed by their configuration.
+
+    Clients are keyed by project and client options, instances and databases
+    additionally by their IDs (and for databases, the pool and database role).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clients = {}
+        self._instances = {}
+        self._databases = {}
+        # The pool options of each cached database and the alias which
+        # configured them first.
+        self._pool_options = {}
+        self._alias_databases = {}
+        self._stats = {
+            "clients_created": 0,
+            "instances_created": 0,
+            "databases_created": 0,
+            "channels_created": 0,
+            "cache_hits": 0,
+        }
+
+    def _client_key(self, project, **client_kwargs):
+        return (project, _freeze(client_kwargs))
+
+    def get_client(
+        self,
+        project,
+        client=None,
+        credentials=None,
+        client_options=None,
+        route_to_leader_enabled=True,
+        user_agent=None,
+    ):
+        """Return the cached Client for the given project and options.
+
+        :type project: str
+        :param project: The ID of the project which owns the instances.
+
+        :type client: :class:`~google.cloud.spanner_v1.client.Client`
+        :param client: (Optional) A Client provided by the user. It's used
+                       as it is, and other client options are ignored.
+
+        :type credentials: Union[:class:`~google.auth.credentials.Credentials`, str]
+        :param credentials: (Optional) The credentials or a path to a service
+                            account JSON file.
+
+        :type client_options: Union[dict, :class:`~google.api_core.client_options.ClientOptions`]
+        :param client_options: (Optional) Client options, e.g. the endpoint.
+
+        :type route_to_leader_enabled: bool
+        :param route_to_leader_enabled: (Optional) Leader aware routing flag.
+
+        :type user_agent: str
+        :param user_agent: (Optional) User agent used for the requests.
+
+        :rtype: :class:`~google.cloud.spanner_v1.client.Client`
+        :returns: The shared Client.
+
+        :raises: :class:`ValueError` if a user-provided client belongs to a
+                 different project.
+        """
+        if client is not None:
+            if project is not None and client.project != project:
+                raise ValueError(
+                    "project in settings does not match client object project"
+                )
+            return client
+
+        key = self._client_key(
+            project,
+            credentials=credentials,
+            client_options=client_options,
+            route_to_leader_enabled=route_to_leader_enabled,
+            user_agent=user_agent,
+        )
+        with self._lock:
+            if key in self._clients:
+                self._stats["cache_hits"] += 1
+                return self._clients[key]
+
+            client_info = ClientInfo(
+                user_agent=user_agent or DEFAULT_USER_AGENT,
+                python_version=PY_VERSION,
+                client_library_version=spanner.__version__,
+            )
+            if isinstance(credentials, str):
+                client = spanner.Client.from_service_account_json(
+                    credentials,
+                    project=project,
+                    client_info=client_info,
+                    route_to_leader_enabled=route_to_leader_enabled,
+                )
+            else:
+                client = spanner.Client(
+                    project=project,
+                    credentials=credentials,
+                    client_info=client_info,
+                    route_to_leader_enabled=route_to_leader_enabled,
+                    client_options=client_options,
+                )
+            self._clients[key] = client
+            self._stats["clients_created"] += 1
+            return client
+
+    def get_instance(self, project, instance_id, **client_kwargs):
+        """Return the cached Instance.
+
+        :type project: str
+        :param project: The ID of the project which owns the instance.
+
+        :type instance_id: str
+        :param instance_id: The ID of the instance.
+
+        :param client_kwargs: Options passed to :meth:`get_client`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.instance.Instance`
+        :returns: The shared Instance.
+        """
+        key = (self._client_key(project, **client_kwargs), instance_id)
+        with self._lock:
+            if key in self._instances:
+                self._stats["cache_hits"] += 1
+                return self._instances[key]
+
+            client = self.get_client(project, **client_kwargs)
+            instance = client.instance(instance_id)
+            self._instances[key] = instance
+            self._stats["instances_created"] += 1
+            return instance
+
+    def get_database(
+        self,
+        project,
+        instance_id,
+        database_id,
+        pool=None,
+        database_role=None,
+        pool_options=None,
+        alias=None,
+        max_sessions=None,
+        **client_kwargs
+    ):
+        """Return the cached Database together with its session pool.
+
+        The Database is shared by all the aliases pointing at it. If an
+        `alias` is given, a Database of that alias is returned, using the
+        channel and the session pool of the shared one.
+
+        :type project: str
+        :param project: The ID of the project which owns the instance.
+
+        :type instance_id: str
+        :param instance_id: The ID of the instance.
+
+        :type database_id: str
+        :param database_id: The ID of the database.
+
+        :type pool: :class:`~google.cloud.spanner_v1.pool.AbstractSessionPool`
+        :param pool: (Optional) Session pool to be used by the database.
+
+        :type database_role: str
+        :param database_role: (Optional) The database role to connect as.
+
+        :type pool_options: dict
+        :param pool_options: (Optional) Options passed to
+                             :func:`~django_spanner.pool.make_pool` to create
+                             the pool if no `pool` is given.
+
+        :type alias: str
+        :param alias: (Optional) The ``DATABASES`` alias asking for the
+                      database.
+
+        :type max_sessions: int
+        :param max_sessions: (Optional) The maximum number of sessions the
+                             `alias` may hold at once.
+
+        :param client_kwargs: Options passed to :meth:`get_client`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.Database`
+        :returns: The shared Database, or the Database of the alias.
+
+        :raises: :class:`~django.core.exceptions.ImproperlyConfigured` if
+                 aliases pointing at the same database configure different
+                 pools, or if `max_sessions` is given without an alias.
+        """
+        if max_sessions is not None and alias is None:
+            raise ImproperlyConfigured("max_sessions requires an alias.")
+
+        key = (
+            self._client_key(project, **client_kwargs),
+            instance_id,
+            database_id,
+            _freeze(pool),
+            database_role,
+        )
+        with self._lock:
+            database = self._get_shared_database(
+                key,
+                project,
+                instance_id,
+                database_id,
+                pool,
+                database_role,
+                pool_options,
+                alias,
+                client_kwargs,
+            )
+            if alias is None:
+                return database
+
+            alias_key = (alias, key, max_sessions)
+            if alias_key not in self._alias_databases:
+                self._alias_databases[alias_key] = _AliasDatabase(
+                    database, AliasPool(database._pool, alias, max_sessions)
+                )
+            return self._alias_databases[alias_key]
+
+    def _get_shared_database(
+        self,
+        key,
+        project,
+        instance_id,
+        database_id,
+        pool,
+        database_role,
+        pool_options,
+        alias,
+        client_kwargs,
+    ):
+        frozen_options = _freeze(pool_options or {})
+        if key in self._databases:
+            options, owner = self._pool_options[key]
+            if options != frozen_options:
+                raise ImproperlyConfigured(
+                    "Databases %r and %r point at the same Spanner database "
+                    "and share its session pool, so they must use the same "
+                    "pool options. Use max_sessions to limit the sessions "
+                    "of an alias." % (owner, alias)
+                )
+            self._stats["cache_hits"] += 1
+            return self._databases[key]
+
+        instance = self.get_instance(project, instance_id, **client_kwargs)
+        if pool is None:
+            pool = make_pool(
+                database_role=database_role, **(pool_options or {})
+            )
+        database = instance.database(
+            database_id, pool=pool, database_role=database_role
+        )
+        self._databases[key] = database
+        self._pool_options[key] = (frozen_options, alias)
+        self._stats["databases_created"] += 1
+        # Every Database opens its own data-plane gRPC channel.
+        self._stats["channels_created"] += 1
+        return database
+
+    def stats(self):
+        """Counters of the objects created by this registry.
+
+        :rtype: dict
+        :returns: Number of clients, instances, databases and channels
+                  created, and the number of cache hits.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self):
+        """Forget all the cached objects and reset the counters."""
+        with self._lock:
+            for database in self._databases.values():
+                close = getattr(database._pool, "close", None)
+                if close is not None:
+                    close()
+            self._clients.clear()
+            self._instances.clear()
+            self._databases.clear()
+            self._pool_options.clear()
+            self._alias_databases.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+registry = Registry()
@@ -0,0 +1,80 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Database routers for Cloud Spanner."""
+
+import random
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class ReadReplicaRouter(object):
+    """Send reads to read-only databases and writes to their primary.
+
+    Every Spanner database with the ``read_only`` option is a replica of the
+    database named by its ``primary`` option (``"default"`` if not given).
+    Reads go to one of the replicas of the database of the instance they
+    start from, or of the default database, unless that database is in a
+    transaction, which has to see its own writes. Writes of instances read
+    from a replica go to its primary.
+
+    Enable it with::
+
+        DATABASE_ROUTERS = ["django_spanner.routers.ReadReplicaRouter"]
+    """
+
+    def __init__(self):
+        self._replicas = None
+
+    @property
+    def replicas(self):
+        """The read-only databases of every primary database.
+
+        :rtype: dict
+        :returns: Lists of replica aliases by primary alias.
+        """
+        if self._replicas is None:
+            replicas = {}
+            for alias, settings_dict in connections.settings.items():
+                if settings_dict["ENGINE"] != "django_spanner":
+                    continue
+                options = settings_dict.get("OPTIONS", {})
+                if options.get("read_only"):
+                    primary = options.get("primary", DEFAULT_DB_ALIAS)
+                    replicas.setdefault(primary, []).append(alias)
+            self._replicas = replicas
+        return self._replicas
+
+    def _primary(self, db):
+        for primary, replicas in self.replicas.items():
+            if db in replicas:
+                return primary
+        return db
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get("instance")
+        primary = instance._state.db if instance is not None else None
+        primary = self._primary(primary or DEFAULT_DB_ALIAS)
+        replicas = self.replicas.get(primary)
+        if not replicas or connections[primary].in_atomic_block:
+            return None
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return self._primary(instance._state.db)
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if self._primary(obj1._state.db) == self._primary(obj2._state.db):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        if self._primary(db) != db:
+            return False
+        return None
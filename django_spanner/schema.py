@@ -3,14 +3,22 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file or at
 # https://developers.google.com/open-source/licenses/bsd
+import decimal
+import logging
+import math
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-from django.db import NotSupportedError
+from django.db import NotSupportedError, connections
 from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from google.cloud.spanner_dbapi.types import DateStr, TimestampStr
 from django_spanner._opentelemetry_tracing import trace_call
 from django_spanner import USE_EMULATOR, USING_DJANGO_3
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
     """
@@ -46,6 +54,24 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
     sql_alter_column_null = "ALTER COLUMN %(column)s %(type)s"
     sql_alter_column_not_null = "ALTER COLUMN %(column)s %(type)s NOT NULL"
     sql_alter_column_type = "ALTER COLUMN %(column)s %(type)s"
+    sql_alter_column_default = (
+        "ALTER COLUMN %(column)s SET DEFAULT (%(default)s)"
+    )
+    sql_alter_column_no_default = "ALTER COLUMN %(column)s DROP DEFAULT"
+    sql_alter_column_no_default_null = sql_alter_column_no_default
+
+    # The column types whose defaults can be literals in a DEFAULT clause.
+    # The defaults of the other columns are set on the existing rows by
+    # backfill_column().
+    literal_default_types = (
+        "BOOL",
+        "DATE",
+        "FLOAT64",
+        "INT64",
+        "NUMERIC",
+        "STRING",
+        "TIMESTAMP",
+    )
 
     sql_delete_column = "ALTER TABLE %(table)s DROP COLUMN %(column)s"
     # Spanner does not suppport ON DELETE CASCADE for foreign keys.
@@ -53,6 +79,51 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
     # sql_create_inline_fk = "CONSTRAINT FK_%(to_table)s_%(to_column)s_%(from_table)s_%(from_column)s FOREIGN KEY (%(from_column_norm)s) REFERENCES %(to_table_norm)s  (%(to_column_norm)s)"  # noqa
     sql_create_inline_fk = None
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Backfills of added columns waiting to run in parallel, see
+        # backfill_column().
+        self._pending_backfills = []
+
+    def __enter__(self):
+        super().__enter__()
+        # The DDL statements of the editor run together, in as few
+        # operations as the statements of other kinds in between allow.
+        self._ends_ddl_batch = (
+            not self.collect_sql and self.connection.start_ddl_batch()
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.run_pending_backfills()
+            else:
+                self._pending_backfills = []
+            result = super().__exit__(exc_type, exc_value, traceback)
+        except Exception:
+            if self._ends_ddl_batch:
+                self.connection.end_ddl_batch(flush=False)
+            raise
+        if self._ends_ddl_batch:
+            self.connection.end_ddl_batch(flush=exc_type is None)
+        return result
+
+    def execute(self, sql, params=(), run_backfills=True):
+        """Execute a statement, after the pending backfills.
+
+        :meth:`add_field` adds columns without waiting for the backfills,
+        so that the columns added one after the other are backfilled
+        together.
+
+        :type run_backfills: bool
+        :param run_backfills: (Optional) Whether to run the pending
+                              backfills first.
+        """
+        if run_backfills and self._pending_backfills:
+            self.run_pending_backfills()
+        return super().execute(sql, params)
+
     def create_model(self, model):
         """
         Create a table and any accompanying indexes or unique constraints for
@@ -234,9 +305,15 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
             and field.remote_field.through._meta.auto_created
         ):
             return self.create_model(field.remote_field.through)
+        # Existing rows take the column's default, so a NOT NULL column
+        # with a default is added without rewriting the table.
+        include_default = not self.skip_default(field)
         # Get the column's definition
         definition, params = self.column_sql(
-            model, field, exclude_not_null=True
+            model,
+            field,
+            include_default=include_default,
+            exclude_not_null=not include_default,
         )
         # It might not actually have a column behind it
         if definition is None:
@@ -259,32 +336,41 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
             "column": self.quote_name(field.column),
             "definition": definition,
         }
-        self.execute(sql, params)
-        # Set defaults values on existing rows. (Django usually uses-database
-        # defaults for this but Spanner doesn't support them.)
-        effective_default = self.effective_default(field)
-        if effective_default is not None:
-            self.execute(
-                "UPDATE %(table)s SET %(column)s=%%s"
-                % {
-                    "table": self.quote_name(model._meta.db_table),
-                    "column": self.quote_name(field.column),
-                },
-                (effective_default,),
+        self.execute(sql, params, run_backfills=False)
+        if include_default:
+            # Django sets the values of new rows, so the default is dropped,
+            # as on other databases.
+            changes_sql, params = self._alter_column_default_sql(
+                model, None, field, drop=True
             )
-        # Spanner doesn't support adding NOT NULL columns to existing tables.
-        if not field.null:
             self.execute(
                 self.sql_alter_column
                 % {
                     "table": self.quote_name(model._meta.db_table),
-                    "changes": self.sql_alter_column_not_null
-                    % {
-                        "column": self.quote_name(field.column),
-                        "type": db_params["type"],
-                    },
-                }
+                    "changes": changes_sql,
+                },
+                params,
             )
+        # Spanner doesn't support adding NOT NULL columns without a default
+        # to existing tables.
+        not_null_sql = None
+        if not field.null and not include_default:
+            not_null_sql = self.sql_alter_column % {
+                "table": self.quote_name(model._meta.db_table),
+                "changes": self.sql_alter_column_not_null
+                % {
+                    "column": self.quote_name(field.column),
+                    "type": db_params["type"],
+                },
+            }
+        # Set the defaults which aren't literals on the existing rows.
+        effective_default = (
+            None if include_default else self.effective_default(field)
+        )
+        if effective_default is not None:
+            self.backfill_column(model, field, effective_default, not_null_sql)
+        elif not_null_sql is not None:
+            self.execute(not_null_sql)
         # Add an index, if required
         self.deferred_sql.extend(self._field_indexes_sql(model, field))
         # Create a unique constraint separately because Spanner doesn't allow
@@ -310,6 +396,95 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
                 )
             )
 
+    def backfill_column(self, model, field, value, not_null_sql=None):
+        """Set a column added to a table to a value in the existing rows.
+
+        The rows are updated by a Partitioned DML statement, which isn't
+        limited by the mutations of a commit, and `not_null_sql` runs once
+        they all are. With the ``backfill_parallelism`` option above 1, the
+        backfills of the columns added one after the other run in parallel,
+        before the next statement other than adding a column. In a
+        transaction, or when the SQL is only collected, the rows are
+        updated by an ``UPDATE`` statement.
+
+        :type model: :class:`~django.db.models.Model`
+        :param model: The model of the table.
+
+        :type field: :class:`~django.db.models.Field`
+        :param field: The field of the column.
+
+        :type value: object
+        :param value: The value of the column.
+
+        :type not_null_sql: str
+        :param not_null_sql: (Optional) The statement making the column
+                             NOT NULL.
+        """
+        sql = "UPDATE %(table)s SET %(column)s=%%s" % {
+            "table": self.quote_name(model._meta.db_table),
+            "column": self.quote_name(field.column),
+        }
+        if self.collect_sql or self.connection.in_atomic_block:
+            self.execute(sql, (value,))
+            if not_null_sql is not None:
+                self.execute(not_null_sql)
+            return
+        self._pending_backfills.append(
+            (model._meta.db_table, field.column, sql, (value,), not_null_sql)
+        )
+        if self._backfill_parallelism() < 2:
+            self.run_pending_backfills()
+
+    def run_pending_backfills(self):
+        """Run the backfills waiting to run in parallel."""
+        backfills, self._pending_backfills = self._pending_backfills, []
+        if not backfills:
+            return
+        parallelism = min(self._backfill_parallelism(), len(backfills))
+        if parallelism < 2:
+            for backfill in backfills:
+                self._backfill(self.connection, *backfill)
+        else:
+            # The added columns must exist for the other connections.
+            self.connection.ensure_connection()
+            with self.connection.wrap_database_errors:
+                self.connection.connection.run_prior_DDL_statements()
+            with ThreadPoolExecutor(max_workers=parallelism) as executor:
+                futures = [
+                    executor.submit(self._backfill_in_thread, *backfill)
+                    for backfill in backfills
+                ]
+                for future in futures:
+                    future.result()
+        for backfill in backfills:
+            not_null_sql = backfill[-1]
+            if not_null_sql is not None:
+                self.execute(not_null_sql)
+
+    def _backfill_parallelism(self):
+        options = self.connection.settings_dict["OPTIONS"]
+        return options.get("backfill_parallelism", 1)
+
+    def _backfill(self, connection, table, column, sql, params, not_null_sql):
+        logger.info("Backfilling %s.%s with Partitioned DML.", table, column)
+        start = time.monotonic()
+        rows = connection.execute_partitioned_dml(sql, params)
+        logger.info(
+            "Backfilled at least %d rows of %s.%s in %.1f seconds%s.",
+            rows,
+            table,
+            column,
+            time.monotonic() - start,
+            ", making it NOT NULL" if not_null_sql is not None else "",
+        )
+
+    def _backfill_in_thread(self, *backfill):
+        connection = connections[self.connection.alias]
+        try:
+            self._backfill(connection, *backfill)
+        finally:
+            connection.close()
+
     def remove_field(self, model, field):
         """
         Remove the column(s) representing the field from the model's table,
@@ -389,6 +564,11 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
             null = True
         if not null and not exclude_not_null:
             sql += " NOT NULL"
+        # Spanner requires the default after NOT NULL.
+        if include_default:
+            default = self.prepare_default(self.effective_default(field))
+            if default is not None:
+                sql += " DEFAULT " + self._column_default_sql(field) % default
         # Optionally add the tablespace if it's an implicitly indexed column
         tablespace = field.db_tablespace or model._meta.db_tablespace
         if (
@@ -579,6 +759,60 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
             self.deferred_sql.append(sql)
         return None
 
+    def prepare_default(self, value):
+        """Return the literal of a default value of a column.
+
+        :type value: object
+        :param value: The default value, prepared for the database.
+
+        :rtype: str
+        :returns: The literal, or None if the value has no literal.
+        """
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else None
+        if isinstance(value, decimal.Decimal):
+            return "NUMERIC '%s'" % value if value.is_finite() else None
+        if isinstance(value, DateStr):
+            return "DATE '%s'" % value
+        if isinstance(value, TimestampStr):
+            return "TIMESTAMP '%s'" % value
+        if isinstance(value, str):
+            return "'%s'" % (
+                value.replace("\\", "\\\\")
+                .replace("'", "\\'")
+                .replace("\n", "\\n")
+                .replace("\r", "\\r")
+            )
+        return None
+
+    def _column_default_sql(self, field):
+        """Spanner requires the default expression in parentheses."""
+        return "(%s)"
+
     def skip_default(self, field):
-        """Cloud Spanner doesn't support column defaults."""
-        return True
+        """Whether the default of a field can't be a column default.
+
+        Only the literals of values of some column types are column
+        defaults.
+
+        :type field: :class:`~django.db.models.Field`
+        :param field: The field of the column.
+
+        :rtype: bool
+        :returns: True if the column can't have the default.
+        """
+        db_type = field.db_type(self.connection) or ""
+        if db_type.split("(")[0] not in self.literal_default_types:
+            return True
+        return self.prepare_default(self.effective_default(field)) is None
+
+    def skip_default_on_alter(self, field):
+        """Whether the default of a field can't be a column default.
+
+        See :meth:`skip_default`.
+        """
+        return self.skip_default(field)
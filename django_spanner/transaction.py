@@ -0,0 +1,249 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Transaction management specific to Cloud Spanner."""
+
+from contextlib import ContextDecorator
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.utils import DatabaseError
+from google.cloud.spanner_dbapi.parse_utils import classify_statement
+from google.cloud.spanner_dbapi.parsed_statement import StatementType
+
+# The statements which can be sent in an ExecuteBatchDml request. DELETE
+# statements are classified as UPDATE.
+BATCH_DML_STATEMENTS = (StatementType.INSERT, StatementType.UPDATE)
+
+
+class DmlBatch(object):
+    """DML statements waiting to be sent in one ExecuteBatchDml request.
+
+    :type connection: :class:`~django_spanner.base.DatabaseWrapper`
+    :param connection: The database wrapper the statements run on.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        # The (sql, args) of the statements not sent yet.
+        self.statements = []
+        # The row counts of the statements sent, in order.
+        self.row_counts = []
+        self.requests = 0
+        # Indexes of pending statements which must match a row.
+        self._expected = set()
+
+    def accepts(self, sql):
+        """Whether a statement can wait to be sent with the batch.
+
+        :type sql: str
+        :param sql: The SQL of the statement.
+
+        :rtype: bool
+        :returns: True for INSERT, UPDATE and DELETE statements.
+        """
+        return classify_statement(sql).statement_type in BATCH_DML_STATEMENTS
+
+    def add(self, sql, args=None):
+        """Buffer a statement.
+
+        :type sql: str
+        :param sql: The SQL of the statement.
+
+        :type args: list
+        :param args: (Optional) The parameters of the statement.
+        """
+        self.statements.append((sql, args))
+
+    def expect_rows(self):
+        """Require the statement added last to match at least one row.
+
+        The statement has reported a row count of 1 to its caller, which
+        is checked when the batch is sent.
+        """
+        self._expected.add(len(self.statements) - 1)
+
+    def flush(self):
+        """Send the pending statements in one ExecuteBatchDml request.
+
+        :rtype: list
+        :returns: The row count of each statement sent.
+
+        :raises: :class:`~django.db.utils.DatabaseError` if a statement
+                 expected to match a row matched none.
+        """
+        if not self.statements:
+            return []
+        statements, expected = self.statements, self._expected
+        self.statements, self._expected = [], set()
+        connection = self.connection.connection
+        # The DB API doesn't return the row counts of a batch run in
+        # autocommit mode, so it runs in a transaction of its own.
+        begin = not connection._client_transaction_started
+        if begin:
+            connection.begin()
+        try:
+            counts = self._run(connection, statements)
+            for index in sorted(expected):
+                if counts[index] < 1:
+                    raise DatabaseError(
+                        "The batched statement %r matched no row, but "
+                        "reported one to its caller." % statements[index][0]
+                    )
+        except Exception:
+            if begin:
+                connection.rollback()
+            raise
+        if begin:
+            connection.commit()
+        self.requests += 1
+        self.row_counts.extend(counts)
+        return counts
+
+    def _run(self, connection, statements):
+        cursor = connection.cursor()
+        connection.start_batch_dml(cursor)
+        try:
+            for sql, args in statements:
+                cursor.execute(sql, args)
+        except Exception:
+            connection.abort_batch()
+            raise
+        connection.run_batch()
+        return list(cursor._batch_dml_rows_count)
+
+    def discard(self):
+        """Drop the pending statements without sending them."""
+        self.statements = []
+        self._expected = set()
+
+
+class read_only_snapshot(ContextDecorator):
+    """Run the reads of a block in one read-only transaction.
+
+    All reads see the data at the same timestamp, and need no transaction
+    of their own. Before the first write or ``atomic()`` block the snapshot
+    ends, and the rest of the block works as usual. Can be used as a
+    decorator::
+
+        @read_only_snapshot()
+        def dashboard(request):
+            ...
+
+    :type using: str
+    :param using: (Optional) The database alias, ``"default"`` if not given.
+    """
+
+    def __init__(self, using=None):
+        self.using = using or DEFAULT_DB_ALIAS
+        self._started = []
+
+    def __enter__(self):
+        connection = connections[self.using]
+        started = (
+            connection.vendor == "spanner"
+            and connection.start_read_only_snapshot()
+        )
+        self._started.append(started)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._started.pop():
+            connections[self.using].end_read_only_snapshot()
+
+
+class batch_dml(ContextDecorator):
+    """Send the DML statements of a block in ExecuteBatchDml requests.
+
+    The INSERT, UPDATE and DELETE statements of ``save()``, ``update()``
+    and ``delete()`` are buffered, and sent together in one request when
+    the block ends, or before any other statement such as a query, a
+    commit or the start of a transaction. Outside a transaction, each
+    request runs in a transaction of its own. If the block raises, the
+    statements not sent yet are discarded.
+
+    A buffered statement doesn't know its row count, so it reports -1. An
+    UPDATE of a single row by primary key, as sent by ``save()``, reports
+    1 instead; a :class:`~django.db.utils.DatabaseError` is raised when it
+    is sent if it matched no row. The row counts of all the statements
+    sent are in the ``row_counts`` of the :class:`DmlBatch` returned by
+    the context manager::
+
+        with batch_dml() as batch:
+            for album in albums:
+                album.save()
+        print(batch.row_counts)
+
+    A nested block joins the batch of the outer one.
+
+    :type using: str
+    :param using: (Optional) The database alias, ``"default"`` if not given.
+    """
+
+    def __init__(self, using=None):
+        self.using = using or DEFAULT_DB_ALIAS
+        self._started = []
+
+    def __enter__(self):
+        connection = connections[self.using]
+        if connection.vendor != "spanner":
+            self._started.append(False)
+            return None
+        started = connection.start_dml_batch()
+        self._started.append(started)
+        return connection.dml_batch
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._started.pop():
+            connections[self.using].end_dml_batch(flush=exc_type is None)
+
+
+class mutation_session(ContextDecorator):
+    """Write the saves and deletes of a block as mutations of one commit.
+
+    The block runs in ``atomic()``. The inserts and updates of
+    ``Model.save()`` and the deletes of ``Model.delete()`` are buffered as
+    mutations and sent with the commit at the end of the block, so writing
+    many objects takes a single request::
+
+        with mutation_session():
+            for row in rows:
+                Album(**row).save()
+
+    Writes which need the server, such as updates with ``F()``
+    expressions or ``QuerySet.update()`` and ``delete()`` with filters
+    other than the primary key, run as DML. The statements of the block,
+    queries included, don't see the buffered mutations. A buffered update
+    or delete reports the rows it names, whether they exist or not; a
+    ``save()`` of some of the fields fails the commit if the row doesn't
+    exist. Nested in another ``atomic()`` block, the mutations are sent
+    with the commit of the outermost one.
+
+    :type using: str
+    :param using: (Optional) The database alias, ``"default"`` if not given.
+    """
+
+    def __init__(self, using=None):
+        self.using = using or DEFAULT_DB_ALIAS
+        self._blocks = []
+
+    def __enter__(self):
+        connection = connections[self.using]
+        atomic = transaction.atomic(using=self.using)
+        atomic.__enter__()
+        started = (
+            connection.vendor == "spanner"
+            and not connection.in_mutation_session
+        )
+        if started:
+            connection.in_mutation_session = True
+        self._blocks.append((atomic, started))
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        atomic, started = self._blocks.pop()
+        try:
+            return atomic.__exit__(exc_type, exc_value, traceback)
+        finally:
+            if started:
+                connections[self.using].in_mutation_session = False
@@ -4,6 +4,8 @@
 # license that can be found in the LICENSE file or at
 # https://developers.google.com/open-source/licenses/bsd
 
+import datetime
+
 import django
 import sqlparse
 from django.core.exceptions import ImproperlyConfigured
@@ -43,3 +45,54 @@ def add_dummy_where(sql):
     ):
         return sql
     return sql + " WHERE 1=1"
+
+
+# Keys of the DB API connection staleness option.
+STALENESS_OPTIONS = (
+    "read_timestamp",
+    "min_read_timestamp",
+    "max_staleness",
+    "exact_staleness",
+)
+# Short names of the staleness options.
+STALENESS_ALIASES = {"max": "max_staleness", "exact": "exact_staleness"}
+
+
+def parse_staleness(staleness):
+    """
+    Convert a staleness given in settings into the DB API connection format.
+
+    Staleness durations may be given in seconds, and ``max`` and ``exact``
+    are short for ``max_staleness`` and ``exact_staleness``.
+
+    :type staleness: dict
+    :param staleness: Exactly one of ``read_timestamp``,
+                      ``min_read_timestamp`` (datetimes), ``max_staleness`` or
+                      ``exact_staleness`` (timedeltas or seconds).
+
+    :rtype: dict
+    :returns: The staleness accepted by
+              :attr:`google.cloud.spanner_dbapi.connection.Connection.staleness`.
+
+    :raises: :class:`ValueError` if the staleness isn't valid.
+    """
+    if not isinstance(staleness, dict) or len(staleness) != 1:
+        raise ValueError(
+            "Staleness must be a dict with exactly one of: %s."
+            % ", ".join(STALENESS_OPTIONS)
+        )
+    ((key, value),) = staleness.items()
+    key = STALENESS_ALIASES.get(key, key)
+    if key not in STALENESS_OPTIONS:
+        raise ValueError(
+            "Unknown staleness %r, expected one of: %s."
+            % (key, ", ".join(STALENESS_OPTIONS))
+        )
+    if key.endswith("_staleness"):
+        if isinstance(value, (int, float)):
+            value = datetime.timedelta(seconds=value)
+        if not isinstance(value, datetime.timedelta):
+            raise ValueError("%s must be a timedelta or seconds." % key)
+    elif not isinstance(value, datetime.datetime):
+        raise ValueError("%s must be a datetime." % key)
+    return {key: value}
@@ -0,0 +1,307 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+"""Write-behind of model objects by background threads."""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import sql
+
+from .mutations import MAX_MUTATIONS, mutations_per_row
+
+logger = logging.getLogger(__name__)
+
+# The mutations a writer can send.
+WRITER_METHODS = ("insert", "insert_or_update", "replace", "update")
+
+# Put in the queue to stop a worker.
+_STOP = object()
+
+
+class BackgroundWriter(object):
+    """Write model objects as mutations committed by background threads.
+
+    Objects given to :meth:`write` are turned into rows and put in a
+    bounded queue. Worker threads take the rows from the queue, group them
+    by table in batches of up to `batch_rows` rows and commit each batch,
+    concurrently with each other. When the queue is full, :meth:`write`
+    blocks until the workers make room for the rows::
+
+        writer = BackgroundWriter(workers=4)
+        for event in events:
+            writer.write(event)
+        writer.close()
+
+    The workers start with the first write, or :meth:`start`. The writer
+    is also a context manager, which closes it at the end. A started
+    writer is closed when the process exits, so the rows in the queue are
+    committed.
+
+    A failed batch isn't retried. It is logged, counted in :meth:`stats`
+    and passed to `on_error`.
+
+    :type using: str
+    :param using: (Optional) The database alias, ``"default"`` if not given.
+
+    :type workers: int
+    :param workers: (Optional) The number of threads committing batches.
+
+    :type max_queue: int
+    :param max_queue: (Optional) The number of rows the queue holds.
+
+    :type batch_rows: int
+    :param batch_rows: (Optional) The maximum number of rows of a batch.
+
+    :type max_delay: float
+    :param max_delay: (Optional) The seconds a worker waits for more rows
+                      before committing a batch which isn't full.
+
+    :type on_error: callable
+    :param on_error: (Optional) Called by the workers with the exception
+                     and the rows of each failed batch.
+    """
+
+    def __init__(
+        self,
+        using=None,
+        workers=2,
+        max_queue=10000,
+        batch_rows=1000,
+        max_delay=0.1,
+        on_error=None,
+    ):
+        self.using = using or DEFAULT_DB_ALIAS
+        self.workers = workers
+        self.batch_rows = batch_rows
+        self.max_delay = max_delay
+        self.on_error = on_error
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._threads = []
+        # The mutations of a row, by (table, columns), including the ones
+        # of the secondary indexes.
+        self._row_mutations = {}
+        self._database = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._stats = {
+            "rows": 0,
+            "batches": 0,
+            "errors": 0,
+            "blocked_writes": 0,
+            "max_queue_depth": 0,
+            "last_batch_rows": None,
+            "max_batch_rows": 0,
+            "commit_seconds": 0.0,
+            "last_commit_latency": None,
+            "max_commit_latency": None,
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """Start the worker threads, if they aren't running yet."""
+        if self._closed:
+            raise RuntimeError("The writer is closed.")
+        if self._threads:
+            return
+        if self._database is None:
+            connection = connections[self.using]
+            connection.check_writable()
+            self._database, _ = connection._get_database(
+                connection.get_connection_params()
+            )
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._run,
+                name="django_spanner-writer-%s-%d" % (self.using, index),
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        atexit.register(self.close)
+
+    def write(self, obj, method="insert", timeout=None):
+        """Queue an object to be written.
+
+        :type obj: :class:`~django.db.models.Model`
+        :param obj: The object, whose fields are all written.
+
+        :type method: str
+        :param method: (Optional) The mutation writing the row, one of
+                       "insert", "insert_or_update", "replace" or "update".
+
+        :type timeout: float
+        :param timeout: (Optional) The seconds to wait for room in a full
+                        queue. Waits as long as it takes if not given.
+
+        :raises: :class:`queue.Full` if the queue stays full for `timeout`
+                 seconds, :class:`ValueError` for values which mutations
+                 can't write, like expressions, and :class:`RuntimeError`
+                 if the writer is closed.
+        """
+        self.write_many([obj], method=method, timeout=timeout)
+
+    def write_many(self, objs, method="insert", timeout=None):
+        """Queue objects of the same model to be written.
+
+        See :meth:`write`.
+
+        :type objs: list
+        :param objs: The objects.
+        """
+        if method not in WRITER_METHODS:
+            raise ValueError("Unknown mutation %r." % method)
+        objs = list(objs)
+        if not objs:
+            return
+        self.start()
+        model = type(objs[0])
+        for obj in objs:
+            obj._prepare_related_fields_for_save(operation_name="write")
+        query = sql.InsertQuery(model)
+        query.insert_values(model._meta.concrete_fields, objs)
+        mutation = query.get_compiler(using=self.using).as_mutation()
+        if mutation is None:
+            raise ValueError("Mutations can't write expressions.")
+        table, columns, rows = mutation
+        columns = tuple(columns)
+        self._row_mutations[(table, columns)] = mutations_per_row(
+            model, columns
+        )
+        for row in rows:
+            if self._queue.full():
+                with self._lock:
+                    self._stats["blocked_writes"] += 1
+            self._queue.put((method, table, columns, row), timeout=timeout)
+        with self._lock:
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], self._queue.qsize()
+            )
+
+    def flush(self):
+        """Wait until the rows queued so far are committed or failed."""
+        if self._threads:
+            self._queue.join()
+
+    def close(self):
+        """Commit the queued rows and stop the worker threads."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def stats(self):
+        """Metrics of the queue and of the batches committed.
+
+        :rtype: dict
+        :returns: The depth of the queue, the number of rows, batches,
+                  failed batches and writes which waited for room in the
+                  queue, and the size and commit latency of the batches.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["avg_batch_rows"] = (
+            stats["rows"] / stats["batches"] if stats["batches"] else None
+        )
+        stats["avg_commit_latency"] = (
+            stats["commit_seconds"] / stats["batches"]
+            if stats["batches"]
+            else None
+        )
+        return stats
+
+    def _run(self):
+        pending = None
+        while True:
+            item = pending or self._queue.get()
+            pending = None
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            items = [item]
+            mutations = self._mutations(item)
+            deadline = time.monotonic() + self.max_delay
+            while len(items) < self.batch_rows:
+                try:
+                    item = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if (
+                    item is _STOP
+                    or mutations + self._mutations(item) > MAX_MUTATIONS
+                ):
+                    pending = item
+                    break
+                items.append(item)
+                mutations += self._mutations(item)
+            self._commit(items)
+
+    def _mutations(self, item):
+        _, table, columns, _ = item
+        return self._row_mutations.get((table, columns), len(columns))
+
+    def _commit(self, items):
+        groups = {}
+        for method, table, columns, row in items:
+            groups.setdefault((method, table, columns), []).append(row)
+        start = time.monotonic()
+        try:
+            with self._database.batch() as batch:
+                for (method, table, columns), rows in groups.items():
+                    getattr(batch, method)(table, list(columns), rows)
+        except Exception as exc:
+            with self._lock:
+                self._stats["errors"] += 1
+            logger.warning(
+                "Writing a batch of %d rows to %s failed.",
+                len(items),
+                self.using,
+                exc_info=True,
+            )
+            if self.on_error is not None:
+                try:
+                    self.on_error(exc, items)
+                except Exception:
+                    logger.exception(
+                        "The on_error callback of a writer failed."
+                    )
+        else:
+            latency = time.monotonic() - start
+            with self._lock:
+                stats = self._stats
+                stats["rows"] += len(items)
+                stats["batches"] += 1
+                stats["last_batch_rows"] = len(items)
+                stats["max_batch_rows"] = max(
+                    stats["max_batch_rows"], len(items)
+                )
+                stats["commit_seconds"] += latency
+                stats["last_commit_latency"] = latency
+                stats["max_commit_latency"] = max(
+                    stats["max_commit_latency"] or 0, latency
+                )
+        finally:
+            for _ in items:
+                self._queue.task_done()
@@ -28,6 +28,7 @@ import google.cloud.spanner_v1.types.spanner as spanner
 from concurrent import futures
 import grpc
 import base64
+import datetime
 
 
 class MockSpanner:
@@ -74,6 +75,10 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
         self.sessions = {}
         self.transaction_counter = 0
         self.transactions = {}
+        # Status code and message of the failing BatchWrite groups by index.
+        self.batch_write_errors = {}
+        # Status code and message the next Commit fails with.
+        self.commit_error = None
         self._mock_spanner = MockSpanner()
 
     @property
@@ -86,6 +91,8 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def clear_requests(self):
         self._requests = []
+        self.batch_write_errors = {}
+        self.commit_error = None
 
     def CreateSession(self, request, context):
         self._requests.append(request)
@@ -195,13 +202,22 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def Commit(self, request, context):
         self._requests.append(request)
-        tx = self.transactions[request.transaction_id]
-        if tx is None:
-            raise ValueError(
-                f"Transaction not found: {request.transaction_id}"
-            )
-        del self.transactions[request.transaction_id]
-        return commit.CommitResponse()
+        if self.commit_error is not None:
+            code, message = self.commit_error
+            self.commit_error = None
+            context.abort(code, message)
+        if "single_use_transaction" not in request:
+            tx = self.transactions[request.transaction_id]
+            if tx is None:
+                raise ValueError(
+                    f"Transaction not found: {request.transaction_id}"
+                )
+            del self.transactions[request.transaction_id]
+        response = commit.CommitResponse()
+        response.commit_timestamp = datetime.datetime.now(
+            tz=datetime.timezone.utc
+        )
+        return response
 
     def Rollback(self, request, context):
         self._requests.append(request)
@@ -217,11 +233,17 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def BatchWrite(self, request, context):
         self._requests.append(request)
-        for result in [
-            spanner.BatchWriteResponse(),
-            spanner.BatchWriteResponse(),
-        ]:
-            yield result
+        for index in range(len(request.mutation_groups)):
+            response = spanner.BatchWriteResponse(indexes=[index])
+            if index in self.batch_write_errors:
+                code, message = self.batch_write_errors[index]
+                response.status.code = code
+                response.status.message = message
+            else:
+                response.commit_timestamp = datetime.datetime.now(
+                    tz=datetime.timezone.utc
+                )
+            yield response
 
 
 def start_mock_server() -> (
@@ -14,7 +14,25 @@
 
 from django.db import models
 
+from django_spanner.managers import SpannerManager
+
 
 class Singer(models.Model):
     first_name = models.CharField(max_length=200)
     last_name = models.CharField(max_length=200)
+
+
+class Album(models.Model):
+    singer = models.ForeignKey(Singer, on_delete=models.CASCADE)
+    title = models.CharField(max_length=200)
+
+    objects = SpannerManager()
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=200, unique=True)
+
+
+class Playlist(models.Model):
+    name = models.CharField(max_length=200)
+    tags = models.ManyToManyField(Tag)
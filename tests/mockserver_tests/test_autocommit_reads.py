@@ -0,0 +1,71 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+from django.db import connection
+from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+)
+from tests.mockserver_tests.models import Singer
+
+
+class TestAutocommitReads(MockServerTestBase):
+    SQL = (
+        "SELECT tests_singer.id, tests_singer.first_name, "
+        "tests_singer.last_name FROM tests_singer"
+    )
+
+    def teardown_method(self, test_method):
+        connection.settings_dict["OPTIONS"].pop("staleness", None)
+        super().teardown_method(test_method)
+
+    def _execute_sql_requests(self):
+        requests = self.spanner_service.requests
+        self.assertFalse(
+            any(
+                isinstance(request, (BeginTransactionRequest, CommitRequest))
+                for request in requests
+            )
+        )
+        return [
+            request
+            for request in requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+
+    def test_strong_single_use_read(self):
+        add_singer_query_result(self.SQL)
+        self.assertEqual(len(list(Singer.objects.all())), 2)
+        (request,) = self._execute_sql_requests()
+        self.assertTrue(request.transaction.single_use.read_only.strong)
+
+    def test_bounded_staleness_read(self):
+        connection.settings_dict["OPTIONS"]["staleness"] = {
+            "max_staleness": 15
+        }
+        add_singer_query_result(self.SQL)
+        self.assertEqual(len(list(Singer.objects.all())), 2)
+        (request,) = self._execute_sql_requests()
+        self.assertEqual(
+            request.transaction.single_use.read_only.max_staleness,
+            datetime.timedelta(seconds=15),
+        )
@@ -0,0 +1,49 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.cloud.spanner_v1 import CommitRequest
+
+from django_spanner.writer import BackgroundWriter
+from tests.mockserver_tests.mock_server_test_base import MockServerTestBase
+from tests.mockserver_tests.models import Singer
+
+
+class TestBackgroundWriter(MockServerTestBase):
+    def test_rows_are_committed_with_mutations(self):
+        singers = [
+            Singer(id=index, first_name="First", last_name="Last")
+            for index in range(1, 4)
+        ]
+        with BackgroundWriter(workers=1, max_delay=1) as writer:
+            writer.write_many(singers)
+        commits = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, CommitRequest)
+        ]
+        self.assertEqual(len(commits), 1)
+        self.assertIn("single_use_transaction", commits[0])
+        (mutation,) = commits[0].mutations
+        self.assertEqual(mutation.insert.table, "tests_singer")
+        self.assertEqual(
+            [list(row) for row in mutation.insert.values],
+            [
+                ["1", "First", "Last"],
+                ["2", "First", "Last"],
+                ["3", "First", "Last"],
+            ],
+        )
+        stats = writer.stats()
+        self.assertEqual(stats["batches"], 1)
+        self.assertEqual(stats["last_batch_rows"], 3)
@@ -13,6 +13,7 @@
 # limitations under the License.
 from google.cloud.spanner_v1 import (
     BatchCreateSessionsRequest,
+    BeginTransactionRequest,
     ExecuteSqlRequest,
     CommitRequest,
 )
@@ -22,7 +23,7 @@ from tests.mockserver_tests.mock_server_test_base import (
     add_singer_query_result,
     add_update_count,
 )
-from django.db import connection, models
+from django.db import connection, models, transaction
 
 from tests.mockserver_tests.models import Singer
 from tests.settings import DATABASES
@@ -52,6 +53,20 @@ class TestBasics(MockServerTestBase):
             cursor.execute("select 1")
             self.verify_select1(cursor.fetchall())
 
+    def test_django_reconnect_reuses_session_pool(self):
+        add_select1_result()
+        with connection.cursor() as cursor:
+            cursor.execute("select 1")
+            self.verify_select1(cursor.fetchall())
+        connection.close()
+        with connection.cursor() as cursor:
+            cursor.execute("select 1")
+            self.assertEqual(cursor.fetchall(), [(1,)])
+        # The second connection reuses the cached database and its sessions.
+        requests = self.spanner_service.requests
+        self.assertEqual(len(requests), 3)
+        self.assertIsInstance(requests[2], ExecuteSqlRequest)
+
     def test_django_select_singer(self):
         add_singer_query_result(
             "SELECT tests_singer.id, tests_singer.first_name, tests_singer.last_name FROM tests_singer"
@@ -128,3 +143,41 @@ class TestBasics(MockServerTestBase):
             for db, config in DATABASES.items():
                 if config["ENGINE"] == "django_spanner":
                     config.pop("DISABLE_RANDOM_ID_GENERATION", None)
+
+    def test_is_usable_trusts_recent_statement(self):
+        connection.settings_dict["OPTIONS"]["health_check_ttl"] = 60
+        try:
+            add_select1_result()
+            probes = connection.health_check_stats["probes"]
+            with connection.cursor() as cursor:
+                cursor.execute("select 1")
+                self.assertEqual(cursor.fetchall(), [(1,)])
+            self.assertTrue(connection.is_usable())
+            requests = self.spanner_service.requests
+            self.assertEqual(
+                len([r for r in requests if isinstance(r, ExecuteSqlRequest)]),
+                1,
+            )
+            self.assertEqual(connection.health_check_stats["probes"], probes)
+        finally:
+            connection.settings_dict["OPTIONS"].pop("health_check_ttl")
+
+    def test_atomic_begins_transaction_inline(self):
+        add_update_count(
+            "INSERT INTO tests_singer "
+            "(id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2)",
+            1,
+        )
+        with transaction.atomic():
+            Singer(first_name="test", last_name="test").save()
+        requests = self.spanner_service.requests
+        self.assertEqual(len(requests), 3)
+        self.assertIsInstance(requests[0], BatchCreateSessionsRequest)
+        self.assertIsInstance(requests[1], ExecuteSqlRequest)
+        self.assertIsInstance(requests[2], CommitRequest)
+        # The first statement begins the transaction.
+        self.assertIn("read_write", requests[1].transaction.begin)
+        self.assertFalse(
+            any(isinstance(r, BeginTransactionRequest) for r in requests)
+        )
@@ -0,0 +1,93 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import connection
+from google.cloud.spanner_v1 import TypeCode
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_single_result,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Album, Singer
+
+
+class TestBatchDdl(MockServerTestBase):
+    def _ddl_requests(self):
+        return self.database_admin_service.requests
+
+    def test_schema_editor(self):
+        with self.assertLogs("django_spanner.connection", "INFO") as logs:
+            with connection.schema_editor() as editor:
+                editor.create_model(Singer)
+                editor.create_model(Album)
+                self.assertEqual(self._ddl_requests(), [])
+        requests = self._ddl_requests()
+        self.assertEqual(len(requests), 1)
+        statements = list(requests[0].statements)
+        self.assertTrue(statements[0].startswith("CREATE TABLE tests_singer"))
+        self.assertTrue(statements[1].startswith("CREATE TABLE tests_album"))
+        self.assertTrue(
+            any(s.startswith("CREATE INDEX") for s in statements[2:])
+        )
+        self.assertIn(
+            "Ran %d DDL statements in one operation" % len(statements),
+            logs.output[0],
+        )
+        self.assertFalse(connection.in_ddl_batch)
+
+    def test_flush_before_other_statement(self):
+        add_update_count(
+            "UPDATE tests_singer SET first_name = @a0 WHERE 1=1", 0
+        )
+        with connection.schema_editor() as editor:
+            editor.create_model(Singer)
+            Singer.objects.update(first_name="Jane")
+            self.assertEqual(len(self._ddl_requests()), 1)
+            editor.create_model(Album)
+        requests = self._ddl_requests()
+        self.assertEqual(len(requests), 2)
+        self.assertTrue(
+            requests[1].statements[0].startswith("CREATE TABLE tests_album")
+        )
+
+    def test_flush_before_query(self):
+        add_single_result(
+            "SELECT COUNT(*) AS __count FROM tests_singer",
+            "__count",
+            TypeCode.INT64,
+            [("0",)],
+        )
+        with connection.schema_editor() as editor:
+            editor.create_model(Singer)
+            self.assertEqual(Singer.objects.count(), 0)
+            self.assertEqual(len(self._ddl_requests()), 1)
+            self.assertEqual(connection.connection.pending_ddl_statements, 0)
+        self.assertEqual(len(self._ddl_requests()), 1)
+
+    def test_discard_on_error(self):
+        with self.assertRaises(ValueError):
+            with connection.schema_editor() as editor:
+                editor.create_model(Singer)
+                raise ValueError("Migration failed")
+        self.assertEqual(self._ddl_requests(), [])
+        self.assertFalse(connection.in_ddl_batch)
+        self.assertEqual(connection.connection.pending_ddl_statements, 0)
+
+    def test_collect_sql(self):
+        with connection.schema_editor(collect_sql=True) as editor:
+            self.assertFalse(connection.in_ddl_batch)
+            editor.create_model(Singer)
+        self.assertTrue(editor.collected_sql)
+        self.assertEqual(self._ddl_requests(), [])
@@ -0,0 +1,135 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import connection, transaction
+from django.db.utils import DatabaseError
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    CommitRequest,
+    ExecuteBatchDmlRequest,
+    ExecuteSqlRequest,
+)
+
+import django_spanner
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Album, Singer
+
+
+class TestBatchDml(MockServerTestBase):
+    UPDATE_SQL = (
+        "UPDATE tests_singer SET first_name = @a0, last_name = @a1 "
+        "WHERE tests_singer.id = @a2"
+    )
+    DELETE_SQL = "DELETE FROM tests_album WHERE tests_album.title = @a0"
+    SINGERS_SQL = (
+        "SELECT tests_singer.id, tests_singer.first_name, "
+        "tests_singer.last_name FROM tests_singer"
+    )
+
+    def _singer(self, pk):
+        singer = Singer(id=pk, first_name="First", last_name="Last")
+        singer._state.adding = False
+        return singer
+
+    def _types(self):
+        return [type(request) for request in self.spanner_service.requests]
+
+    def test_saves_are_sent_in_one_request(self):
+        add_update_count(self.UPDATE_SQL, 1)
+        with django_spanner.batch_dml() as batch:
+            self._singer(1).save()
+            self._singer(2).save()
+            self.assertEqual(len(batch.statements), 2)
+        self.assertIsNone(connection.dml_batch)
+        self.assertEqual(batch.row_counts, [1, 1])
+        self.assertEqual(
+            self._types(),
+            [
+                BatchCreateSessionsRequest,
+                ExecuteBatchDmlRequest,
+                CommitRequest,
+            ],
+        )
+        request = self.spanner_service.requests[1]
+        self.assertEqual(
+            [statement.sql for statement in request.statements],
+            [self.UPDATE_SQL, self.UPDATE_SQL],
+        )
+
+    def test_read_sends_the_batch(self):
+        add_update_count(self.UPDATE_SQL, 1)
+        add_singer_query_result(self.SINGERS_SQL)
+        with django_spanner.batch_dml() as batch:
+            self._singer(1).save()
+            list(Singer.objects.all())
+            self._singer(2).save()
+        self.assertEqual(batch.requests, 2)
+        self.assertEqual(
+            self._types(),
+            [
+                BatchCreateSessionsRequest,
+                ExecuteBatchDmlRequest,
+                CommitRequest,
+                ExecuteSqlRequest,
+                ExecuteBatchDmlRequest,
+                CommitRequest,
+            ],
+        )
+
+    def test_batch_in_transaction(self):
+        add_update_count(self.UPDATE_SQL, 1)
+        add_update_count(self.DELETE_SQL, 3)
+        with transaction.atomic(), django_spanner.batch_dml() as batch:
+            self._singer(1).save()
+            self.assertEqual(
+                Album.objects.filter(title="Blue").delete(),
+                (-1, {"tests.Album": -1}),
+            )
+        self.assertEqual(batch.row_counts, [1, 3])
+        self.assertEqual(
+            self._types(),
+            [
+                BatchCreateSessionsRequest,
+                ExecuteBatchDmlRequest,
+                CommitRequest,
+            ],
+        )
+
+    def test_update_reports_unknown_row_count(self):
+        sql = "UPDATE tests_singer SET first_name = @a0 WHERE tests_singer.last_name = @a1"
+        add_update_count(sql, 2)
+        with django_spanner.batch_dml() as batch:
+            updated = Singer.objects.filter(last_name="Last").update(
+                first_name="Other"
+            )
+        self.assertEqual(updated, -1)
+        self.assertEqual(batch.row_counts, [2])
+
+    def test_save_of_missing_row_raises(self):
+        add_update_count(self.UPDATE_SQL, 0)
+        with self.assertRaisesRegex(DatabaseError, "matched no row"):
+            with django_spanner.batch_dml():
+                self._singer(1).save()
+
+    def test_error_discards_the_batch(self):
+        with self.assertRaises(ValueError):
+            with django_spanner.batch_dml():
+                self._singer(1).save()
+                raise ValueError()
+        self.assertIsNone(connection.dml_batch)
+        self.assertNotIn(ExecuteBatchDmlRequest, self._types())
@@ -0,0 +1,97 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import connection
+from google.cloud.spanner_v1 import BatchWriteRequest
+from google.rpc import code_pb2
+
+from tests.mockserver_tests.mock_server_test_base import MockServerTestBase
+from tests.mockserver_tests.models import Album
+
+
+class TestBatchWrite(MockServerTestBase):
+    def _albums(self):
+        return [
+            Album(id=1, singer_id=1, title="Blue"),
+            Album(id=2, singer_id=1, title="Red"),
+            Album(id=3, singer_id=2, title="Green"),
+        ]
+
+    def _batch_write_request(self):
+        (request,) = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, BatchWriteRequest)
+        ]
+        return request
+
+    def test_batch_write_group_per_object(self):
+        albums = self._albums()
+        result = Album.objects.batch_write(albums)
+        self.assertEqual(len(result.groups), 3)
+        self.assertEqual(len(result.succeeded), 3)
+        self.assertEqual(result.failed, [])
+        request = self._batch_write_request()
+        self.assertEqual(len(request.mutation_groups), 3)
+        insert = request.mutation_groups[0].mutations[0].insert
+        self.assertEqual(insert.table, "tests_album")
+        self.assertEqual(insert.columns, ["id", "singer_id", "title"])
+        self.assertEqual(
+            [list(row) for row in insert.values], [["1", "1", "Blue"]]
+        )
+        self.assertFalse(albums[0]._state.adding)
+        self.assertIsNotNone(connection.commit_timestamp)
+
+    def test_batch_write_group_by_field(self):
+        result = Album.objects.batch_write(self._albums(), group_by="singer")
+        self.assertEqual([group.key for group in result], [1, 2])
+        self.assertEqual([len(group.objs) for group in result], [2, 1])
+        request = self._batch_write_request()
+        self.assertEqual(
+            len(request.mutation_groups[0].mutations[0].insert.values), 2
+        )
+
+    def test_batch_write_failed_group(self):
+        self.spanner_service.batch_write_errors[1] = (
+            code_pb2.ALREADY_EXISTS,
+            "Row exists",
+        )
+        albums = self._albums()
+        result = Album.objects.batch_write(
+            albums, group_by=lambda album: album.title
+        )
+        (failed,) = result.failed
+        self.assertEqual(failed.key, "Red")
+        self.assertEqual(failed.code, code_pb2.ALREADY_EXISTS)
+        self.assertEqual(failed.message, "Row exists")
+        self.assertIsNone(failed.commit_timestamp)
+        self.assertTrue(albums[1]._state.adding)
+        self.assertEqual(len(result.succeeded), 2)
+
+    def test_iter_batch_write(self):
+        results = list(
+            Album.objects.iter_batch_write(
+                self._albums(), method="insert_or_update"
+            )
+        )
+        self.assertTrue(all(result.ok for result in results))
+        request = self._batch_write_request()
+        self.assertEqual(
+            request.mutation_groups[0].mutations[0].insert_or_update.table,
+            "tests_album",
+        )
+
+    def test_batch_write_unknown_method(self):
+        with self.assertRaises(ValueError):
+            Album.objects.batch_write(self._albums(), method="delete")
@@ -0,0 +1,104 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import grpc
+from django.db import IntegrityError, connection, transaction
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Singer
+
+
+class TestBulkCreate(MockServerTestBase):
+    def _singers(self):
+        return [
+            Singer(id=1, first_name="Alice", last_name="Trentor"),
+            Singer(id=2, first_name="Bob", last_name="Allison"),
+        ]
+
+    def test_bulk_create_with_mutations(self):
+        Singer.objects.bulk_create(self._singers())
+        requests = self.spanner_service.requests
+        self.assertEqual(
+            [type(request) for request in requests],
+            [BatchCreateSessionsRequest, CommitRequest],
+        )
+        commit = requests[1]
+        self.assertIn("read_write", commit.single_use_transaction)
+        self.assertEqual(len(commit.mutations), 1)
+        insert = commit.mutations[0].insert
+        self.assertEqual(insert.table, "tests_singer")
+        self.assertEqual(insert.columns, ["id", "first_name", "last_name"])
+        self.assertEqual(
+            [list(row) for row in insert.values],
+            [["1", "Alice", "Trentor"], ["2", "Bob", "Allison"]],
+        )
+        self.assertIsNotNone(connection.commit_timestamp)
+
+    def test_bulk_create_conflict(self):
+        self.spanner_service.commit_error = (
+            grpc.StatusCode.ALREADY_EXISTS,
+            "Row [1] in table tests_singer already exists",
+        )
+        with self.assertRaisesRegex(IntegrityError, "already exists"):
+            Singer.objects.bulk_create(self._singers())
+
+    def test_conflict_keeps_batch_size(self):
+        self.spanner_service.commit_error = (
+            grpc.StatusCode.ALREADY_EXISTS,
+            "Row [1] of the insert mutation already exists",
+        )
+        with self.assertRaises(IntegrityError):
+            Singer.objects.bulk_create(self._singers())
+        stats = connection.bulk_batch_sizes["tests_singer"]
+        self.assertEqual(stats["errors"], 0)
+        self.assertIsNone(stats["size"])
+
+    def test_bulk_create_in_atomic_uses_dml(self):
+        add_update_count(
+            "INSERT INTO tests_singer (id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2), (@a3, @a4, @a5)",
+            2,
+        )
+        with transaction.atomic():
+            Singer.objects.bulk_create(self._singers())
+        requests = self.spanner_service.requests
+        self.assertEqual(
+            [type(request) for request in requests],
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
+        self.assertEqual(len(requests[2].mutations), 0)
+
+    def test_bulk_create_mutations_disabled(self):
+        connection.settings_dict["OPTIONS"]["bulk_mutations"] = False
+        self.addCleanup(
+            connection.settings_dict["OPTIONS"].pop, "bulk_mutations"
+        )
+        add_update_count(
+            "INSERT INTO tests_singer (id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2), (@a3, @a4, @a5)",
+            2,
+        )
+        Singer.objects.bulk_create(self._singers())
+        self.assertEqual(
+            [type(request) for request in self.spanner_service.requests],
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
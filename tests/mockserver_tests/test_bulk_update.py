@@ -0,0 +1,90 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import transaction
+from django.db.models import F
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Album
+
+
+class TestBulkUpdate(MockServerTestBase):
+    def _albums(self):
+        return [
+            Album(id=1, singer_id=1, title="Blue"),
+            Album(id=2, singer_id=1, title="Red"),
+        ]
+
+    def test_bulk_update_with_mutations(self):
+        self.assertEqual(
+            Album.objects.bulk_update(self._albums(), ["title"]), 2
+        )
+        requests = self.spanner_service.requests
+        self.assertEqual(
+            [type(request) for request in requests],
+            [BatchCreateSessionsRequest, CommitRequest],
+        )
+        update = requests[1].mutations[0].update
+        self.assertEqual(update.table, "tests_album")
+        self.assertEqual(update.columns, ["id", "title"])
+        self.assertEqual(
+            [list(row) for row in update.values],
+            [["1", "Blue"], ["2", "Red"]],
+        )
+
+    def test_bulk_update_batch_size(self):
+        Album.objects.bulk_update(self._albums(), ["title"], batch_size=1)
+        mutations = self.spanner_service.requests[1].mutations
+        self.assertEqual(len(mutations), 2)
+
+    def test_bulk_update_in_atomic_uses_dml(self):
+        add_update_count(
+            "UPDATE tests_album SET title = CASE WHEN (tests_album.id = @a0) "
+            "THEN @a1 WHEN (tests_album.id = @a2) THEN @a3 ELSE NULL END "
+            "WHERE tests_album.id IN (@a4, @a5)",
+            2,
+        )
+        with transaction.atomic():
+            self.assertEqual(
+                Album.objects.bulk_update(self._albums(), ["title"]), 2
+            )
+        self.assertEqual(
+            [type(request) for request in self.spanner_service.requests],
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
+
+    def test_bulk_update_expression_uses_dml(self):
+        albums = self._albums()
+        for album in albums:
+            album.title = F("title")
+        add_update_count(
+            "UPDATE tests_album SET title = CASE WHEN (tests_album.id = @a0) "
+            "THEN tests_album.title WHEN (tests_album.id = @a1) "
+            "THEN tests_album.title ELSE NULL END "
+            "WHERE tests_album.id IN (@a2, @a3)",
+            2,
+        )
+        self.assertEqual(Album.objects.bulk_update(albums, ["title"]), 2)
+        self.assertIn(
+            ExecuteSqlRequest,
+            [type(request) for request in self.spanner_service.requests],
+        )
@@ -0,0 +1,124 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import transaction
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+    TypeCode,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_single_result,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Album
+
+
+class TestChunkedWrites(MockServerTestBase):
+    PKS_SQL = (
+        "SELECT tests_album.id FROM tests_album "
+        "WHERE tests_album.title = @a0 ORDER BY tests_album.id ASC"
+    )
+    UPDATE_SQL = (
+        "UPDATE tests_album SET title = @a0 WHERE (tests_album.title = @a1 "
+        "AND tests_album.id >= @a2 AND tests_album.id < @a3)"
+    )
+    LAST_UPDATE_SQL = (
+        "UPDATE tests_album SET title = @a0 WHERE (tests_album.title = @a1 "
+        "AND tests_album.id >= @a2)"
+    )
+    DELETE_SQL = (
+        "DELETE FROM tests_album WHERE (tests_album.title = @a0 "
+        "AND tests_album.id >= @a1 AND tests_album.id < @a2)"
+    )
+    LAST_DELETE_SQL = (
+        "DELETE FROM tests_album WHERE (tests_album.title = @a0 "
+        "AND tests_album.id >= @a1)"
+    )
+
+    def setUp(self):
+        super().setUp()
+        add_single_result(
+            self.PKS_SQL, "id", TypeCode.INT64, [("1",), ("2",), ("3",)]
+        )
+
+    def _statements(self):
+        return [
+            request.sql
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+
+    def test_update_in_chunks(self):
+        add_update_count(self.UPDATE_SQL, 2)
+        add_update_count(self.LAST_UPDATE_SQL, 1)
+        progress = []
+        updated = (
+            Album.objects.filter(title="Blue")
+            .chunked(size=2, progress=lambda *args: progress.append(args))
+            .update(title="Red")
+        )
+        self.assertEqual(updated, 3)
+        self.assertEqual(progress, [(1, 2, 2), (2, 2, 3)])
+        self.assertEqual(
+            self._statements(),
+            [self.PKS_SQL, self.UPDATE_SQL, self.LAST_UPDATE_SQL],
+        )
+        requests = self.spanner_service.requests
+        chunks = [
+            request
+            for request in requests
+            if isinstance(request, ExecuteSqlRequest)
+            and "UPDATE" in request.sql
+        ]
+        self.assertEqual([chunk.params["a2"] for chunk in chunks], ["1", "3"])
+        # Each chunk is committed on its own.
+        self.assertEqual(
+            len([r for r in requests if isinstance(r, CommitRequest)]), 2
+        )
+
+    def test_delete_in_parallel_chunks(self):
+        add_update_count(self.DELETE_SQL, 2)
+        add_update_count(self.LAST_DELETE_SQL, 1)
+        deleted = (
+            Album.objects.filter(title="Blue")
+            .chunked(size=2, parallel=2)
+            .delete()
+        )
+        self.assertEqual(deleted, (3, {"tests.Album": 3}))
+        self.assertEqual(
+            sorted(self._statements()),
+            sorted([self.PKS_SQL, self.DELETE_SQL, self.LAST_DELETE_SQL]),
+        )
+
+    def test_transaction_runs_one_statement(self):
+        sql = (
+            "UPDATE tests_album SET title = @a0 WHERE tests_album.title = @a1"
+        )
+        add_update_count(sql, 3)
+        with transaction.atomic():
+            updated = (
+                Album.objects.filter(title="Blue")
+                .chunked(size=2)
+                .update(title="Red")
+            )
+        self.assertEqual(updated, 3)
+        self.assertEqual(self._statements(), [sql])
+        self.assertEqual(
+            [type(request) for request in self.spanner_service.requests],
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
@@ -0,0 +1,114 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Playlist, Singer, Tag
+
+
+class TestIgnoreConflicts(MockServerTestBase):
+    def _types(self):
+        return [type(request) for request in self.spanner_service.requests]
+
+    def test_insert_or_ignore(self):
+        sql = (
+            "INSERT OR IGNORE INTO tests_singer (id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2), (@a3, @a4, @a5)"
+        )
+        add_update_count(sql, 1)
+        Singer.objects.bulk_create(
+            [
+                Singer(id=1, first_name="Alice", last_name="Trentor"),
+                Singer(id=2, first_name="Bob", last_name="Allison"),
+            ],
+            ignore_conflicts=True,
+        )
+        self.assertEqual(
+            self._types(),
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
+        self.assertEqual(self.spanner_service.requests[1].sql, sql)
+
+    def test_insert_or_ignore_fits_query_params(self):
+        def insert_sql(rows):
+            return (
+                "INSERT OR IGNORE INTO tests_singer "
+                "(id, first_name, last_name) VALUES "
+                + ", ".join(
+                    "(@a%d, @a%d, @a%d)" % (3 * i, 3 * i + 1, 3 * i + 2)
+                    for i in range(rows)
+                )
+            )
+
+        # 900 query parameters are 300 rows of three columns.
+        add_update_count(insert_sql(300), 300)
+        add_update_count(insert_sql(100), 100)
+        Singer.objects.bulk_create(
+            [
+                Singer(id=i, first_name="First", last_name="Last")
+                for i in range(1, 701)
+            ],
+            ignore_conflicts=True,
+        )
+        statements = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+        self.assertEqual(
+            [len(request.params) for request in statements], [900, 900, 300]
+        )
+
+    def test_insert_or_ignore_unique_field(self):
+        sql = (
+            "INSERT OR IGNORE INTO tests_tag (id, name) "
+            "SELECT v.id, v.name FROM (SELECT @a0 AS id, @a1 AS name "
+            "UNION ALL SELECT @a2, @a3) AS v "
+            "WHERE NOT EXISTS (SELECT 1 FROM tests_tag "
+            "WHERE tests_tag.name = v.name)"
+        )
+        add_update_count(sql, 1)
+        Tag.objects.bulk_create(
+            [Tag(id=1, name="rock"), Tag(id=2, name="jazz")],
+            ignore_conflicts=True,
+        )
+        self.assertEqual(self.spanner_service.requests[1].sql, sql)
+
+    def test_m2m_add_without_read(self):
+        sql = (
+            "INSERT OR IGNORE INTO tests_playlist_tags "
+            "(id, playlist_id, tag_id) "
+            "SELECT v.id, v.playlist_id, v.tag_id FROM "
+            "(SELECT @a0 AS id, @a1 AS playlist_id, @a2 AS tag_id "
+            "UNION ALL SELECT @a3, @a4, @a5) AS v "
+            "WHERE NOT EXISTS (SELECT 1 FROM tests_playlist_tags "
+            "WHERE tests_playlist_tags.playlist_id = v.playlist_id "
+            "AND tests_playlist_tags.tag_id = v.tag_id)"
+        )
+        add_update_count(sql, 2)
+        playlist = Playlist(id=1, name="Mix")
+        playlist.tags.add(Tag(id=1, name="rock"), Tag(id=2, name="jazz"))
+        self.assertEqual(
+            self._types(),
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
+        self.assertEqual(self.spanner_service.requests[1].sql, sql)
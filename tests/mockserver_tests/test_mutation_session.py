@@ -0,0 +1,122 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import grpc
+from django.db import IntegrityError, connection
+from django.db.models import F
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+)
+
+import django_spanner
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Album, Singer
+
+
+class TestMutationSession(MockServerTestBase):
+    def _singer(self, pk):
+        singer = Singer(id=pk, first_name="First", last_name="Last")
+        singer._state.adding = False
+        return singer
+
+    def _types(self):
+        return [type(request) for request in self.spanner_service.requests]
+
+    def _mutations(self):
+        return self.spanner_service.requests[-1].mutations
+
+    def test_saves_are_sent_with_the_commit(self):
+        with django_spanner.mutation_session():
+            self.assertTrue(connection.in_mutation_session)
+            Singer(first_name="New", last_name="Singer").save()
+            self._singer(1).save()
+            self._singer(2).save(update_fields=["first_name"])
+        self.assertFalse(connection.in_mutation_session)
+        self.assertEqual(
+            self._types(), [BatchCreateSessionsRequest, CommitRequest]
+        )
+        insert, upsert, update = self._mutations()
+        self.assertEqual(insert.insert.table, "tests_singer")
+        self.assertEqual(
+            list(insert.insert.columns), ["id", "first_name", "last_name"]
+        )
+        self.assertEqual(
+            list(upsert.insert_or_update.columns),
+            ["id", "first_name", "last_name"],
+        )
+        self.assertEqual(
+            [list(row) for row in upsert.insert_or_update.values],
+            [["1", "First", "Last"]],
+        )
+        self.assertEqual(list(update.update.columns), ["id", "first_name"])
+        self.assertEqual(
+            [list(row) for row in update.update.values], [["2", "First"]]
+        )
+
+    def test_delete_by_primary_key(self):
+        album = Album(id=3, singer_id=1, title="Blue")
+        with django_spanner.mutation_session():
+            self.assertEqual(album.delete(), (1, {"tests.Album": 1}))
+        (delete,) = self._mutations()
+        self.assertEqual(delete.delete.table, "tests_album")
+        self.assertEqual(
+            [list(key) for key in delete.delete.key_set.keys], [["3"]]
+        )
+
+    def test_expressions_use_dml(self):
+        add_update_count(
+            "UPDATE tests_singer SET first_name = tests_singer.last_name, "
+            "last_name = @a0 WHERE tests_singer.id = @a1",
+            1,
+        )
+        singer = self._singer(1)
+        singer.first_name = F("last_name")
+        with django_spanner.mutation_session():
+            singer.save()
+            self._singer(2).save()
+        self.assertEqual(
+            self._types(),
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
+        self.assertEqual(len(self._mutations()), 1)
+
+    def test_conflict_with_dml(self):
+        add_update_count(
+            "UPDATE tests_singer SET first_name = tests_singer.last_name, "
+            "last_name = @a0 WHERE tests_singer.id = @a1",
+            1,
+        )
+        self.spanner_service.commit_error = (
+            grpc.StatusCode.ALREADY_EXISTS,
+            "Row [2] in table tests_singer already exists",
+        )
+        singer = self._singer(1)
+        singer.first_name = F("last_name")
+        with self.assertRaisesRegex(IntegrityError, "already exists"):
+            with django_spanner.mutation_session():
+                singer.save()
+                Singer(id=2, first_name="New", last_name="Singer").save()
+
+    def test_error_sends_nothing(self):
+        with self.assertRaises(ValueError):
+            with django_spanner.mutation_session():
+                self._singer(1).save()
+                raise ValueError()
+        self.assertFalse(connection.in_mutation_session)
+        self.assertNotIn(CommitRequest, self._types())
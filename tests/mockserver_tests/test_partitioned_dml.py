@@ -0,0 +1,108 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import NotSupportedError, transaction
+from django.db.models import (
+    Case,
+    Exists,
+    F,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from google.cloud.spanner_dbapi.parsed_statement import AutocommitDmlMode
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    BeginTransactionRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Album, Singer
+
+
+class TestPartitionedDml(MockServerTestBase):
+    def _types(self):
+        return [type(request) for request in self.spanner_service.requests]
+
+    def test_partitioned_update(self):
+        add_update_count(
+            "UPDATE tests_album SET title = @a0 WHERE tests_album.title = @a1",
+            100,
+            AutocommitDmlMode.PARTITIONED_NON_ATOMIC,
+        )
+        updated = Album.objects.filter(title="Blue").partitioned_update(
+            title="Red"
+        )
+        self.assertEqual(updated, 100)
+        self.assertEqual(
+            self._types(),
+            [
+                BatchCreateSessionsRequest,
+                BeginTransactionRequest,
+                ExecuteSqlRequest,
+            ],
+        )
+        begin = self.spanner_service.requests[1]
+        self.assertIn("partitioned_dml", begin.options)
+
+    def test_partitioned_delete(self):
+        add_update_count(
+            "DELETE FROM tests_album WHERE tests_album.title = @a0",
+            50,
+            AutocommitDmlMode.PARTITIONED_NON_ATOMIC,
+        )
+        deleted = Album.objects.filter(title="Blue").partitioned_delete()
+        self.assertEqual(deleted, 50)
+        begin = self.spanner_service.requests[1]
+        self.assertIn("partitioned_dml", begin.options)
+
+    def test_not_idempotent(self):
+        with self.assertRaisesRegex(NotSupportedError, "idempotent"):
+            Album.objects.partitioned_update(title=F("title"))
+        self.assertEqual(self.spanner_service.requests, [])
+
+    def test_other_tables(self):
+        with self.assertRaisesRegex(NotSupportedError, "table"):
+            Album.objects.filter(singer__first_name="Jane").partitioned_update(
+                title="Red"
+            )
+        with self.assertRaisesRegex(NotSupportedError, "table"):
+            Album.objects.filter(
+                singer__in=Album.objects.values("singer")
+            ).partitioned_delete()
+
+    def test_subquery_values(self):
+        singers = Singer.objects.filter(id=OuterRef("singer_id"))
+        with self.assertRaisesRegex(NotSupportedError, "subqueries"):
+            Album.objects.partitioned_update(
+                title=Subquery(singers.values("last_name")[:1])
+            )
+        with self.assertRaisesRegex(NotSupportedError, "subqueries"):
+            Album.objects.partitioned_update(
+                title=Case(
+                    When(Exists(singers), then=Value("Red")),
+                    default=Value("Blue"),
+                )
+            )
+        self.assertEqual(self.spanner_service.requests, [])
+
+    def test_transaction(self):
+        with self.assertRaisesRegex(NotSupportedError, "transaction"):
+            with transaction.atomic():
+                Album.objects.partitioned_update(title="Red")
@@ -0,0 +1,97 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+from django.db import DatabaseError, connections, transaction
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    BeginTransactionRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+)
+from tests.mockserver_tests.models import Singer
+
+
+class TestReadOnlyDatabase(MockServerTestBase):
+    SINGERS_SQL = (
+        "SELECT tests_singer.id, tests_singer.first_name, "
+        "tests_singer.last_name FROM tests_singer"
+    )
+
+    def setup_method(self, test_method):
+        super().setup_method(test_method)
+        connections["secondary"].settings_dict["OPTIONS"].update(
+            read_only=True, staleness={"max": 15}
+        )
+
+    def teardown_method(self, test_method):
+        options = connections["secondary"].settings_dict["OPTIONS"]
+        for key in ("read_only", "staleness"):
+            options.pop(key)
+        super().teardown_method(test_method)
+
+    def test_read(self):
+        add_singer_query_result(self.SINGERS_SQL)
+        singers = list(Singer.objects.using("secondary"))
+        self.assertEqual(len(singers), 2)
+        requests = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(
+            requests[0].transaction.single_use.read_only.max_staleness,
+            datetime.timedelta(seconds=15),
+        )
+
+    def test_read_in_transaction(self):
+        add_singer_query_result(self.SINGERS_SQL)
+        with transaction.atomic(using="secondary"):
+            list(Singer.objects.using("secondary"))
+        begin = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, BeginTransactionRequest)
+        ]
+        self.assertEqual(len(begin), 1)
+        # Multi-use snapshots can't use a bounded staleness.
+        self.assertEqual(
+            begin[0].options.read_only.exact_staleness,
+            datetime.timedelta(seconds=15),
+        )
+
+    def test_write_is_rejected(self):
+        with self.assertRaisesRegex(DatabaseError, "read-only"):
+            Singer(first_name="test", last_name="test").save(using="secondary")
+        with self.assertRaisesRegex(DatabaseError, "read-only"):
+            Singer.objects.using("secondary").update(first_name="test")
+        self.assertEqual(self.spanner_service.requests, [])
+
+    def test_delete_is_rejected(self):
+        # The objects to delete are collected before the delete is rejected.
+        add_singer_query_result(
+            self.SINGERS_SQL + " WHERE tests_singer.id = @a0"
+        )
+        with self.assertRaisesRegex(DatabaseError, "read-only"):
+            Singer.objects.using("secondary").filter(id=1).delete()
+        self.assertEqual(
+            [type(request) for request in self.spanner_service.requests],
+            [BatchCreateSessionsRequest, ExecuteSqlRequest],
+        )
@@ -0,0 +1,162 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import connection, connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    BeginTransactionRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+)
+
+from django_spanner.middleware import ReadOnlySnapshotMiddleware
+from django_spanner.transaction import read_only_snapshot
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Singer
+
+
+class TestReadOnlySnapshot(MockServerTestBase):
+    SINGERS_SQL = (
+        "SELECT tests_singer.id, tests_singer.first_name, "
+        "tests_singer.last_name FROM tests_singer"
+    )
+    INSERT_SQL = (
+        "INSERT INTO tests_singer "
+        "(id, first_name, last_name) "
+        "VALUES (@a0, @a1, @a2)"
+    )
+
+    def _read(self):
+        add_singer_query_result(self.SINGERS_SQL)
+        return list(Singer.objects.all())
+
+    def _write(self):
+        add_update_count(self.INSERT_SQL, 1)
+        Singer(first_name="test", last_name="test").save()
+
+    def _types(self):
+        return [type(request) for request in self.spanner_service.requests]
+
+    def test_reads_share_one_snapshot(self):
+        with read_only_snapshot():
+            self.assertTrue(connection.in_read_only_snapshot)
+            self._read()
+            self._read()
+        self.assertFalse(connection.in_read_only_snapshot)
+        self.assertFalse(connection.connection.read_only)
+
+        requests = self.spanner_service.requests
+        self.assertEqual(
+            self._types(),
+            [
+                BatchCreateSessionsRequest,
+                BeginTransactionRequest,
+                ExecuteSqlRequest,
+                ExecuteSqlRequest,
+            ],
+        )
+        self.assertIn("read_only", requests[1].options)
+        self.assertEqual(
+            requests[2].transaction.id, requests[3].transaction.id
+        )
+
+    def test_write_ends_snapshot(self):
+        with read_only_snapshot():
+            self._read()
+            self._write()
+            self.assertFalse(connection.in_read_only_snapshot)
+            self._read()
+        requests = self.spanner_service.requests
+        self.assertEqual(
+            self._types(),
+            [
+                BatchCreateSessionsRequest,
+                BeginTransactionRequest,
+                ExecuteSqlRequest,
+                ExecuteSqlRequest,
+                CommitRequest,
+                ExecuteSqlRequest,
+            ],
+        )
+        self.assertIn("read_write", requests[3].transaction.begin)
+        self.assertIn("single_use", requests[5].transaction)
+
+    def test_atomic_ends_snapshot(self):
+        with read_only_snapshot():
+            self._read()
+            with transaction.atomic():
+                self._write()
+        self.assertEqual(
+            self._types(),
+            [
+                BatchCreateSessionsRequest,
+                BeginTransactionRequest,
+                ExecuteSqlRequest,
+                ExecuteSqlRequest,
+                CommitRequest,
+            ],
+        )
+
+    def test_nested(self):
+        with read_only_snapshot():
+            with read_only_snapshot():
+                self._read()
+            self.assertTrue(connection.in_read_only_snapshot)
+        self.assertFalse(connection.in_read_only_snapshot)
+
+    def test_middleware(self):
+        def view(request):
+            self._read()
+            self._read()
+            return HttpResponse()
+
+        ReadOnlySnapshotMiddleware(view)(RequestFactory().get("/"))
+        self.assertEqual(
+            self._types().count(BeginTransactionRequest),
+            1,
+        )
+        self.assertFalse(connection.in_read_only_snapshot)
+
+    def test_middleware_databases(self):
+        def view(request):
+            self.assertFalse(connection.in_read_only_snapshot)
+            self.assertTrue(connections["secondary"].in_read_only_snapshot)
+            return HttpResponse()
+
+        with override_settings(SPANNER_SNAPSHOT_DATABASES=["secondary"]):
+            ReadOnlySnapshotMiddleware(view)(RequestFactory().get("/"))
+        self.assertIsNone(connection.connection)
+        self.assertFalse(connections["secondary"].in_read_only_snapshot)
+
+    def test_middleware_read_replicas(self):
+        options = connections["secondary"].settings_dict["OPTIONS"]
+        options["read_only"] = True
+        self.addCleanup(options.pop, "read_only")
+
+        def view(request):
+            self.assertFalse(connection.in_read_only_snapshot)
+            self.assertTrue(connections["secondary"].in_read_only_snapshot)
+            return HttpResponse()
+
+        with override_settings(
+            DATABASE_ROUTERS=["django_spanner.routers.ReadReplicaRouter"]
+        ):
+            ReadOnlySnapshotMiddleware(view)(RequestFactory().get("/"))
+        self.assertIsNone(connection.connection)
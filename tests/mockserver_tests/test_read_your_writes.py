@@ -0,0 +1,156 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+
+from django.core import signing
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory
+from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+from django_spanner.middleware import ReadYourWritesMiddleware
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Singer
+
+
+class TestReadYourWrites(MockServerTestBase):
+    SINGERS_SQL = (
+        "SELECT tests_singer.id, tests_singer.first_name, "
+        "tests_singer.last_name FROM tests_singer"
+    )
+
+    def setup_method(self, test_method):
+        super().setup_method(test_method)
+        connections["secondary"].settings_dict["OPTIONS"].update(
+            read_only=True, staleness={"max": 15}
+        )
+
+    def teardown_method(self, test_method):
+        options = connections["secondary"].settings_dict["OPTIONS"]
+        for key in ("read_only", "staleness"):
+            options.pop(key)
+        super().teardown_method(test_method)
+
+    def _write(self, request):
+        add_update_count(
+            "INSERT INTO tests_singer "
+            "(id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2)",
+            1,
+        )
+        Singer(first_name="test", last_name="test").save()
+        return HttpResponse()
+
+    def _read(self, request):
+        add_singer_query_result(self.SINGERS_SQL)
+        list(Singer.objects.using("secondary"))
+        return HttpResponse()
+
+    def _read_requests(self):
+        return [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+            and "single_use" in request.transaction
+        ]
+
+    def _request(self, aliases):
+        request = RequestFactory().get("/")
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+        signer = signing.get_cookie_signer(
+            salt=ReadYourWritesMiddleware.cookie_name
+            + ReadYourWritesMiddleware.cookie_salt
+        )
+        request.COOKIES[ReadYourWritesMiddleware.cookie_name] = signer.sign(
+            json.dumps({alias: timestamp.isoformat() for alias in aliases})
+        )
+        return request
+
+    def test_commit_timestamp(self):
+        self.assertIsNone(connection.commit_timestamp)
+        self._write(None)
+        self.assertIsInstance(connection.commit_timestamp, datetime.datetime)
+
+    def test_reads_see_own_writes(self):
+        factory = RequestFactory()
+        response = ReadYourWritesMiddleware(self._write)(factory.get("/"))
+        cookie = response.cookies[ReadYourWritesMiddleware.cookie_name]
+        self.assertEqual(cookie["max-age"], 15)
+        commit_timestamp = connection.commit_timestamp
+
+        request = factory.get("/")
+        request.COOKIES[cookie.key] = cookie.value
+        response = ReadYourWritesMiddleware(self._read)(request)
+        self.assertNotIn(
+            ReadYourWritesMiddleware.cookie_name, response.cookies
+        )
+        (read,) = self._read_requests()
+        min_read_timestamp = (
+            read.transaction.single_use.read_only.min_read_timestamp
+        )
+        self.assertGreaterEqual(min_read_timestamp, commit_timestamp)
+        self.assertLess(
+            min_read_timestamp - commit_timestamp,
+            datetime.timedelta(microseconds=1),
+        )
+        # The staleness of the database is restored after the request.
+        self.assertEqual(
+            connections["secondary"].connection.staleness,
+            {"max_staleness": datetime.timedelta(seconds=15)},
+        )
+
+    def test_reads_without_writes(self):
+        ReadYourWritesMiddleware(self._read)(RequestFactory().get("/"))
+        (read,) = self._read_requests()
+        self.assertEqual(
+            read.transaction.single_use.read_only.max_staleness,
+            datetime.timedelta(seconds=15),
+        )
+
+    def test_cookie_lists_reading_databases(self):
+        factory = RequestFactory()
+        response = ReadYourWritesMiddleware(self._write)(factory.get("/"))
+        cookie = response.cookies[ReadYourWritesMiddleware.cookie_name]
+        request = factory.get("/")
+        request.COOKIES[cookie.key] = cookie.value
+        timestamps = ReadYourWritesMiddleware(None)._get_commit_timestamps(
+            request
+        )
+        self.assertEqual(list(timestamps), ["secondary"])
+        self.assertGreaterEqual(
+            timestamps["secondary"], connection.commit_timestamp
+        )
+
+    def test_no_connections_without_cookie(self):
+        ReadYourWritesMiddleware(lambda request: HttpResponse())(
+            RequestFactory().get("/")
+        )
+        self.assertIsNone(connection.connection)
+        self.assertIsNone(connections["secondary"].connection)
+
+    def test_only_databases_of_cookie_are_connected(self):
+        middleware = ReadYourWritesMiddleware(lambda request: HttpResponse())
+        middleware(self._request(["default"]))
+        self.assertIsNone(connection.connection)
+        self.assertIsNone(connections["secondary"].connection)
+
+        middleware(self._request(["secondary"]))
+        self.assertIsNone(connection.connection)
+        self.assertIsNotNone(connections["secondary"].connection)
@@ -0,0 +1,129 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import connection, connections, transaction
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_select1_result,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Singer
+
+
+class TestSessionPool(MockServerTestBase):
+    def setup_method(self, test_method):
+        super().setup_method(test_method)
+        for alias in ("default", "secondary"):
+            options = connections[alias].settings_dict["OPTIONS"]
+            options.pop("pool")
+            options.update(pool_type="fixed", pool_size=2)
+
+    def teardown_method(self, test_method):
+        for alias in ("default", "secondary"):
+            options = connections[alias].settings_dict["OPTIONS"]
+            for key in (
+                "pool_type",
+                "pool_size",
+                "pool_default_timeout",
+                "max_sessions",
+            ):
+                options.pop(key, None)
+        super().teardown_method(test_method)
+
+    def test_warm_up(self):
+        add_select1_result()
+        connection.warm_up()
+        requests = self.spanner_service.requests
+        self.assertEqual(len(requests), 1)
+        self.assertIsInstance(requests[0], BatchCreateSessionsRequest)
+        self.assertEqual(requests[0].session_count, 2)
+        self.assertEqual(connection.pool_stats["idle"], 2)
+
+        with connection.cursor() as cursor:
+            cursor.execute("select 1")
+            self.assertEqual(cursor.fetchall(), [(1,)])
+        # The query uses one of the sessions created by the warm-up.
+        requests = self.spanner_service.requests
+        self.assertEqual(len(requests), 2)
+        self.assertIsInstance(requests[1], ExecuteSqlRequest)
+
+        stats = connection.pool_stats
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_aliases_share_pool(self):
+        secondary = connections["secondary"]
+        secondary.settings_dict["OPTIONS"]["max_sessions"] = 1
+        add_select1_result()
+        connection.warm_up()
+
+        with secondary.cursor() as cursor:
+            cursor.execute("select 1")
+            self.assertEqual(cursor.fetchall(), [(1,)])
+        # The secondary alias uses a session created for the default one.
+        requests = self.spanner_service.requests
+        self.assertEqual(len(requests), 2)
+        self.assertIsInstance(requests[0], BatchCreateSessionsRequest)
+        self.assertIsInstance(requests[1], ExecuteSqlRequest)
+
+        stats = secondary.pool_stats
+        self.assertEqual(stats["alias"], "secondary")
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["alias_in_use"], 0)
+        self.assertEqual(stats["max_sessions"], 1)
+        self.assertIsNone(connection.pool_stats["max_sessions"])
+
+    def test_close_in_transaction_releases_session(self):
+        connection.settings_dict["OPTIONS"]["pool_default_timeout"] = 1
+        add_update_count(
+            "INSERT INTO tests_singer "
+            "(id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2)",
+            1,
+        )
+        for _ in range(3):
+            with transaction.atomic():
+                Singer(first_name="test", last_name="test").save()
+                connection.close()
+        connection.ensure_connection()
+        stats = connection.pool_stats
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 2)
+
+    def test_close_in_transaction_releases_alias_share(self):
+        secondary = connections["secondary"]
+        secondary.settings_dict["OPTIONS"].update(
+            max_sessions=1, pool_default_timeout=1
+        )
+        add_update_count(
+            "INSERT INTO tests_singer "
+            "(id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2)",
+            1,
+        )
+        for _ in range(2):
+            with transaction.atomic(using="secondary"):
+                Singer(first_name="test", last_name="test").save(
+                    using="secondary"
+                )
+                secondary.close()
+        self.assertEqual(secondary.pool_stats["alias_in_use"], 0)
+        with transaction.atomic(using="secondary"):
+            Singer(first_name="test", last_name="test").save(using="secondary")
+        self.assertEqual(secondary.pool_stats["alias_in_use"], 0)
@@ -0,0 +1,107 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+from django.db import connection, transaction
+from google.cloud.spanner_v1 import ExecuteSqlRequest, TypeCode
+
+from django_spanner.managers import SpannerQuerySet
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_single_result,
+    add_singer_query_result,
+)
+from tests.mockserver_tests.models import Album, Singer
+
+
+class TestStaleReads(MockServerTestBase):
+    SINGERS_SQL = (
+        "SELECT tests_singer.id, tests_singer.first_name, "
+        "tests_singer.last_name FROM tests_singer"
+    )
+
+    def _execute_sql_requests(self):
+        return [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+
+    def test_stale(self):
+        add_singer_query_result(self.SINGERS_SQL)
+        singers = list(SpannerQuerySet(Singer).stale(seconds=10))
+        self.assertEqual(len(singers), 2)
+        (request,) = self._execute_sql_requests()
+        self.assertEqual(
+            request.transaction.single_use.read_only.max_staleness,
+            datetime.timedelta(seconds=10),
+        )
+        # The connection reads strong data again afterwards.
+        self.assertEqual(connection.connection.staleness, {})
+
+    def test_read_timestamp(self):
+        timestamp = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+        add_singer_query_result(self.SINGERS_SQL)
+        list(SpannerQuerySet(Singer).read_timestamp(timestamp))
+        (request,) = self._execute_sql_requests()
+        self.assertEqual(
+            request.transaction.single_use.read_only.read_timestamp,
+            timestamp,
+        )
+
+    def test_stale_prefetch_related(self):
+        add_singer_query_result(self.SINGERS_SQL)
+        add_single_result(
+            "SELECT tests_album.id, tests_album.singer_id, "
+            "tests_album.title FROM tests_album "
+            "WHERE tests_album.singer_id IN (@a0, @a1)",
+            "id",
+            TypeCode.INT64,
+            [],
+        )
+        singers = list(
+            SpannerQuerySet(Singer)
+            .stale(exact_staleness=15)
+            .prefetch_related("album_set")
+        )
+        self.assertEqual(list(singers[0].album_set.all()), [])
+        requests = self._execute_sql_requests()
+        self.assertEqual(len(requests), 2)
+        for request in requests:
+            self.assertEqual(
+                request.transaction.single_use.read_only.exact_staleness,
+                datetime.timedelta(seconds=15),
+            )
+
+    def test_stale_count(self):
+        add_single_result(
+            "SELECT COUNT(*) AS __count FROM tests_album",
+            "__count",
+            TypeCode.INT64,
+            [("3",)],
+        )
+        self.assertEqual(Album.objects.stale(seconds=5).count(), 3)
+        (request,) = self._execute_sql_requests()
+        self.assertEqual(
+            request.transaction.single_use.read_only.max_staleness,
+            datetime.timedelta(seconds=5),
+        )
+
+    def test_stale_ignored_in_transaction(self):
+        add_singer_query_result(self.SINGERS_SQL)
+        with transaction.atomic():
+            list(SpannerQuerySet(Singer).stale(seconds=10))
+        (request,) = self._execute_sql_requests()
+        self.assertIn("read_write", request.transaction.begin)
@@ -0,0 +1,101 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import NotSupportedError, transaction
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    CommitRequest,
+    ExecuteSqlRequest,
+)
+
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_update_count,
+)
+from tests.mockserver_tests.models import Album, Singer
+
+
+class TestUpsert(MockServerTestBase):
+    def _singers(self):
+        return [
+            Singer(id=1, first_name="Alice", last_name="Trentor"),
+            Singer(id=2, first_name="Bob", last_name="Allison"),
+        ]
+
+    def _upsert(self, **kwargs):
+        options = {
+            "update_conflicts": True,
+            "update_fields": ["first_name", "last_name"],
+            "unique_fields": ["pk"],
+        }
+        options.update(kwargs)
+        Singer.objects.bulk_create(self._singers(), **options)
+
+    def test_upsert_with_mutations(self):
+        self._upsert()
+        requests = self.spanner_service.requests
+        self.assertEqual(
+            [type(request) for request in requests],
+            [BatchCreateSessionsRequest, CommitRequest],
+        )
+        mutation = requests[1].mutations[0].insert_or_update
+        self.assertEqual(mutation.table, "tests_singer")
+        self.assertEqual(mutation.columns, ["id", "first_name", "last_name"])
+        self.assertEqual(len(mutation.values), 2)
+
+    def test_upsert_in_atomic_uses_dml(self):
+        add_update_count(
+            "INSERT OR UPDATE INTO tests_singer (id, first_name, last_name) "
+            "VALUES (@a0, @a1, @a2), (@a3, @a4, @a5)",
+            2,
+        )
+        with transaction.atomic():
+            self._upsert()
+        self.assertEqual(
+            [type(request) for request in self.spanner_service.requests],
+            [BatchCreateSessionsRequest, ExecuteSqlRequest, CommitRequest],
+        )
+
+    def test_upsert_unique_fields_not_pk(self):
+        with self.assertRaisesRegex(NotSupportedError, "primary key"):
+            self._upsert(unique_fields=["first_name"])
+        with self.assertRaisesRegex(NotSupportedError, "primary key"):
+            with transaction.atomic():
+                self._upsert(unique_fields=["first_name"])
+
+    def test_upsert_update_fields_missing(self):
+        with self.assertRaisesRegex(NotSupportedError, "last_name"):
+            self._upsert(update_fields=["first_name"])
+
+    def test_upsert_many(self):
+        albums = (
+            Album(id=i, singer_id=1, title="Album %d" % i) for i in range(3)
+        )
+        self.assertEqual(Album.objects.upsert_many(albums, batch_size=2), 3)
+        commits = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, CommitRequest)
+        ]
+        self.assertEqual(
+            [
+                len(commit.mutations[0].insert_or_update.values)
+                for commit in commits
+            ],
+            [2, 1],
+        )
+        self.assertEqual(
+            commits[0].mutations[0].insert_or_update.columns,
+            ["id", "singer_id", "title"],
+        )
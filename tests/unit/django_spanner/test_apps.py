@@ -0,0 +1,38 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import unittest
+from unittest import mock
+
+from django.apps import apps
+from django.db import connections
+
+
+class TestDjangoSpannerConfig(unittest.TestCase):
+    def setUp(self):
+        self.app_config = apps.get_app_config("django_spanner")
+        self.options = connections["secondary"].settings_dict["OPTIONS"]
+
+    def tearDown(self):
+        self.options.pop("warm_up", None)
+
+    def test_ready_warms_up_requested_databases(self):
+        self.options["warm_up"] = True
+        with mock.patch(
+            "django_spanner.base.DatabaseWrapper.warm_up"
+        ) as mock_warm_up:
+            self.app_config.ready()
+        # Only "secondary" asks for a warm-up.
+        mock_warm_up.assert_called_once_with()
+
+    def test_ready_ignores_warm_up_errors(self):
+        self.options["warm_up"] = True
+        with mock.patch(
+            "django_spanner.base.DatabaseWrapper.warm_up",
+            side_effect=RuntimeError,
+        ):
+            with self.assertLogs("django_spanner.apps", "WARNING"):
+                self.app_config.ready()
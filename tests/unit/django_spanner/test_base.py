@@ -10,11 +10,13 @@ from tests.unit.django_spanner.simple_test import SpannerSimpleTestClass
 
 class TestBase(SpannerSimpleTestClass):
     def test_property_instance(self):
-        with mock.patch("django_spanner.base.spanner") as mock_spanner:
-            mock_spanner.Client = mock_client = mock.MagicMock()
-            mock_client().instance = mock_instance = mock.MagicMock()
+        with mock.patch("django_spanner.base.registry") as mock_registry:
             _ = self.db_wrapper.instance
-            mock_instance.assert_called_once_with(self.INSTANCE_ID)
+            mock_registry.get_instance.assert_called_once_with(
+                self.PROJECT,
+                self.INSTANCE_ID,
+                user_agent=self.USER_AGENT,
+            )
 
     def test_property_nodb_connection(self):
         with self.assertRaises(NotImplementedError):
@@ -29,24 +31,162 @@ class TestBase(SpannerSimpleTestClass):
         self.assertEqual(params["user_agent"], self.USER_AGENT)
         self.assertEqual(params["option"], self.OPTIONS["option"])
 
-    def test_get_new_connection(self):
-        self.db_wrapper.Database = mock_database = mock.MagicMock()
-        mock_database.connect = mock_connection = mock.MagicMock()
-        conn_params = {"test_param": "dummy"}
-        self.db_wrapper.get_new_connection(conn_params)
-        mock_connection.assert_called_once_with(**conn_params)
+    @mock.patch("django_spanner.base.Connection")
+    def test_get_new_connection(self, mock_connection):
+        conn_params = {
+            "project": self.PROJECT,
+            "instance_id": self.INSTANCE_ID,
+            "database_id": self.DATABASE_ID,
+            "user_agent": self.USER_AGENT,
+            "pool": "dummy_pool",
+            "test_param": "dummy",
+        }
+        with mock.patch("django_spanner.base.registry") as mock_registry:
+            connection = self.db_wrapper.get_new_connection(conn_params)
+
+        mock_registry.get_database.assert_called_once_with(
+            self.PROJECT,
+            self.INSTANCE_ID,
+            self.DATABASE_ID,
+            alias="default",
+            user_agent=self.USER_AGENT,
+            pool="dummy_pool",
+        )
+        database = mock_registry.get_database.return_value
+        mock_connection.assert_called_once_with(
+            database._instance, database, test_param="dummy"
+        )
+        self.assertFalse(connection._own_pool)
+
+    @mock.patch("django_spanner.base.Connection")
+    def test_get_new_connection_pool_options(self, mock_connection):
+        conn_params = {
+            "project": self.PROJECT,
+            "instance_id": self.INSTANCE_ID,
+            "database_id": self.DATABASE_ID,
+            "pool_type": "fixed",
+            "pool_size": 5,
+            "warm_up": True,
+        }
+        with mock.patch("django_spanner.base.registry") as mock_registry:
+            self.db_wrapper.get_new_connection(conn_params)
+
+        mock_registry.get_database.assert_called_once_with(
+            self.PROJECT,
+            self.INSTANCE_ID,
+            self.DATABASE_ID,
+            alias="default",
+            pool_options={"pool_type": "fixed", "pool_size": 5},
+        )
+        database = mock_registry.get_database.return_value
+        mock_connection.assert_called_once_with(database._instance, database)
+
+    @mock.patch("django_spanner.base.Connection")
+    def test_get_new_connection_staleness(self, mock_connection):
+        import datetime
+
+        conn_params = {
+            "project": self.PROJECT,
+            "instance_id": self.INSTANCE_ID,
+            "database_id": self.DATABASE_ID,
+            "staleness": {"exact_staleness": 10},
+        }
+        with mock.patch("django_spanner.base.registry") as mock_registry:
+            connection = self.db_wrapper.get_new_connection(conn_params)
+
+        database = mock_registry.get_database.return_value
+        mock_connection.assert_called_once_with(database._instance, database)
+        self.assertEqual(
+            connection.staleness,
+            {"exact_staleness": datetime.timedelta(seconds=10)},
+        )
+
+    def test_get_new_connection_async_ddl(self):
+        conn_params = {
+            "project": self.PROJECT,
+            "instance_id": self.INSTANCE_ID,
+            "database_id": self.DATABASE_ID,
+            "async_ddl": True,
+        }
+        with mock.patch("django_spanner.base.registry"):
+            connection = self.db_wrapper.get_new_connection(conn_params)
+            default = self.db_wrapper.get_new_connection(
+                dict(conn_params, async_ddl=False)
+            )
+
+        self.assertIs(connection.async_ddl, True)
+        self.assertIs(default.async_ddl, False)
+
+    def test_get_new_connection_invalid_staleness(self):
+        from django.core.exceptions import ImproperlyConfigured
+
+        conn_params = {
+            "project": self.PROJECT,
+            "instance_id": self.INSTANCE_ID,
+            "database_id": self.DATABASE_ID,
+            "staleness": {"max_staleness": "soon"},
+        }
+        with self.assertRaises(ImproperlyConfigured):
+            self.db_wrapper.get_new_connection(conn_params)
+
+    def test_get_new_connection_pool_and_pool_options(self):
+        from django.core.exceptions import ImproperlyConfigured
+
+        conn_params = {
+            "project": self.PROJECT,
+            "instance_id": self.INSTANCE_ID,
+            "database_id": self.DATABASE_ID,
+            "pool": mock.Mock(),
+            "pool_size": 5,
+        }
+        with self.assertRaises(ImproperlyConfigured):
+            self.db_wrapper.get_new_connection(conn_params)
+
+    def test_pool_stats(self):
+        with mock.patch("django_spanner.base.registry") as mock_registry:
+            database = mock_registry.get_database.return_value
+            database._pool.stats.return_value = {"in_use": 1}
+            self.assertEqual(self.db_wrapper.pool_stats, {"in_use": 1})
+
+            database._pool = object()
+            self.assertIsNone(self.db_wrapper.pool_stats)
+
+    def test_warm_up(self):
+        with mock.patch("django_spanner.base.registry") as mock_registry:
+            self.db_wrapper.warm_up()
+        database = mock_registry.get_database.return_value
+        database._pool.warm_up.assert_called_once_with()
 
     def test_init_connection_state(self):
         self.db_wrapper.connection = mock_connection = mock.MagicMock()
-        mock_connection.close = mock_close = mock.MagicMock()
         self.db_wrapper.init_connection_state()
-        mock_close.assert_called_once_with()
+        mock_connection.close.assert_not_called()
 
     def test_create_cursor(self):
+        from django_spanner.base import CursorWrapper
+
         self.db_wrapper.connection = mock_connection = mock.MagicMock()
         mock_connection.cursor = mock_cursor = mock.MagicMock()
-        self.db_wrapper.create_cursor()
+        cursor = self.db_wrapper.create_cursor()
         mock_cursor.assert_called_once_with()
+        self.assertIsInstance(cursor, CursorWrapper)
+        self.assertIs(cursor.cursor, mock_cursor.return_value)
+
+    def test_cursor_wrapper_records_rpc(self):
+        from django_spanner.base import CursorWrapper
+
+        self.db_wrapper._last_rpc_success = None
+        mock_cursor = mock.MagicMock()
+        cursor = CursorWrapper(mock_cursor, self.db_wrapper)
+        cursor.execute("SELECT 1")
+        mock_cursor.execute.assert_called_once_with("SELECT 1", None)
+        self.assertIsNotNone(self.db_wrapper._last_rpc_success)
+        self.assertIs(cursor.rowcount, mock_cursor.rowcount)
+
+        mock_cursor.executemany.side_effect = ValueError
+        with self.assertRaises(ValueError):
+            cursor.executemany("INSERT", [])
+        self.assertIsNone(self.db_wrapper._last_rpc_success)
 
     def test_set_autocommit(self):
         self.db_wrapper.connection = mock_connection = mock.MagicMock()
@@ -66,14 +206,88 @@ class TestBase(SpannerSimpleTestClass):
         self.assertTrue(self.db_wrapper.is_usable())
 
     def test_is_usable_with_error(self):
+        from google.cloud import spanner_dbapi
         from google.cloud.spanner_dbapi.exceptions import Error
 
+        self.db_wrapper.Database = spanner_dbapi
         self.db_wrapper.connection = mock_connection = mock.MagicMock()
+        mock_connection.is_closed = False
         mock_connection.cursor = mock.MagicMock(side_effect=Error)
+        failures = self.db_wrapper.health_check_stats["failures"]
         self.assertFalse(self.db_wrapper.is_usable())
+        stats = self.db_wrapper.health_check_stats
+        self.assertEqual(stats["failures"], failures + 1)
+        self.assertFalse(stats["last_probe_ok"])
+
+    def test_is_usable_trusts_recent_rpc(self):
+        self.OPTIONS["health_check_ttl"] = 30
+        self.addCleanup(self.OPTIONS.pop, "health_check_ttl")
+        self.db_wrapper.connection = mock_connection = mock.MagicMock()
+        mock_connection.is_closed = False
+        self.db_wrapper._last_rpc_success = None
+        stats = self.db_wrapper.health_check_stats
+        probes, skipped = stats["probes"], stats["skipped"]
+
+        self.assertTrue(self.db_wrapper.is_usable())
+        self.assertTrue(self.db_wrapper.is_usable())
+        mock_connection.cursor.assert_called_once_with()
+        self.assertEqual(stats["probes"], probes + 1)
+        self.assertEqual(stats["skipped"], skipped + 1)
+        self.assertTrue(stats["last_probe_ok"])
+        self.assertIsNotNone(stats["last_probe_latency"])
+
+    def test_is_usable_probes_after_ttl(self):
+        self.OPTIONS["health_check_ttl"] = 30
+        self.addCleanup(self.OPTIONS.pop, "health_check_ttl")
+        self.db_wrapper.connection = mock_connection = mock.MagicMock()
+        mock_connection.is_closed = False
+        with mock.patch("django_spanner.base.time.monotonic") as monotonic:
+            monotonic.return_value = 100
+            self.db_wrapper._last_rpc_success = 60
+            self.assertTrue(self.db_wrapper.is_usable())
+        mock_connection.cursor.return_value.execute.assert_called_once_with(
+            "SELECT 1"
+        )
 
     def test_start_transaction_under_autocommit(self):
         self.db_wrapper.connection = mock_connection = mock.MagicMock()
-        mock_connection.cursor = mock_cursor = mock.MagicMock()
         self.db_wrapper._start_transaction_under_autocommit()
-        mock_cursor.assert_called_once_with()
+        mock_connection.begin.assert_called_once_with()
+        mock_connection.cursor.assert_not_called()
+
+    def test_start_transaction_under_autocommit_not_allowed(self):
+        self.settings_dict["ALLOW_TRANSACTIONS_IN_AUTO_COMMIT"] = False
+        self.addCleanup(
+            self.settings_dict.pop, "ALLOW_TRANSACTIONS_IN_AUTO_COMMIT"
+        )
+        self.db_wrapper.connection = mock_connection = mock.MagicMock()
+        self.db_wrapper._start_transaction_under_autocommit()
+        mock_connection.begin.assert_not_called()
+        mock_connection.cursor.assert_not_called()
+
+    def test_read_only_snapshot(self):
+        self.db_wrapper.connection = mock_connection = mock.MagicMock()
+        mock_connection.is_closed = False
+        mock_connection._client_transaction_started = False
+        self.db_wrapper.autocommit = True
+        self.db_wrapper.in_read_only_snapshot = False
+
+        self.assertTrue(self.db_wrapper.start_read_only_snapshot())
+        self.assertTrue(mock_connection.read_only)
+        mock_connection.begin.assert_called_once_with()
+        self.assertFalse(self.db_wrapper.start_read_only_snapshot())
+
+        self.db_wrapper._end_snapshot_before_write("SELECT 1")
+        self.assertTrue(self.db_wrapper.in_read_only_snapshot)
+        self.db_wrapper._end_snapshot_before_write("UPDATE t SET a = 1")
+        self.assertFalse(self.db_wrapper.in_read_only_snapshot)
+        mock_connection.commit.assert_called_once_with()
+        self.assertFalse(mock_connection.read_only)
+
+    def test_read_only_snapshot_in_transaction(self):
+        self.db_wrapper.connection = mock_connection = mock.MagicMock()
+        self.db_wrapper.autocommit = False
+        self.addCleanup(setattr, self.db_wrapper, "autocommit", True)
+        self.db_wrapper.in_read_only_snapshot = False
+        self.assertFalse(self.db_wrapper.start_read_only_snapshot())
+        mock_connection.begin.assert_not_called()
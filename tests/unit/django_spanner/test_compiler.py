@@ -4,9 +4,12 @@
 # license that can be found in the LICENSE file or at
 # https://developers.google.com/open-source/licenses/bsd
 
+from unittest import mock
+
 from django.core.exceptions import EmptyResultSet
+from django.db.models.sql import InsertQuery
 from django.db.utils import DatabaseError
-from django_spanner.compiler import SQLCompiler
+from django_spanner.compiler import SQLCompiler, SQLInsertCompiler
 from django.db.models.query import QuerySet
 from django_spanner import USING_DJANGO_3
 from tests.unit.django_spanner.simple_test import SpannerSimpleTestClass
@@ -240,3 +243,30 @@ class TestCompiler(SpannerSimpleTestClass):
         compiler = SQLCompiler(QuerySet().query, self.connection, "default")
         with self.assertRaises(EmptyResultSet):
             compiler.get_combinator_sql("union", False)
+
+    def test_insert_ignore_conflicts_isnt_a_mutation(self):
+        query = InsertQuery(Number)
+        query.insert_values(
+            Number._meta.concrete_fields,
+            [
+                Number(id=1, num=1, decimal_num=1, item_id=1),
+                Number(id=2, num=2, decimal_num=2, item_id=1),
+            ],
+        )
+        # The query as Django 3.2 makes it, without on_conflict.
+        query.__dict__.pop("on_conflict", None)
+        query.ignore_conflicts = True
+        compiler = query.get_compiler(connection=self.connection)
+        with mock.patch(
+            "django_spanner.compiler.USING_DJANGO_3", True
+        ), mock.patch.object(
+            self.connection, "can_buffer_mutations", return_value=True
+        ), mock.patch.object(
+            SQLInsertCompiler, "as_mutation"
+        ) as as_mutation, mock.patch(
+            "django.db.models.sql.compiler.SQLInsertCompiler.execute_sql",
+            return_value=[],
+        ) as execute_sql:
+            compiler.execute_sql()
+        as_mutation.assert_not_called()
+        execute_sql.assert_called_once_with(None)
@@ -0,0 +1,190 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import datetime
+import unittest
+from unittest import mock
+
+from django_spanner.connection import Connection, Cursor
+
+
+class TestConnection(unittest.TestCase):
+    def _make_connection(self):
+        database = mock.Mock()
+        connection = Connection(database._instance, database)
+        connection.autocommit = False
+        return connection
+
+    def test_transaction_checkout_doesnt_begin(self):
+        connection = self._make_connection()
+        transaction = connection.transaction_checkout()
+        session = connection.database._pool.get.return_value
+        self.assertIs(transaction, session.transaction.return_value)
+        transaction.begin.assert_not_called()
+        self.assertTrue(connection._spanner_transaction_started)
+        self.assertIs(connection.transaction_checkout(), transaction)
+
+    def test_commit_not_begun_transaction(self):
+        connection = self._make_connection()
+        transaction = connection.transaction_checkout()
+        transaction._transaction_id = None
+        transaction._mutations = []
+        connection.commit()
+        transaction.commit.assert_not_called()
+        self.assertFalse(connection._spanner_transaction_started)
+        connection.database._pool.put.assert_called_once()
+
+    def test_commit(self):
+        connection = self._make_connection()
+        transaction = connection.transaction_checkout()
+        transaction._transaction_id = b"id"
+        transaction.committed = datetime.datetime(2026, 1, 1)
+        connection.commit()
+        transaction.commit.assert_called_once_with()
+        self.assertFalse(connection._spanner_transaction_started)
+        self.assertEqual(connection.commit_timestamp, transaction.committed)
+
+    def test_cursor_records_autocommit_dml(self):
+        connection = self._make_connection()
+        connection.autocommit = True
+        transaction = mock.Mock(committed=datetime.datetime(2026, 1, 1))
+        cursor = connection.cursor()
+        self.assertIsInstance(cursor, Cursor)
+
+        def execute(sql, args=None):
+            connection._transaction = transaction
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi.Cursor.execute", side_effect=execute
+        ):
+            cursor.execute("UPDATE t SET a = 1 WHERE TRUE")
+        self.assertEqual(connection.commit_timestamp, transaction.committed)
+        # Older commits don't replace the latest timestamp.
+        connection._record_commit(
+            mock.Mock(committed=datetime.datetime(2025, 1, 1))
+        )
+        self.assertEqual(connection.commit_timestamp, transaction.committed)
+
+    def test_snapshot_checkout_bounded_staleness(self):
+        connection = self._make_connection()
+        connection.read_only = True
+        connection.staleness = {
+            "max_staleness": datetime.timedelta(seconds=15)
+        }
+        with mock.patch("django_spanner.connection.Snapshot") as snapshot:
+            self.assertIs(
+                connection.snapshot_checkout(), snapshot.return_value
+            )
+        snapshot.assert_called_once_with(
+            connection.database._pool.get.return_value,
+            multi_use=True,
+            exact_staleness=datetime.timedelta(seconds=15),
+        )
+        snapshot.return_value.begin.assert_called_once_with()
+
+    def test_buffer_mutation_without_transaction(self):
+        connection = self._make_connection()
+        connection.autocommit = True
+        with self.assertRaises(ValueError):
+            connection.buffer_mutation("insert", "t", ["a"], [[1]])
+
+    def test_commit_mutations_only(self):
+        connection = self._make_connection()
+        connection.buffer_mutation("insert", "t", ["a"], [[1], [2]])
+        with mock.patch("django_spanner.connection.Batch") as batch_class:
+            batch = batch_class.return_value
+            batch.committed = datetime.datetime(2026, 1, 1)
+            connection.commit()
+        batch_class.assert_called_once_with(
+            connection.database._pool.get.return_value
+        )
+        batch.insert.assert_called_once_with("t", ["a"], [[1], [2]])
+        batch.commit.assert_called_once()
+        self.assertEqual(connection.commit_timestamp, batch.committed)
+        self.assertEqual(connection._pending_mutations, [])
+        connection.database._pool.put.assert_called_once()
+
+    def test_commit_mutations_with_transaction(self):
+        connection = self._make_connection()
+        transaction = connection.transaction_checkout()
+        transaction._transaction_id = b"id"
+        connection.buffer_mutation("insert", "t", ["a"], [[1]])
+        connection.commit()
+        transaction.insert.assert_called_once_with("t", ["a"], [[1]])
+        transaction.commit.assert_called_once_with()
+        self.assertEqual(connection._pending_mutations, [])
+
+    def test_commit_delete_mutation(self):
+        connection = self._make_connection()
+        transaction = connection.transaction_checkout()
+        transaction._transaction_id = b"id"
+        connection.buffer_mutation("delete", "t", ["id"], [[1], [2]])
+        connection.commit()
+        ((table, keyset), _) = transaction.delete.call_args
+        self.assertEqual(table, "t")
+        self.assertEqual(keyset.keys, [[1], [2]])
+
+    def test_rollback_discards_mutations(self):
+        connection = self._make_connection()
+        connection.buffer_mutation("insert", "t", ["a"], [[1]])
+        connection.rollback()
+        self.assertEqual(connection._pending_mutations, [])
+
+    def test_run_prior_ddl_statements(self):
+        connection = self._make_connection()
+        connection._ddl_statements = ["CREATE TABLE t", "CREATE INDEX i ON t"]
+        with self.assertLogs("django_spanner.connection", "INFO") as logs:
+            connection.run_prior_DDL_statements()
+        database = connection.database
+        database.update_ddl.assert_called_once_with(
+            ["CREATE TABLE t", "CREATE INDEX i ON t"]
+        )
+        database.update_ddl.return_value.result.assert_called_once_with()
+        database._instance.list_database_operations.assert_not_called()
+        self.assertIn("Ran 2 DDL statements", logs.output[0])
+
+    def test_run_prior_ddl_statements_async(self):
+        connection = self._make_connection()
+        connection.async_ddl = True
+        database = connection.database
+        database.name = "db"
+        running = mock.Mock()
+        running.metadata.database = "db"
+        other = mock.Mock()
+        other.metadata.database = "other-db"
+        database._instance.list_database_operations.return_value = [
+            other,
+            running,
+        ]
+        table, index = mock.Mock(), mock.Mock()
+        database.update_ddl.side_effect = [table, index]
+        long_running = [
+            "CREATE UNIQUE NULL_FILTERED INDEX i ON t (c)",
+            "ALTER TABLE t ADD CONSTRAINT fk FOREIGN KEY (c) REFERENCES u (c)",
+        ]
+        connection._ddl_statements = ["CREATE TABLE t"] + long_running
+        connection.run_prior_DDL_statements()
+
+        running.result.assert_called_once_with()
+        other.result.assert_not_called()
+        self.assertEqual(
+            database.update_ddl.call_args_list,
+            [
+                mock.call(["CREATE TABLE t"]),
+                mock.call(long_running),
+            ],
+        )
+        table.result.assert_called_once_with()
+        index.result.assert_not_called()
+        self.assertEqual(connection._ddl_statements, [])
+        self.assertEqual(connection._ddl_operations, [index])
+
+        # The next schema change waits for the indexes to be built.
+        connection._ddl_statements = ["DROP TABLE u"]
+        database.update_ddl.side_effect = None
+        connection.run_prior_DDL_statements()
+        index.result.assert_called_once_with()
+        database._instance.list_database_operations.assert_called_once()
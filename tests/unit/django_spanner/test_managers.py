@@ -0,0 +1,90 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import datetime
+import unittest
+
+from django_spanner.managers import SpannerQuerySet
+from tests.unit.django_spanner.models import Item
+
+
+class TestSpannerQuerySet(unittest.TestCase):
+    def test_stale_seconds(self):
+        queryset = SpannerQuerySet(Item).stale(seconds=10)
+        self.assertEqual(
+            queryset.query.spanner_staleness,
+            {"max_staleness": datetime.timedelta(seconds=10)},
+        )
+
+    def test_stale_is_kept_by_chaining(self):
+        queryset = SpannerQuerySet(Item).stale(exact_staleness=5)
+        queryset = queryset.filter(item_id=1).select_related()
+        self.assertEqual(
+            queryset.query.spanner_staleness,
+            {"exact_staleness": datetime.timedelta(seconds=5)},
+        )
+
+    def test_stale_doesnt_change_original(self):
+        queryset = SpannerQuerySet(Item)
+        queryset.stale(seconds=10)
+        self.assertFalse(hasattr(queryset.query, "spanner_staleness"))
+
+    def test_chunked(self):
+        queryset = SpannerQuerySet(Item).chunked(size=500, parallel=4)
+        queryset = queryset.filter(item_id=1)
+        self.assertEqual(
+            queryset.query.spanner_chunking,
+            {"size": 500, "parallel": 4, "progress": None},
+        )
+
+    def test_chunked_invalid(self):
+        with self.assertRaises(ValueError):
+            SpannerQuerySet(Item).chunked(size=0)
+        with self.assertRaises(ValueError):
+            SpannerQuerySet(Item).chunked(parallel=0)
+
+    def test_stale_invalid(self):
+        with self.assertRaises(ValueError):
+            SpannerQuerySet(Item).stale()
+        with self.assertRaises(ValueError):
+            SpannerQuerySet(Item).stale(seconds=10, exact_staleness=5)
+
+    def test_read_timestamp(self):
+        timestamp = datetime.datetime(2026, 1, 1)
+        queryset = SpannerQuerySet(Item).read_timestamp(timestamp)
+        self.assertEqual(
+            queryset.query.spanner_staleness, {"read_timestamp": timestamp}
+        )
+
+    def test_update_mutation(self):
+        items = [
+            Item(id=1, item_id=10, name="a"),
+            Item(id=2, item_id=20, name="b"),
+            Item(id=3, item_id=30, name="c"),
+        ]
+        table, columns, batches = SpannerQuerySet(Item)._update_mutation(
+            items, ["name", "item_id"], batch_size=2
+        )
+        self.assertEqual(table, Item._meta.db_table)
+        self.assertEqual(columns, ["id", "name", "item_id"])
+        self.assertEqual(
+            batches, [[[1, "a", 10], [2, "b", 20]], [[3, "c", 30]]]
+        )
+
+    def test_update_mutation_needs_dml(self):
+        from django.db.models import F
+
+        queryset = SpannerQuerySet(Item)
+        item = Item(id=1, name="a")
+        self.assertIsNone(queryset._update_mutation([], ["name"], None))
+        self.assertIsNone(queryset._update_mutation([item], [], None))
+        self.assertIsNone(queryset._update_mutation([item], ["id"], None))
+        self.assertIsNone(queryset._update_mutation([item], ["x"], None))
+        self.assertIsNone(
+            queryset._update_mutation([Item(id=None)], ["name"], None)
+        )
+        item.name = F("name")
+        self.assertIsNone(queryset._update_mutation([item], ["name"], None))
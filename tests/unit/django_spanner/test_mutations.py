@@ -0,0 +1,110 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import unittest
+
+from django.db.utils import OperationalError
+from google.api_core.exceptions import (
+    AlreadyExists,
+    DeadlineExceeded,
+    InvalidArgument,
+    NotFound,
+)
+
+from django_spanner.mutations import (
+    MAX_MUTATIONS,
+    BatchSizer,
+    BatchWriteResult,
+    GroupResult,
+    is_size_error,
+    mutation_batch_size,
+    mutations_per_row,
+    secondary_indexes,
+)
+
+
+class TestMutations(unittest.TestCase):
+    def test_mutation_batch_size(self):
+        self.assertEqual(mutation_batch_size(4), MAX_MUTATIONS // 4)
+        self.assertEqual(mutation_batch_size(0), MAX_MUTATIONS)
+        self.assertEqual(mutation_batch_size(MAX_MUTATIONS * 2), 1)
+
+    def test_batch_write_result(self):
+        ok = GroupResult("a", [object()])
+        ok.code = 0
+        failed = GroupResult("b", [object()])
+        failed.code = 6
+        unknown = GroupResult("c", [object()])
+        result = BatchWriteResult([ok, failed, unknown])
+        self.assertEqual(result.succeeded, [ok])
+        self.assertEqual(result.failed, [failed, unknown])
+        self.assertEqual(list(result), [ok, failed, unknown])
+
+    def test_secondary_indexes(self):
+        from tests.unit.django_spanner.models import Author, Item
+
+        self.assertEqual(secondary_indexes(Item), [])
+        self.assertEqual(secondary_indexes(Author), [("num",)])
+
+    def test_mutations_per_row(self):
+        from tests.unit.django_spanner.models import Author
+
+        self.assertEqual(mutations_per_row(Author, ["id", "num"]), 3)
+        self.assertEqual(mutations_per_row(Author, ["id", "name"]), 2)
+
+    def test_is_size_error(self):
+        self.assertTrue(
+            is_size_error(
+                InvalidArgument("The transaction contains too many mutations.")
+            )
+        )
+        self.assertTrue(is_size_error(DeadlineExceeded("Deadline Exceeded")))
+        self.assertFalse(is_size_error(InvalidArgument("Invalid value")))
+        self.assertFalse(is_size_error(Exception("Too many mutations")))
+
+    def test_is_size_error_wrapped(self):
+        try:
+            try:
+                raise DeadlineExceeded("Deadline Exceeded")
+            except DeadlineExceeded as exc:
+                raise OperationalError("Deadline Exceeded") from exc
+        except OperationalError as exc:
+            self.assertTrue(is_size_error(exc))
+
+    def test_is_size_error_other_mutation_errors(self):
+        self.assertFalse(
+            is_size_error(AlreadyExists("Row [1] of the mutation exists"))
+        )
+        self.assertFalse(is_size_error(NotFound("Mutation row not found")))
+
+
+class TestBatchSizer(unittest.TestCase):
+    def test_starts_at_max_size(self):
+        sizer = BatchSizer()
+        self.assertEqual(sizer.batch_size("t", 100), 100)
+
+    def test_slow_write_halves_size(self):
+        sizer = BatchSizer(target_latency=1)
+        sizer.batch_size("t", 100)
+        sizer.record("t", 100, 2.0)
+        self.assertEqual(sizer.batch_size("t", 100), 50)
+        self.assertEqual(sizer.stats()["t"]["last_latency"], 2.0)
+
+    def test_fast_full_batches_grow_size(self):
+        sizer = BatchSizer(target_latency=1)
+        sizer.batch_size("t", 100)
+        sizer.record("t", 100, 2.0)
+        sizer.record("t", 50, 0.1)
+        self.assertEqual(sizer.batch_size("t", 100), 76)
+        sizer.record("t", 76, 0.1)
+        self.assertEqual(sizer.batch_size("t", 100), 100)
+        self.assertIsNone(sizer.stats()["t"]["size"])
+
+    def test_error_halves_size(self):
+        sizer = BatchSizer()
+        sizer.record_error("t", 10)
+        self.assertEqual(sizer.batch_size("t", 100), 5)
+        self.assertEqual(sizer.stats()["t"]["errors"], 1)
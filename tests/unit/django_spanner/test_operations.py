@@ -7,6 +7,7 @@
 from base64 import b64encode
 from datetime import timedelta
 from decimal import Decimal
+from unittest import mock
 from django.conf import settings
 from django.core.management.color import no_style
 from django.db.utils import DatabaseError
@@ -35,6 +36,79 @@ class TestOperations(SpannerSimpleTestClass):
             self.db_operations.connection.features.max_query_params,
         )
 
+    def test_bulk_batch_size_mutations(self):
+        from django_spanner.mutations import MAX_MUTATIONS
+        from tests.unit.django_spanner.models import Author
+
+        fields = Author._meta.concrete_fields
+        connection = self.db_operations.connection
+        with mock.patch.object(
+            connection, "can_buffer_mutations", return_value=True
+        ):
+            # Six columns and the unique index of num.
+            self.assertEqual(
+                self.db_operations.bulk_batch_size(fields, objs=None),
+                MAX_MUTATIONS // 7,
+            )
+        with mock.patch.object(
+            connection, "can_buffer_mutations", return_value=False
+        ):
+            self.assertEqual(
+                self.db_operations.bulk_batch_size(fields, objs=None),
+                connection.features.max_query_params // 6,
+            )
+        self.assertEqual(
+            self.db_operations.bulk_batch_size(["pk", "pk", "a"], objs=None),
+            connection.features.max_query_params // 3,
+        )
+
+    def test_bulk_batch_size_adapts(self):
+        from tests.unit.django_spanner.models import Author
+
+        fields = Author._meta.concrete_fields
+        connection = self.db_operations.connection
+        sizer = connection.bulk_batch_sizer
+        self.addCleanup(sizer._tables.clear)
+        with mock.patch.object(
+            connection, "can_buffer_mutations", return_value=True
+        ):
+            size = self.db_operations.bulk_batch_size(fields, objs=None)
+            sizer.record(Author._meta.db_table, size, 60)
+            self.assertEqual(
+                self.db_operations.bulk_batch_size(fields, objs=None),
+                size // 2,
+            )
+        stats = connection.bulk_batch_sizes[Author._meta.db_table]
+        self.assertEqual(stats["size"], size // 2)
+        self.assertEqual(stats["max_size"], size)
+
+    def test_bulk_batch_size_dml(self):
+        from tests.unit.django_spanner.models import Author
+
+        fields = Author._meta.concrete_fields
+        table = Author._meta.db_table
+        connection = self.db_operations.connection
+        self.addCleanup(connection.bulk_batch_sizer._tables.clear)
+        self.addCleanup(connection.bulk_dml_sizer._tables.clear)
+        max_size = connection.features.max_query_params // 6
+        with mock.patch.object(
+            connection, "can_buffer_mutations", return_value=False
+        ):
+            size = self.db_operations.bulk_batch_size(fields, objs=None)
+            self.assertEqual(size, max_size)
+            # Slow mutations don't shrink the DML statements.
+            connection.bulk_batch_sizer.record(table, 10, 60)
+            self.assertEqual(
+                self.db_operations.bulk_batch_size(fields, objs=None), size
+            )
+            # Fast statements don't grow past the query parameters.
+            connection.bulk_dml_sizer.record(table, size, 60)
+            for _ in range(5):
+                size = self.db_operations.bulk_batch_size(fields, objs=None)
+                connection.bulk_dml_sizer.record(table, size, 0)
+            self.assertEqual(size, max_size)
+        self.assertIn(table, connection.bulk_dml_batch_sizes)
+
     def test_sql_flush(self):
         self.assertEqual(
             self.db_operations.sql_flush(
@@ -348,3 +422,32 @@ class TestOperations(SpannerSimpleTestClass):
             ),
             "%s",
         )
+
+    def test_insert_statement(self):
+        from django.db.models.constants import OnConflict
+
+        self.assertEqual(self.db_operations.insert_statement(), "INSERT INTO")
+        self.assertEqual(
+            self.db_operations.insert_statement(on_conflict=OnConflict.UPDATE),
+            "INSERT OR UPDATE INTO",
+        )
+        self.assertEqual(
+            self.db_operations.insert_statement(on_conflict=OnConflict.IGNORE),
+            "INSERT OR IGNORE INTO",
+        )
+
+    def test_check_update_conflicts(self):
+        from django.db import NotSupportedError
+        from tests.unit.django_spanner.models import Item
+
+        fields = Item._meta.concrete_fields
+        columns = [field.column for field in fields if not field.primary_key]
+        self.db_operations.check_update_conflicts(fields, columns, ["id"])
+        with self.assertRaises(NotSupportedError):
+            self.db_operations.check_update_conflicts(
+                fields, columns, ["name"]
+            )
+        with self.assertRaises(NotSupportedError):
+            self.db_operations.check_update_conflicts(
+                fields, columns[1:], ["id"]
+            )
@@ -0,0 +1,184 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import datetime
+import queue
+import time
+import unittest
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from google.cloud.spanner_v1 import BatchCreateSessionsResponse, Session
+
+from django_spanner.pool import (
+    AliasPool,
+    BurstyPool,
+    FixedSizePool,
+    PingingPool,
+    make_pool,
+)
+
+
+def _make_database():
+    database = mock.Mock()
+    database.name = "projects/p/instances/i/databases/d"
+    database.database_role = None
+    database._route_to_leader_enabled = False
+    database.spanner_api.batch_create_sessions.side_effect = (
+        lambda request, metadata, **kwargs: BatchCreateSessionsResponse(
+            session=[
+                Session(name="%s/sessions/%d" % (database.name, i))
+                for i in range(request.session_count)
+            ]
+        )
+    )
+    database.session.side_effect = lambda **kwargs: mock.Mock(
+        last_use_time=datetime.datetime.utcnow()
+    )
+    return database
+
+
+class TestMakePool(unittest.TestCase):
+    def test_default(self):
+        pool = make_pool()
+        self.assertIsInstance(pool, BurstyPool)
+        self.assertEqual(pool.target_size, 10)
+
+    def test_fixed(self):
+        pool = make_pool(
+            pool_type="fixed", pool_size=5, pool_default_timeout=3
+        )
+        self.assertIsInstance(pool, FixedSizePool)
+        self.assertEqual(pool.size, 5)
+        self.assertEqual(pool.default_timeout, 3)
+
+    def test_pinging(self):
+        pool = make_pool(
+            pool_type="pinging",
+            pool_size=5,
+            pool_ping_interval=60,
+            pool_keep_alive=30,
+        )
+        self.assertIsInstance(pool, PingingPool)
+        self.assertEqual(pool.keep_alive, 30)
+
+    def test_unknown_type(self):
+        with self.assertRaises(ImproperlyConfigured):
+            make_pool(pool_type="huge")
+
+    def test_keep_alive_requires_pinging_pool(self):
+        with self.assertRaises(ImproperlyConfigured):
+            make_pool(pool_type="fixed", pool_keep_alive=30)
+
+
+class TestPoolStats(unittest.TestCase):
+    def test_bursty_pool(self):
+        pool = BurstyPool(target_size=2)
+        pool.bind(_make_database())
+        session = pool.get()
+        self.assertEqual(
+            pool.stats(),
+            {"size": 2, "in_use": 1, "idle": 0, "created": 1, "expired": 0},
+        )
+        pool.put(session)
+        self.assertEqual(pool.stats()["in_use"], 0)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_bursty_pool_expired_session(self):
+        pool = BurstyPool(target_size=2)
+        pool.bind(_make_database())
+        session = pool.get()
+        pool.put(session)
+        session.exists.return_value = False
+        self.assertIsNot(pool.get(), session)
+        stats = pool.stats()
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["expired"], 1)
+
+    def test_fixed_pool(self):
+        pool = FixedSizePool(size=3)
+        pool.bind(_make_database())
+        self.assertEqual(pool.stats()["created"], 3)
+        self.assertEqual(pool.stats()["idle"], 3)
+        pool.get()
+        self.assertEqual(pool.stats()["in_use"], 1)
+        self.assertEqual(pool.stats()["idle"], 2)
+
+
+class TestWarmUp(unittest.TestCase):
+    def test_bursty_pool(self):
+        database = _make_database()
+        pool = BurstyPool(target_size=3)
+        pool.bind(database)
+        self.assertEqual(pool.warm_up(), 3)
+        database.spanner_api.batch_create_sessions.assert_called_once()
+        self.assertEqual(pool.stats()["idle"], 3)
+        self.assertEqual(pool.stats()["in_use"], 0)
+
+    def test_sessions_in_use_are_not_replaced(self):
+        database = _make_database()
+        pool = FixedSizePool(size=3)
+        pool.bind(database)
+        pool.get()
+        self.assertEqual(pool.warm_up(), 0)
+        self.assertEqual(
+            database.spanner_api.batch_create_sessions.call_count, 1
+        )
+
+
+class TestKeepAlive(unittest.TestCase):
+    def test_pings_in_background(self):
+        pool = PingingPool(size=1, keep_alive=0.01)
+        with mock.patch.object(PingingPool, "ping") as mock_ping:
+            pool.bind(_make_database())
+            deadline = time.time() + 5
+            while not mock_ping.called and time.time() < deadline:
+                time.sleep(0.01)
+            pool.close()
+        mock_ping.assert_called()
+        pool._keep_alive_thread.join(5)
+        self.assertFalse(pool._keep_alive_thread.is_alive())
+
+    def test_no_thread_without_keep_alive(self):
+        pool = PingingPool(size=1)
+        pool.bind(_make_database())
+        self.assertIsNone(pool._keep_alive_thread)
+
+
+class TestAliasPool(unittest.TestCase):
+    def _make_pool(self, max_sessions=None):
+        shared = FixedSizePool(size=3, default_timeout=1)
+        shared.bind(_make_database())
+        return shared, AliasPool(shared, "secondary", max_sessions)
+
+    def test_get_and_put_use_shared_pool(self):
+        shared, pool = self._make_pool()
+        pool.bind(mock.Mock())
+        session = pool.get()
+        self.assertEqual(shared.stats()["in_use"], 1)
+        self.assertEqual(pool.stats()["alias_in_use"], 1)
+        pool.put(session)
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 3)
+        self.assertEqual(stats["alias"], "secondary")
+        self.assertEqual(stats["alias_in_use"], 0)
+
+    def test_max_sessions(self):
+        shared, pool = self._make_pool(max_sessions=1)
+        session = pool.get()
+        with self.assertRaises(queue.Empty):
+            pool.get(timeout=0.01)
+        # Other aliases aren't limited by this one.
+        shared.put(shared.get())
+        pool.put(session)
+        pool.put(pool.get())
+        self.assertEqual(shared.stats()["in_use"], 0)
+
+    def test_clear_keeps_shared_sessions(self):
+        shared, pool = self._make_pool()
+        pool.clear()
+        self.assertEqual(shared.stats()["idle"], 3)
@@ -0,0 +1,222 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import threading
+import unittest
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+
+from django_spanner.pool import AliasPool
+from django_spanner.registry import Registry
+
+
+class TestRegistry(unittest.TestCase):
+    PROJECT = "project"
+    INSTANCE_ID = "instance_id"
+    DATABASE_ID = "database_id"
+
+    def setUp(self):
+        self.registry = Registry()
+        patcher = mock.patch("django_spanner.registry.spanner.Client")
+        self.mock_client = patcher.start()
+        self.mock_client.side_effect = self._make_client
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _make_client(**kwargs):
+        client = mock.Mock(project=kwargs["project"])
+        client.instance.return_value.database.side_effect = (
+            lambda *args, **kwargs: mock.Mock()
+        )
+        return client
+
+    def test_get_client_is_cached(self):
+        client = self.registry.get_client(self.PROJECT, user_agent="ua")
+        self.assertIs(
+            self.registry.get_client(self.PROJECT, user_agent="ua"), client
+        )
+        self.assertIsNot(
+            self.registry.get_client(self.PROJECT, user_agent="other"),
+            client,
+        )
+        self.assertEqual(self.mock_client.call_count, 2)
+        self.assertEqual(self.registry.stats()["clients_created"], 2)
+        self.assertEqual(self.registry.stats()["cache_hits"], 1)
+
+    def test_get_client_with_unhashable_client_options(self):
+        client = self.registry.get_client(
+            self.PROJECT, client_options={"api_endpoint": "localhost:9010"}
+        )
+        self.assertIs(
+            self.registry.get_client(
+                self.PROJECT,
+                client_options={"api_endpoint": "localhost:9010"},
+            ),
+            client,
+        )
+
+    def test_get_client_from_service_account_json(self):
+        self.registry.get_client(self.PROJECT, credentials="/path/key.json")
+        self.mock_client.from_service_account_json.assert_called_once()
+        self.mock_client.assert_not_called()
+
+    def test_get_client_user_provided(self):
+        user_client = mock.Mock(project=self.PROJECT)
+        self.assertIs(
+            self.registry.get_client(self.PROJECT, client=user_client),
+            user_client,
+        )
+        self.assertEqual(self.registry.stats()["clients_created"], 0)
+
+    def test_get_client_user_provided_wrong_project(self):
+        with self.assertRaises(ValueError):
+            self.registry.get_client(
+                self.PROJECT, client=mock.Mock(project="other")
+            )
+
+    def test_get_instance_is_cached(self):
+        instance = self.registry.get_instance(self.PROJECT, self.INSTANCE_ID)
+        self.assertIs(
+            self.registry.get_instance(self.PROJECT, self.INSTANCE_ID),
+            instance,
+        )
+        self.assertEqual(self.registry.stats()["instances_created"], 1)
+
+    def test_get_database_is_cached(self):
+        database = self.registry.get_database(
+            self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID
+        )
+        self.assertIs(
+            self.registry.get_database(
+                self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID
+            ),
+            database,
+        )
+        instance = self.registry.get_instance(self.PROJECT, self.INSTANCE_ID)
+        instance.database.assert_called_once_with(
+            self.DATABASE_ID, pool=mock.ANY, database_role=None
+        )
+        stats = self.registry.stats()
+        self.assertEqual(stats["clients_created"], 1)
+        self.assertEqual(stats["databases_created"], 1)
+        self.assertEqual(stats["channels_created"], 1)
+
+    def test_get_database_keyed_by_pool(self):
+        first = self.registry.get_database(
+            self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID, pool=object()
+        )
+        second = self.registry.get_database(
+            self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID, pool=object()
+        )
+        self.assertEqual(self.registry.stats()["databases_created"], 2)
+        self.assertEqual(self.registry.stats()["clients_created"], 1)
+        self.assertIsNot(first, second)
+
+    def test_get_database_with_pool_options(self):
+        from django_spanner.pool import FixedSizePool
+
+        self.registry.get_database(
+            self.PROJECT,
+            self.INSTANCE_ID,
+            self.DATABASE_ID,
+            pool_options={"pool_type": "fixed", "pool_size": 3},
+        )
+        instance = self.registry.get_instance(self.PROJECT, self.INSTANCE_ID)
+        pool = instance.database.call_args[1]["pool"]
+        self.assertIsInstance(pool, FixedSizePool)
+        self.assertEqual(pool.size, 3)
+
+    def test_get_database_from_many_threads(self):
+        databases = []
+
+        def target():
+            databases.append(
+                self.registry.get_database(
+                    self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID
+                )
+            )
+
+        threads = [threading.Thread(target=target) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(database) for database in databases}), 1)
+        self.assertEqual(self.registry.stats()["databases_created"], 1)
+
+    def test_get_database_shared_by_aliases(self):
+        default = self.registry.get_database(
+            self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID, alias="default"
+        )
+        secondary = self.registry.get_database(
+            self.PROJECT,
+            self.INSTANCE_ID,
+            self.DATABASE_ID,
+            alias="secondary",
+            max_sessions=2,
+        )
+        shared = self.registry.get_database(
+            self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID
+        )
+        self.assertIsNot(default, secondary)
+        self.assertIs(default.shared_database, shared)
+        self.assertIs(secondary.shared_database, shared)
+        self.assertIsInstance(secondary._pool, AliasPool)
+        self.assertIs(secondary._pool._pool, shared._pool)
+        self.assertEqual(secondary._pool.max_sessions, 2)
+        self.assertIs(secondary.spanner_api, shared.spanner_api)
+        self.assertIs(
+            self.registry.get_database(
+                self.PROJECT,
+                self.INSTANCE_ID,
+                self.DATABASE_ID,
+                alias="secondary",
+                max_sessions=2,
+            ),
+            secondary,
+        )
+        stats = self.registry.stats()
+        self.assertEqual(stats["databases_created"], 1)
+        self.assertEqual(stats["channels_created"], 1)
+
+    def test_get_database_conflicting_pool_options(self):
+        self.registry.get_database(
+            self.PROJECT,
+            self.INSTANCE_ID,
+            self.DATABASE_ID,
+            pool_options={"pool_size": 5},
+            alias="default",
+        )
+        with self.assertRaisesRegex(ImproperlyConfigured, "'secondary'"):
+            self.registry.get_database(
+                self.PROJECT,
+                self.INSTANCE_ID,
+                self.DATABASE_ID,
+                pool_options={"pool_size": 10},
+                alias="secondary",
+            )
+
+    def test_get_database_max_sessions_without_alias(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.registry.get_database(
+                self.PROJECT,
+                self.INSTANCE_ID,
+                self.DATABASE_ID,
+                max_sessions=1,
+            )
+
+    def test_clear(self):
+        self.registry.get_database(
+            self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID
+        )
+        self.registry.clear()
+        self.assertEqual(self.registry.stats()["databases_created"], 0)
+        self.registry.get_database(
+            self.PROJECT, self.INSTANCE_ID, self.DATABASE_ID
+        )
+        self.assertEqual(self.registry.stats()["clients_created"], 1)
@@ -0,0 +1,92 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import unittest
+from unittest import mock
+
+from django_spanner.routers import ReadReplicaRouter
+from tests.unit.django_spanner.models import Item
+
+
+def _instance(db):
+    instance = Item()
+    instance._state.db = db
+    return instance
+
+
+class TestReadReplicaRouter(unittest.TestCase):
+    SETTINGS = {
+        "default": {"ENGINE": "django_spanner", "OPTIONS": {}},
+        "replica": {
+            "ENGINE": "django_spanner",
+            "OPTIONS": {"read_only": True, "staleness": {"max": 15}},
+        },
+        "other": {"ENGINE": "django_spanner", "OPTIONS": {}},
+        "other_replica": {
+            "ENGINE": "django_spanner",
+            "OPTIONS": {"read_only": True, "primary": "other"},
+        },
+        "sqlite": {"ENGINE": "django.db.backends.sqlite3"},
+    }
+
+    def setUp(self):
+        patcher = mock.patch("django_spanner.routers.connections")
+        self.connections = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connections.settings = self.SETTINGS
+        self.connections.__getitem__.return_value.in_atomic_block = False
+        self.router = ReadReplicaRouter()
+
+    def test_replicas(self):
+        self.assertEqual(
+            self.router.replicas,
+            {"default": ["replica"], "other": ["other_replica"]},
+        )
+
+    def test_db_for_read(self):
+        self.assertEqual(self.router.db_for_read(Item), "replica")
+        self.assertEqual(
+            self.router.db_for_read(Item, instance=_instance("other")),
+            "other_replica",
+        )
+        self.assertEqual(
+            self.router.db_for_read(Item, instance=_instance("replica")),
+            "replica",
+        )
+        self.assertIsNone(
+            self.router.db_for_read(Item, instance=_instance("sqlite"))
+        )
+
+    def test_db_for_read_in_transaction(self):
+        self.connections.__getitem__.return_value.in_atomic_block = True
+        self.assertIsNone(self.router.db_for_read(Item))
+
+    def test_db_for_write(self):
+        self.assertIsNone(self.router.db_for_write(Item))
+        self.assertEqual(
+            self.router.db_for_write(Item, instance=_instance("replica")),
+            "default",
+        )
+        self.assertEqual(
+            self.router.db_for_write(Item, instance=_instance("other")),
+            "other",
+        )
+
+    def test_allow_relation(self):
+        self.assertTrue(
+            self.router.allow_relation(
+                _instance("default"), _instance("replica")
+            )
+        )
+        self.assertIsNone(
+            self.router.allow_relation(
+                _instance("default"), _instance("other_replica")
+            )
+        )
+
+    def test_allow_migrate(self):
+        self.assertFalse(self.router.allow_migrate("replica", "tests"))
+        self.assertIsNone(self.router.allow_migrate("default", "tests"))
@@ -8,9 +8,12 @@
 from .models import Author
 from django.db import NotSupportedError, connection, connections
 from django.db.models import Index
-from django.db.models.fields import AutoField, IntegerField
+from django.db.models import JSONField
+from django.db.models.fields import AutoField, CharField, IntegerField
 from django_spanner import gen_rand_int64
 from django_spanner.schema import DatabaseSchemaEditor
+from decimal import Decimal
+from google.cloud.spanner_dbapi.types import DateStr, TimestampStr
 from tests._helpers import HAS_OPENTELEMETRY_INSTALLED
 from tests.unit.django_spanner.simple_test import SpannerSimpleTestClass
 from unittest import mock
@@ -40,10 +43,34 @@ class TestUtils(SpannerSimpleTestClass):
 
     def test_skip_default(self):
         """
-        Tries skipping default as Cloud spanner doesn't support it.
+        Tries skipping defaults which can't be column defaults.
         """
         schema_editor = DatabaseSchemaEditor(self.connection)
-        self.assertTrue(schema_editor.skip_default(field=None))
+        self.assertFalse(schema_editor.skip_default(IntegerField(default=1)))
+        self.assertTrue(schema_editor.skip_default(IntegerField(null=True)))
+        self.assertTrue(schema_editor.skip_default(JSONField(default=dict)))
+
+    def test_prepare_default(self):
+        """
+        Tries the literals of default values.
+        """
+        schema_editor = DatabaseSchemaEditor(self.connection)
+        for value, literal in (
+            (True, "TRUE"),
+            (10, "10"),
+            (1.5, "1.5"),
+            (float("inf"), None),
+            (Decimal("1.50"), "NUMERIC '1.50'"),
+            (DateStr("2026-10-17"), "DATE '2026-10-17'"),
+            (
+                TimestampStr("2026-10-17T00:00:00.000000Z"),
+                "TIMESTAMP '2026-10-17T00:00:00.000000Z'",
+            ),
+            ("it's\n", "'it\\'s\\n'"),
+            (b"bytes", None),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(schema_editor.prepare_default(value), literal)
 
     def test_create_model(self):
         """
@@ -148,8 +175,120 @@ class TestUtils(SpannerSimpleTestClass):
             schema_editor.add_field(Author, new_field)
 
             schema_editor.execute.assert_called_once_with(
-                "ALTER TABLE tests_author ADD COLUMN age INT64", []
+                "ALTER TABLE tests_author ADD COLUMN age INT64",
+                [],
+                run_backfills=False,
+            )
+
+    def test_add_field_default(self):
+        """
+        Tests adding a field with a default as a column default
+        """
+        with mock.patch.object(
+            self.connection, "execute_partitioned_dml"
+        ) as execute_partitioned_dml:
+            with DatabaseSchemaEditor(self.connection) as schema_editor:
+                schema_editor.execute = mock.MagicMock()
+                new_field = IntegerField(default=10)
+                new_field.set_attributes_from_name("age")
+                schema_editor.add_field(Author, new_field)
+
+        execute_partitioned_dml.assert_not_called()
+        self.assertEqual(
+            schema_editor.execute.call_args_list,
+            [
+                mock.call(
+                    "ALTER TABLE tests_author ADD COLUMN age INT64 NOT NULL "
+                    "DEFAULT (10)",
+                    [],
+                    run_backfills=False,
+                ),
+                mock.call(
+                    "ALTER TABLE tests_author ALTER COLUMN age DROP DEFAULT",
+                    [],
+                ),
+            ],
+        )
+
+    def test_add_field_backfill(self):
+        """
+        Tests backfilling a field added with a default by Partitioned DML
+        """
+        with mock.patch.object(
+            self.connection, "execute_partitioned_dml", return_value=3
+        ) as execute_partitioned_dml:
+            with DatabaseSchemaEditor(self.connection) as schema_editor:
+                schema_editor.execute = mock.MagicMock()
+                new_field = JSONField(default=dict)
+                new_field.set_attributes_from_name("data")
+                with self.assertLogs("django_spanner.schema", "INFO") as logs:
+                    schema_editor.add_field(Author, new_field)
+
+        execute_partitioned_dml.assert_called_once_with(
+            "UPDATE tests_author SET data=%s", (mock.ANY,)
+        )
+        self.assertEqual(
+            schema_editor.execute.call_args_list,
+            [
+                mock.call(
+                    "ALTER TABLE tests_author ADD COLUMN data JSON",
+                    [],
+                    run_backfills=False,
+                ),
+                mock.call(
+                    "ALTER TABLE tests_author ALTER COLUMN data JSON NOT NULL"
+                ),
+            ],
+        )
+        self.assertIn("at least 3 rows of tests_author.data", logs.output[1])
+
+    def test_add_field_parallel_backfills(self):
+        """
+        Tests backfilling the fields added by a migration in parallel
+        """
+        with mock.patch.dict(
+            self.connection.settings_dict["OPTIONS"], backfill_parallelism=2
+        ), mock.patch.object(
+            self.connection, "connection"
+        ) as dbapi_connection, mock.patch.object(
+            DatabaseSchemaEditor, "_backfill_in_thread"
+        ) as backfill:
+            dbapi_connection.pending_ddl_statements = 0
+            with DatabaseSchemaEditor(self.connection) as schema_editor:
+                schema_editor.execute = mock.MagicMock()
+                for name in ("age", "rank"):
+                    new_field = JSONField(default=dict)
+                    new_field.set_attributes_from_name(name)
+                    schema_editor.add_field(Author, new_field)
+                backfill.assert_not_called()
+
+        self.assertEqual(
+            sorted(call[0][1] for call in backfill.call_args_list),
+            ["age", "rank"],
+        )
+        dbapi_connection.run_prior_DDL_statements.assert_called_once_with()
+
+    def test_execute_runs_pending_backfills(self):
+        """
+        Tests running the pending backfills before other statements
+        """
+        with mock.patch(
+            "django.db.backends.base.schema.BaseDatabaseSchemaEditor.execute"
+        ) as execute, mock.patch.object(
+            DatabaseSchemaEditor, "run_pending_backfills"
+        ) as run_pending_backfills:
+            schema_editor = DatabaseSchemaEditor(self.connection)
+            schema_editor._pending_backfills = [mock.Mock()]
+            schema_editor.execute(
+                "ALTER TABLE tests_author ADD COLUMN age INT64",
+                run_backfills=False,
+            )
+            run_pending_backfills.assert_not_called()
+            schema_editor.execute(
+                "UPDATE tests_author SET name = ' ADD COLUMN '"
             )
+            run_pending_backfills.assert_called_once_with()
+        self.assertEqual(execute.call_count, 2)
 
     def test_remove_field(self):
         """
@@ -253,6 +392,19 @@ class TestUtils(SpannerSimpleTestClass):
             self.assertEqual(sql, "INT64")
             self.assertEqual(params, [])
 
+    def test_column_sql_default(self):
+        """
+        Tests column sql with the default of the field
+        """
+        with DatabaseSchemaEditor(self.connection) as schema_editor:
+            new_field = CharField(max_length=10, default="it's")
+            new_field.set_attributes_from_name("name")
+            sql, params = schema_editor.column_sql(
+                Author, new_field, include_default=True
+            )
+            self.assertEqual(sql, "STRING(10) NOT NULL DEFAULT ('it\\'s')")
+            self.assertEqual(params, [])
+
     def test_column_add_index(self):
         """
         Tests column add index
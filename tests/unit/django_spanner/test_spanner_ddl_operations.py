@@ -0,0 +1,80 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import io
+import unittest
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+
+COMMAND = "django_spanner.management.commands.spanner_ddl_operations"
+
+
+class TestSpannerDdlOperations(unittest.TestCase):
+    def _call(self, operations, **options):
+        stdout = io.StringIO()
+        with mock.patch(
+            "django_spanner.base.DatabaseWrapper._get_database",
+            return_value=(mock.Mock(), {}),
+        ), mock.patch(
+            COMMAND + ".running_ddl_operations", return_value=operations
+        ):
+            call_command(
+                "spanner_ddl_operations",
+                database="secondary",
+                stdout=stdout,
+                **options
+            )
+        return stdout.getvalue()
+
+    def _operation(self):
+        operation = mock.Mock()
+        operation.operation.name = "operations/1"
+        metadata = operation.metadata
+        metadata.statements = [
+            "CREATE INDEX a ON t (a)",
+            "CREATE INDEX b ON t (b)",
+            "CREATE INDEX c ON t (c)",
+        ]
+        metadata.commit_timestamps = [mock.Mock()]
+        metadata.progress = [
+            mock.Mock(progress_percent=100),
+            mock.Mock(progress_percent=42),
+        ]
+        return operation
+
+    def test_progress(self):
+        operation = self._operation()
+        output = self._call([operation])
+        self.assertEqual(
+            output.splitlines(),
+            [
+                "Operation operations/1:",
+                "  [done] CREATE INDEX a ON t (a)",
+                "  [42%] CREATE INDEX b ON t (b)",
+                "  [waiting] CREATE INDEX c ON t (c)",
+            ],
+        )
+        operation.result.assert_not_called()
+
+    def test_wait(self):
+        operation = self._operation()
+        output = self._call([operation], wait=True)
+        operation.result.assert_called_once_with()
+        self.assertIn("Operation operations/1 is done.", output)
+
+    def test_wait_failed(self):
+        operation = self._operation()
+        operation.result.side_effect = RuntimeError("Duplicate key")
+        with self.assertRaisesRegex(CommandError, "Duplicate key"):
+            self._call([operation], wait=True)
+
+    def test_nothing_running(self):
+        self.assertEqual(self._call([]), "No schema changes are running.\n")
+
+    def test_not_spanner(self):
+        with self.assertRaisesRegex(CommandError, "Cloud Spanner"):
+            call_command("spanner_ddl_operations", database="other")
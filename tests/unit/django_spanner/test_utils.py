@@ -6,7 +6,8 @@
 
 from django_spanner.utils import check_django_compatability
 from django.core.exceptions import ImproperlyConfigured
-from django_spanner.utils import add_dummy_where
+from django_spanner.utils import add_dummy_where, parse_staleness
+import datetime
 import django
 import django_spanner
 from tests.unit.django_spanner.simple_test import SpannerSimpleTestClass
@@ -50,3 +51,33 @@ class TestUtils(SpannerSimpleTestClass):
         """
         updated_sql = add_dummy_where(self.SQL_WITHOUT_WHERE)
         self.assertEqual(updated_sql, self.SQL_WITH_WHERE)
+
+    def test_parse_staleness_seconds(self):
+        self.assertEqual(
+            parse_staleness({"max_staleness": 15}),
+            {"max_staleness": datetime.timedelta(seconds=15)},
+        )
+
+    def test_parse_staleness_short_name(self):
+        self.assertEqual(
+            parse_staleness({"exact": 15}),
+            {"exact_staleness": datetime.timedelta(seconds=15)},
+        )
+
+    def test_parse_staleness_timestamp(self):
+        timestamp = datetime.datetime(2026, 1, 1)
+        self.assertEqual(
+            parse_staleness({"read_timestamp": timestamp}),
+            {"read_timestamp": timestamp},
+        )
+
+    def test_parse_staleness_invalid(self):
+        for staleness in (
+            {},
+            {"max_staleness": 15, "exact_staleness": 15},
+            {"staleness": 15},
+            {"read_timestamp": 15},
+            {"exact_staleness": "15"},
+        ):
+            with self.assertRaises(ValueError):
+                parse_staleness(staleness)
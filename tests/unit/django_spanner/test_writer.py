@@ -0,0 +1,105 @@
+# Copyright 2026 Google LLC
+#
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file or at
+# https://developers.google.com/open-source/licenses/bsd
+
+import datetime
+import queue
+import unittest
+from unittest import mock
+
+from django_spanner.writer import BackgroundWriter
+from tests.unit.django_spanner.models import Author, Item
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    def _make_writer(self, **kwargs):
+        writer = BackgroundWriter(**kwargs)
+        writer._database = mock.MagicMock()
+        return writer
+
+    def _item(self, pk):
+        return Item(
+            id=pk,
+            item_id=pk,
+            name="item",
+            created=datetime.datetime(
+                2026, 1, 1, tzinfo=datetime.timezone.utc
+            ),
+        )
+
+    def test_write_commits_batches(self):
+        writer = self._make_writer(workers=1, max_delay=0.05)
+        with writer:
+            writer.write_many([self._item(1), self._item(2)])
+            writer.write(self._item(3), method="insert_or_update")
+        batch = writer._database.batch.return_value.__enter__.return_value
+        rows = [
+            row[0]
+            for call in batch.insert.call_args_list
+            + batch.insert_or_update.call_args_list
+            for row in call[0][2]
+        ]
+        self.assertEqual(sorted(rows), [1, 2, 3])
+        stats = writer.stats()
+        self.assertEqual(stats["rows"], 3)
+        self.assertEqual(stats["errors"], 0)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertIsNotNone(stats["max_commit_latency"])
+        self.assertFalse(writer._threads)
+
+    def test_batch_counts_index_mutations(self):
+        # A row of Author writes 6 columns and the index of the unique num.
+        writer = self._make_writer(workers=1, max_delay=0.05)
+        authors = [
+            Author(
+                id=pk,
+                name="name",
+                last_name="last name",
+                num=pk,
+                created=datetime.datetime(
+                    2026, 1, 1, tzinfo=datetime.timezone.utc
+                ),
+            )
+            for pk in range(3)
+        ]
+        with mock.patch("django_spanner.writer.MAX_MUTATIONS", 13):
+            with writer:
+                writer.write_many(authors)
+        stats = writer.stats()
+        self.assertEqual(stats["rows"], 3)
+        self.assertEqual(stats["batches"], 3)
+        self.assertEqual(stats["max_batch_rows"], 1)
+
+    def test_failed_batch(self):
+        on_error = mock.Mock()
+        writer = self._make_writer(workers=1, on_error=on_error)
+        error = RuntimeError("commit failed")
+        writer._database.batch.return_value.__exit__.side_effect = error
+        with writer:
+            writer.write(self._item(1))
+        self.assertEqual(writer.stats()["errors"], 1)
+        self.assertEqual(writer.stats()["rows"], 0)
+        on_error.assert_called_once()
+        self.assertIs(on_error.call_args[0][0], error)
+
+    def test_full_queue(self):
+        writer = self._make_writer(workers=0, max_queue=1)
+        writer.write(self._item(1))
+        with self.assertRaises(queue.Full):
+            writer.write(self._item(2), timeout=0.01)
+        self.assertEqual(writer.stats()["blocked_writes"], 1)
+        self.assertEqual(writer.stats()["queue_depth"], 1)
+        writer.close()
+
+    def test_closed(self):
+        writer = self._make_writer(workers=0)
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.write(self._item(1))
+
+    def test_unknown_method(self):
+        writer = self._make_writer()
+        with self.assertRaises(ValueError):
+            writer.write(self._item(1), method="delete")